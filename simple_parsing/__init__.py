@@ -27,7 +27,7 @@ from .parsing import (
     parse,
     parse_known_args,
 )
-from .replace import replace, replace_subgroups
+from .replace import replace, replace_many, replace_subgroups
 from .utils import InconsistentArgumentError
 
 __all__ = [
@@ -50,6 +50,7 @@ __all__ = [
     "ParsingError",
     "Partial",
     "replace",
+    "replace_many",
     "replace_subgroups",
     "Serializable",
     "SimpleHelpFormatter",
@@ -172,3 +172,39 @@ class BooleanOptionalAction(argparse.Action):
 
     def format_usage(self):
         return " | ".join(self.option_strings)
+
+
+class HelpSearchAction(argparse.Action):
+    """Prints the help for only the argument groups matching a search term, then exits.
+
+    The parser is expected to be a `simple_parsing.ArgumentParser`, whose `print_help` method
+    accepts a `help_filter` argument.
+    """
+
+    def __init__(
+        self,
+        option_strings: Sequence[str],
+        dest: str = argparse.SUPPRESS,
+        default: Any = argparse.SUPPRESS,
+        metavar: str | None = "TERM",
+        help: str | None = None,
+    ):
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=default,
+            nargs=1,
+            metavar=metavar,
+            help=help,
+        )
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: str | None = None,
+    ):
+        (help_filter,) = values
+        parser.print_help(help_filter=help_filter)  # type: ignore[call-arg]
+        parser.exit()
@@ -1,10 +1,14 @@
 import dataclasses
+import functools
 import warnings
+import weakref
 from logging import getLogger
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
 
 logger = getLogger(__name__)
 
+_MISSING = object()
+
 
 class FlattenedAccess:
     """Allows flattened access to the attributes of all children dataclasses.
@@ -65,32 +69,19 @@ class FlattenedAccess:
         NOTE: `__getattribute__` is always called before `__getattr__`, hence we
         always get here because `self` does not have an attribute of `name`.
         """
-        # potential parents and corresponding values.
-        parents: List[str] = []
-        values: List[Any] = []
-
-        for attr_name, attr_value in FlattenedAccess.attributes(self):
-            # if the attribute name's last part ends with `name`, we add it to
-            # some list of potential parent attributes.
-            name_parts = name.split(".")
-            dest_parts = attr_name.split(".")
-            if dest_parts[-len(name_parts) :] == name_parts:
-                parents.append(attr_name)
-                values.append(attr_value)
+        found = _lookup(self, name)
+        if found is not None:
+            parent, attr_name = found
+            return parent.__dict__[attr_name]
 
+        parents, values = _search(self, name)
         if not parents:
             raise AttributeError(
                 f"{type(self)} object has no attribute '{name}', "
                 "and neither does any of its children attributes."
             )
         elif len(parents) > 1:
-            raise AttributeError(
-                f"Ambiguous Attribute access: name '{name}' may refer to:\n"
-                + "\n".join(
-                    f"- '{parent}' (with a value of: '{value}')"
-                    for parent, value in zip(parents, values)
-                )
-            )
+            raise _ambiguous_attribute_error(name, parents, values)
         else:
             return values[0]
 
@@ -100,24 +91,17 @@ class FlattenedAccess:
         If more than one child has attributes that match the given one, an `AttributeError` is
         raised.
         """
-        # potential parents and corresponding values.
-        parents: List[str] = []
-        values: List[Any] = []
-
-        field_names = {field.name for field in dataclasses.fields(self)}
-        if name in field_names:
-            object.__setattr__(self, name, value)
+        if name in _field_names(type(self)):
+            _set(self, name, value)
             return
 
-        for attr_name, attr_value in self.attributes():
-            # if the attribute name of the attribute ends with `name`, we add it
-            # to some list of potential parent attributes.
-            name_parts = name.split(".")
-            dest_parts = attr_name.split(".")
-            if dest_parts[-len(name_parts) :] == name_parts:
-                parents.append(attr_name)
-                values.append(attr_value)
+        found = _lookup(self, name)
+        if found is not None:
+            parent, attr_name = found
+            _set(parent, attr_name, value)
+            return
 
+        parents, values = _search(self, name)
         if not parents:
             # We set the value on the dataclass directly, since it wasn't found.
             warnings.warn(
@@ -132,13 +116,7 @@ class FlattenedAccess:
 
         elif len(parents) > 1:
             # more than one parent (ambiguous).
-            raise AttributeError(
-                f"Ambiguous Attribute access: name '{name}' may refer to:\n"
-                + "\n".join(
-                    f"- '{parent}' (with a value of: '{value}')"
-                    for parent, value in zip(parents, values)
-                )
-            )
+            raise _ambiguous_attribute_error(name, parents, values)
         else:
             # We recursively set the attribute.
             attr_name = parents[0]
@@ -150,7 +128,42 @@ class FlattenedAccess:
             # destination attribute name
             dest_name = name.split(".")[-1]
             # Set the attribute on the parent.
-            object.__setattr__(parent, dest_name, value)
+            _set(parent, dest_name, value)
+
+    def get_many(self, *names: str) -> Tuple[Any, ...]:
+        """Returns the values of the (possibly nested) attributes with the given names.
+
+        >>> from dataclasses import dataclass, field
+        >>> @dataclass
+        ... class Optimizer:
+        ...     lr: float = 0.1
+        >>> @dataclass
+        ... class Config(FlattenedAccess):
+        ...     optimizer: Optimizer = field(default_factory=Optimizer)
+        ...     batch_size: int = 32
+        >>> Config().get_many("lr", "batch_size")
+        (0.1, 32)
+        """
+        return tuple(getattr(self, name) for name in names)
+
+    def set_many(self, values: Dict[str, Any]) -> None:
+        """Sets the values of the (possibly nested) attributes, given a dict of names to values.
+
+        >>> from dataclasses import dataclass, field
+        >>> @dataclass
+        ... class Optimizer:
+        ...     lr: float = 0.1
+        >>> @dataclass
+        ... class Config(FlattenedAccess):
+        ...     optimizer: Optimizer = field(default_factory=Optimizer)
+        ...     batch_size: int = 32
+        >>> config = Config()
+        >>> config.set_many({"optimizer.lr": 0.01, "batch_size": 64})
+        >>> config
+        Config(optimizer=Optimizer(lr=0.01), batch_size=64)
+        """
+        for name, value in values.items():
+            setattr(self, name, value)
 
     def __getitem__(self, key):
         return getattr(self, key)
@@ -160,3 +173,160 @@ class FlattenedAccess:
 
     def asdict(self) -> Dict:
         return dataclasses.asdict(self)
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(dataclass_type: type) -> FrozenSet[str]:
+    return frozenset(f.name for f in dataclasses.fields(dataclass_type))
+
+
+class _SuffixIndex(NamedTuple):
+    """Index from each leaf name and dotted suffix to the attribute paths that end with it."""
+
+    paths: Dict[str, List[Tuple[str, ...]]]
+
+
+# The suffix indices of each FlattenedAccess subclass, for each structure of its instances (the
+# types of all their nested dataclass values, see `_structure`).
+_suffix_indices: "weakref.WeakKeyDictionary[type, Dict[Tuple, _SuffixIndex]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Name of the (non-field) attribute where each instance caches its suffix index, along with the
+# value of `_structure_version` when it was cached.
+_CACHED_INDEX_ATTRIBUTE = "_flattened_access_index"
+
+# Incremented whenever a FlattenedAccess sets an attribute whose old or new value is a dataclass,
+# which might change the structure of the instances that contain it. This invalidates the suffix
+# indices cached by all the instances.
+# NOTE: Nested dataclasses that aren't FlattenedAccess don't do this, so replacing a dataclass
+# value directly on them isn't detected.
+_structure_version = 0
+
+
+def _set(obj: Any, name: str, value: Any) -> None:
+    global _structure_version
+    old_value = obj.__dict__.get(name)
+    if _is_dataclass_instance(value) or _is_dataclass_instance(old_value):
+        _structure_version += 1
+    object.__setattr__(obj, name, value)
+
+
+def _is_dataclass_instance(value: Any) -> bool:
+    return dataclasses.is_dataclass(value) and not isinstance(value, type)
+
+
+@functools.lru_cache(maxsize=None)
+def _ordered_field_names(dataclass_type: type) -> Tuple[str, ...]:
+    return tuple(f.name for f in dataclasses.fields(dataclass_type))
+
+
+def _structure(obj: Any) -> Optional[Tuple]:
+    """Returns the types of the nested dataclass values of `obj` (None for other values).
+
+    Two instances with the same structure have the same attribute paths, so they can share an
+    index. Returns None if a field of a (nested) dataclass isn't set.
+    """
+    structure: List[Optional[type]] = []
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        attributes = value.__dict__
+        for name in _ordered_field_names(type(value)):
+            field_value = attributes.get(name, _MISSING)
+            if field_value is _MISSING:
+                # The dataclass isn't fully instantiated yet, or the attribute was deleted.
+                return None
+            if _is_dataclass_instance(field_value):
+                structure.append(type(field_value))
+                stack.append(field_value)
+            else:
+                structure.append(None)
+    return tuple(structure)
+
+
+def _get_suffix_index(obj: FlattenedAccess) -> Optional[_SuffixIndex]:
+    cached = obj.__dict__.get(_CACHED_INDEX_ATTRIBUTE)
+    if cached is not None and cached[0] == _structure_version:
+        return cached[1]
+    version = _structure_version
+    structure = _structure(obj)
+    if structure is None:
+        return None
+    indices = _suffix_indices.setdefault(type(obj), {})
+    index = indices.get(structure)
+    if index is None:
+        index = indices[structure] = _build_suffix_index(obj)
+    object.__setattr__(obj, _CACHED_INDEX_ATTRIBUTE, (version, index))
+    return index
+
+
+def _build_suffix_index(obj: FlattenedAccess) -> _SuffixIndex:
+    paths: Dict[str, List[Tuple[str, ...]]] = {}
+
+    def _add_paths(value: Any, path: Tuple[str, ...]) -> None:
+        for name in _ordered_field_names(type(value)):
+            field_path = path + (name,)
+            for i in range(len(field_path)):
+                paths.setdefault(".".join(field_path[i:]), []).append(field_path)
+            field_value = value.__dict__[name]
+            if _is_dataclass_instance(field_value):
+                _add_paths(field_value, field_path)
+
+    _add_paths(obj, ())
+    return _SuffixIndex(paths=paths)
+
+
+def _lookup(obj: FlattenedAccess, name: str) -> Optional[Tuple[Any, str]]:
+    """Returns the parent and attribute name of the unique attribute matching `name`, if any.
+
+    Returns None when the attribute isn't found in the index of the structure of `obj`, or is
+    ambiguous. The caller should then fall back to `_search`, which raises the right error.
+    The index is cached on `obj` until the structure of a FlattenedAccess instance changes (see
+    `_structure_version`), so this doesn't depend on the number of nested fields.
+    """
+    index = _get_suffix_index(obj)
+    if index is None:
+        return None
+    matches = index.paths.get(name)
+    if matches is None or len(matches) != 1:
+        return None
+    path = matches[0]
+    parent: Any = obj
+    for parent_name in path[:-1]:
+        parent = parent.__dict__.get(parent_name)
+        if not _is_dataclass_instance(parent):
+            # The structure changed without going through a FlattenedAccess (e.g. a deleted
+            # attribute).
+            return None
+    if path[-1] not in parent.__dict__:
+        return None
+    return parent, path[-1]
+
+
+def _search(obj: FlattenedAccess, name: str) -> Tuple[List[str], List[Any]]:
+    """Returns the names and values of all the attributes of `obj` whose name ends with `name`.
+
+    This enumerates all the (nested) attributes, so it is only used when `_lookup` can't be used.
+    """
+    # potential parents and corresponding values.
+    parents: List[str] = []
+    values: List[Any] = []
+    name_parts = name.split(".")
+    for attr_name, attr_value in FlattenedAccess.attributes(obj):
+        # if the attribute name's last part ends with `name`, we add it to
+        # some list of potential parent attributes.
+        dest_parts = attr_name.split(".")
+        if dest_parts[-len(name_parts) :] == name_parts:
+            parents.append(attr_name)
+            values.append(attr_value)
+    return parents, values
+
+
+def _ambiguous_attribute_error(name: str, parents: List[str], values: List[Any]) -> AttributeError:
+    return AttributeError(
+        f"Ambiguous Attribute access: name '{name}' may refer to:\n"
+        + "\n".join(
+            f"- '{parent}' (with a value of: '{value}')" for parent, value in zip(parents, values)
+        )
+    )
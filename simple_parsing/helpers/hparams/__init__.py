@@ -1,6 +1,10 @@
+from .deduplication import UniqueSampler
+from .history import TrialHistory
 from .hparam import categorical, hparam, log_uniform, loguniform, uniform
 from .hyperparameters import HP, HyperParameters, Point
 from .priors import LogUniformPrior, UniformPrior
+from .search_space import SearchSpace
+from .store import Trial, TrialStore
 
 __all__ = [
     "categorical",
@@ -12,5 +16,10 @@ __all__ = [
     "HyperParameters",
     "Point",
     "LogUniformPrior",
+    "SearchSpace",
+    "Trial",
+    "TrialHistory",
+    "TrialStore",
     "UniformPrior",
+    "UniqueSampler",
 ]
@@ -0,0 +1,235 @@
+"""Sampling of `HyperParameters` that never returns the same configuration twice.
+
+The configurations that were already sampled are tracked with their canonical fingerprints (see
+`simple_parsing.helpers.serialization.fingerprint`), stored as 64-bit integers in a set. When a
+path is given, the fingerprints are also appended to a file (8 bytes each), which makes it
+possible to resume sampling later, or to share the set of sampled configurations between
+processes (e.g. multiple workers, each using a different `stream`).
+"""
+from __future__ import annotations
+
+import contextlib
+import math
+from logging import getLogger
+from pathlib import Path
+from typing import Generic, Iterator
+
+from simple_parsing.helpers.serialization.fingerprint import fingerprint
+
+from . import sampling
+from .hyperparameters import HP
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore
+
+logger = getLogger(__name__)
+
+_FINGERPRINT_SIZE = 8
+"""Number of bytes of the fingerprint stored for each configuration."""
+
+_MAX_CANDIDATES = 100_000
+"""Maximum number of candidates sampled at once."""
+
+
+class UniqueSampler(Generic[HP]):
+    """Samples configurations of a `HyperParameters` class, without ever repeating one.
+
+    The candidates come from `HyperParameters.sample_batch`, so they are reproducible given the
+    `seed` and `stream`, and the duplicates are rejected. For finite spaces (see `space_size`),
+    the number of configurations that are left is given by `remaining`.
+
+    When `path` is set, the fingerprints of the sampled configurations are persisted in that file,
+    and the fingerprints already in it (e.g. from a previous run, or from other processes sampling
+    concurrently) are also excluded. The file is locked while it is being updated, where `fcntl`
+    is available.
+
+    >>> from dataclasses import dataclass
+    >>> from simple_parsing.helpers.hparams import HyperParameters, categorical, uniform
+    >>> @dataclass
+    ... class Config(HyperParameters):
+    ...     layers: int = uniform(1, 3, discrete=True)
+    ...     optimizer: str = categorical("sgd", "adam")
+    >>> sampler = UniqueSampler(Config, seed=123)
+    >>> sampler.space_size
+    6
+    >>> configs = sampler.sample_batch(4)
+    >>> len(set(config.id() for config in configs)), sampler.remaining
+    (4, 2)
+    """
+
+    def __init__(
+        self,
+        hparams_type: type[HP],
+        path: str | Path | None = None,
+        seed: int | None = None,
+        stream: int = 0,
+        max_attempts: int = 100,
+    ):
+        """
+        Parameters
+        ----------
+        hparams_type : type[HP]
+            The type of HyperParameters to sample.
+        path : str | Path, optional
+            A file where the fingerprints of the sampled configurations are stored.
+        seed : int, optional
+            The seed of the random streams. A random seed is used by default.
+        stream : int, optional
+            The index of the random stream (e.g. one per worker), by default 0.
+        max_attempts : int, optional
+            The number of consecutive batches of candidates without any new configuration after
+            which sampling fails, by default 100.
+        """
+        self.hparams_type = hparams_type
+        self.path = Path(path) if path is not None else None
+        self.seed = seed if seed is not None else sampling.random_entropy()
+        self.stream = stream
+        self.max_attempts = max_attempts
+        self.space_size: int | None = sampling.space_size(hparams_type)
+        """The number of distinct configurations, or None if the space is infinite."""
+        # The index of the next candidate in the random stream.
+        self.position = 0
+        self._seen: set[int] = set()
+        # Number of bytes of the file that were already read.
+        self._offset = 0
+        if self.path is not None:
+            with self._open() as file:
+                self._sync(file)
+
+    @property
+    def remaining(self) -> int | None:
+        """The number of configurations that were never sampled, or None for infinite spaces."""
+        if self.space_size is None:
+            return None
+        return max(self.space_size - len(self._seen), 0)
+
+    def __len__(self) -> int:
+        """Returns the number of configurations that were sampled (or added)."""
+        return len(self._seen)
+
+    def __contains__(self, hparams: HP) -> bool:
+        return _key(hparams) in self._seen
+
+    def add(self, hparams: HP) -> bool:
+        """Marks a configuration as seen, so it isn't sampled. Returns False if it already was."""
+        return bool(self._add_new([hparams]))
+
+    def sample(self) -> HP:
+        """Samples a configuration that wasn't sampled before."""
+        return self.sample_batch(1)[0]
+
+    def sample_batch(self, n: int) -> list[HP]:
+        """Samples `n` distinct configurations that weren't sampled before.
+
+        Raises a ValueError if there are fewer than `n` configurations left, and a RuntimeError if
+        no new configurations are found after `max_attempts` consecutive batches of candidates.
+        """
+        results: list[HP] = []
+        with self._open() as file:
+            if file is not None:
+                self._sync(file)
+            remaining = self.remaining
+            if remaining is not None and n > remaining:
+                raise ValueError(
+                    f"Can't sample {n} new configurations of {self.hparams_type.__qualname__}: "
+                    f"only {remaining} out of {self.space_size} are left."
+                )
+            # NOTE: The new keys are only marked as seen once the whole batch was sampled, so that
+            # the configurations aren't lost if sampling fails.
+            new_keys: dict[int, None] = {}
+            failed_attempts = 0
+            while len(results) < n:
+                num_candidates = self._num_candidates(n - len(results), pending=len(new_keys))
+                candidates = self.hparams_type.sample_batch(
+                    num_candidates, seed=self.seed, stream=self.stream, start=self.position
+                )
+                self.position += num_candidates
+                found = 0
+                for candidate in candidates:
+                    key = _key(candidate)
+                    if key in self._seen or key in new_keys:
+                        continue
+                    new_keys[key] = None
+                    results.append(candidate)
+                    found += 1
+                    if len(results) == n:
+                        break
+                failed_attempts = 0 if found else failed_attempts + 1
+                if failed_attempts >= self.max_attempts:
+                    raise RuntimeError(
+                        f"Couldn't find a new configuration of {self.hparams_type.__qualname__} "
+                        f"after {self.max_attempts} attempts."
+                    )
+            self._seen.update(new_keys)
+            if file is not None:
+                self._write(file, list(new_keys))
+        return results
+
+    def _num_candidates(self, needed: int, pending: int) -> int:
+        # NOTE: In finite spaces, sample more candidates as the space fills up, to compensate for
+        # the expected fraction of duplicates. `pending` new configurations were already found.
+        remaining = self.remaining
+        if remaining is not None:
+            remaining -= pending
+        if not self.space_size or not remaining:
+            return needed
+        return min(max(needed, math.ceil(needed * self.space_size / remaining)), _MAX_CANDIDATES)
+
+    def _add_new(self, hparams: list[HP]) -> list[int]:
+        with self._open() as file:
+            if file is not None:
+                self._sync(file)
+            new_keys = []
+            for hp in hparams:
+                key = _key(hp)
+                if key not in self._seen:
+                    self._seen.add(key)
+                    new_keys.append(key)
+            if file is not None:
+                self._write(file, new_keys)
+        return new_keys
+
+    @contextlib.contextmanager
+    def _open(self) -> Iterator:
+        """Opens (and locks) the file of fingerprints, if there is one."""
+        if self.path is None:
+            yield None
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a+b") as file:
+            if fcntl is not None:
+                fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                yield file
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(file, fcntl.LOCK_UN)
+
+    def _sync(self, file) -> None:
+        """Reads the fingerprints added to the file since it was last read."""
+        file.seek(self._offset)
+        data = file.read()
+        # NOTE: Ignore an incomplete fingerprint at the end of the file (e.g. from an interrupted
+        # write), it will be read when complete.
+        end = len(data) - len(data) % _FINGERPRINT_SIZE
+        self._seen.update(
+            int.from_bytes(data[i : i + _FINGERPRINT_SIZE], "big")
+            for i in range(0, end, _FINGERPRINT_SIZE)
+        )
+        self._offset += end
+
+    def _write(self, file, keys: list[int]) -> None:
+        if not keys:
+            return
+        data = b"".join(key.to_bytes(_FINGERPRINT_SIZE, "big") for key in keys)
+        file.seek(0, 2)
+        file.write(data)
+        file.flush()
+        # NOTE: Assumes that the file only grows through this method, while it is locked.
+        self._offset = file.tell()
+
+
+def _key(hparams: HP) -> int:
+    return int(fingerprint(hparams, size=2 * _FINGERPRINT_SIZE), 16)
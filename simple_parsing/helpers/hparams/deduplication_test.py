@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from .deduplication import UniqueSampler
+from .hparam import categorical, uniform
+from .hyperparameters import HyperParameters
+
+pytest.importorskip("numpy")
+
+
+@dataclass
+class Small(HyperParameters):
+    a: int = uniform(0, 4, discrete=True)
+    b: str = categorical("foo", "bar", "baz")
+
+
+@dataclass
+class Continuous(HyperParameters):
+    a: float = uniform(0.0, 1.0)
+    b: str = categorical("foo", "bar")
+
+
+def test_space_size():
+    assert Small.space_size() == 15
+    assert Continuous.space_size() is None
+    assert UniqueSampler(Continuous).remaining is None
+
+
+def test_never_samples_duplicates():
+    sampler = UniqueSampler(Small, seed=123)
+    samples = [sampler.sample() for _ in range(5)] + sampler.sample_batch(10)
+    assert len({s.id() for s in samples}) == 15
+    assert len(sampler) == 15
+    assert sampler.remaining == 0
+    with pytest.raises(ValueError, match="only 0 out of 15 are left"):
+        sampler.sample()
+
+
+def test_add():
+    sampler = UniqueSampler(Small, seed=123)
+    assert sampler.add(Small(a=1, b="foo"))
+    assert not sampler.add(Small(a=1, b="foo"))
+    assert Small(a=1, b="foo") in sampler
+    assert Small(a=1, b="foo") not in sampler.sample_batch(14)
+
+
+def test_is_reproducible():
+    first = UniqueSampler(Small, seed=123).sample_batch(10)
+    second = UniqueSampler(Small, seed=123).sample_batch(10)
+    assert first == second
+
+
+def test_failed_batch_doesnt_mark_configs_as_seen(tmp_path: Path):
+    @dataclass
+    class Hundred(HyperParameters):
+        a: int = uniform(0, 9, discrete=True)
+        b: int = uniform(0, 9, discrete=True)
+
+    path = tmp_path / "seen.bin"
+    sampler = UniqueSampler(Hundred, path=path, seed=1, max_attempts=1)
+    with pytest.raises(RuntimeError, match="after 1 attempts"):
+        sampler.sample_batch(99)
+    # The configurations that were found before the failure weren't returned, so they are left.
+    assert len(sampler) == 0 and sampler.remaining == 100
+    assert path.stat().st_size == 0
+    sampler.max_attempts = 100
+    assert len({s.id() for s in sampler.sample_batch(99)}) == 99
+    assert sampler.remaining == 1
+
+
+def test_resume_from_file(tmp_path: Path):
+    path = tmp_path / "seen.bin"
+    sampler = UniqueSampler(Small, path=path, seed=1)
+    first = sampler.sample_batch(5)
+    assert path.stat().st_size == 5 * 8
+
+    # A new sampler (e.g. in another process) excludes the configurations in the file.
+    resumed = UniqueSampler(Small, path=path, seed=1)
+    assert len(resumed) == 5 and resumed.remaining == 10
+    second = resumed.sample_batch(10)
+    assert not {s.id() for s in first} & {s.id() for s in second}
+
+    # Samplers sharing a file see the configurations sampled by the others.
+    with pytest.raises(ValueError, match="only 0 out of 15 are left"):
+        sampler.sample()
+
+
+def test_partial_fingerprint_at_end_of_file_is_ignored(tmp_path: Path):
+    path = tmp_path / "seen.bin"
+    UniqueSampler(Small, path=path, seed=1).sample_batch(3)
+    with open(path, "ab") as f:
+        f.write(b"\x00\x01")
+    assert len(UniqueSampler(Small, path=path)) == 3
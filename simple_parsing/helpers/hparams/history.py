@@ -0,0 +1,171 @@
+"""Columnar history of trials (configurations and their objectives), with the best trials indexed.
+
+The fingerprints and objectives of the trials are stored in numpy arrays, which grow in amortized
+constant time. The history maintains, as trials are added:
+- A dict from fingerprint to row, to detect duplicate configurations in constant time;
+- The order of the trials for each objective, so the `k` best trials are found in O(k);
+- The Pareto front of the (multi-objective) trials.
+
+The history is a `Serializable` dataclass, so it can be saved and loaded with `save` and `load`.
+The arrays are saved in `.npy` files next to the file, for formats without native support for
+arrays.
+"""
+from __future__ import annotations
+
+import bisect
+import math
+from dataclasses import dataclass, field
+from typing import Generic, Sequence
+
+from simple_parsing.helpers.serialization.serializable import Serializable
+
+from .hyperparameters import HP, HyperParameters, Point
+from .priors import np
+
+
+@dataclass(eq=False)
+class TrialHistory(Serializable, Generic[HP]):
+    """A history of trials, each with a configuration and the values of one or more objectives.
+
+    >>> from simple_parsing.helpers.hparams import uniform
+    >>> @dataclass
+    ... class Config(HyperParameters):
+    ...     lr: float = uniform(0.0, 1.0)
+    ...     momentum: float = uniform(0.0, 1.0)
+    >>> history = TrialHistory(minimize=[True, False])  # minimize the loss, maximize the accuracy.
+    >>> history.add(Config(lr=0.1, momentum=0.9), (0.5, 0.80))
+    True
+    >>> history.add(Config(lr=0.2, momentum=0.9), (0.3, 0.75))
+    True
+    >>> history.add(Config(lr=0.3, momentum=0.9), (0.4, 0.70))
+    True
+    >>> history.add(Config(lr=0.1, momentum=0.9), (0.1, 0.99))  # A duplicate.
+    False
+    >>> [point.hp.lr for point in history.top_k(2)]
+    [0.2, 0.3]
+    >>> [hp.lr for hp in history.pareto_front()]
+    [0.1, 0.2]
+    """
+
+    minimize: list[bool] = field(default_factory=lambda: [True])
+    """Whether each objective is minimized (or maximized)."""
+
+    hparams: list[HyperParameters] = field(default_factory=list)
+    """The configuration of each trial."""
+
+    fingerprints: np.ndarray = None  # type: ignore
+    """The fingerprint of the configuration of each trial, as unsigned 64-bit integers."""
+
+    objectives: np.ndarray = None  # type: ignore
+    """The values of the objectives of each trial, with shape (num_trials, num_objectives)."""
+
+    def __post_init__(self):
+        num_objectives = len(self.minimize)
+        fingerprints = [] if self.fingerprints is None else self.fingerprints
+        objectives = [] if self.objectives is None else self.objectives
+        # NOTE: Copy the arrays into buffers that can grow (the loaded arrays are read-only).
+        self._fingerprints = np.array(fingerprints, dtype=np.uint64).reshape(-1)
+        self._objectives = np.array(objectives, dtype=float).reshape(-1, num_objectives)
+        if not len(self._fingerprints) == len(self._objectives) == len(self.hparams):
+            raise ValueError("The configurations, fingerprints and objectives don't match.")
+        self._size = len(self._fingerprints)
+        self._signs = np.where(np.asarray(self.minimize, dtype=bool), 1.0, -1.0)
+        self._index: dict[int, int] = {}
+        self._sorted: list[list[tuple[float, int]]] = [[] for _ in range(num_objectives)]
+        self._front: list[int] = []
+        for row in range(self._size):
+            self._index_row(row)
+        self._update_views()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, hparams: HyperParameters) -> bool:
+        return _key(hparams) in self._index
+
+    def add(self, hparams: HP, objectives: float | Sequence[float]) -> bool:
+        """Adds a trial. Returns False (and doesn't add it) if its configuration was already added.
+
+        Trials with NaN objectives (e.g. failed trials) are stored, but are never part of the best
+        trials or of the Pareto front.
+        """
+        key = _key(hparams)
+        if key in self._index:
+            return False
+        values = np.asarray(objectives, dtype=float).reshape(-1)
+        if len(values) != len(self.minimize):
+            raise ValueError(f"Expected {len(self.minimize)} objectives, got {len(values)}.")
+        if self._size == len(self._fingerprints):
+            capacity = max(2 * self._size, 16)
+            self._fingerprints = np.resize(self._fingerprints, capacity)
+            self._objectives = np.resize(self._objectives, (capacity, len(self.minimize)))
+        row = self._size
+        self._fingerprints[row] = key
+        self._objectives[row] = values
+        self.hparams.append(hparams)
+        self._size += 1
+        self._index_row(row)
+        self._update_views()
+        return True
+
+    def extend(self, hparams: Sequence[HP], objectives: Sequence) -> list[bool]:
+        """Adds multiple trials. Returns whether each one was added (i.e. wasn't a duplicate)."""
+        return [self.add(hp, values) for hp, values in zip(hparams, objectives)]
+
+    def top_k_indices(self, k: int, objective: int = 0) -> np.ndarray:
+        """Returns the rows of the `k` best trials for the given objective, best first."""
+        return np.array([row for _, row in self._sorted[objective][:k]], dtype=np.int64)
+
+    def top_k(self, k: int, objective: int = 0) -> list[Point]:
+        """Returns the `k` best trials for the given objective, best first."""
+        return [
+            Point(self.hparams[row], float(self._objectives[row, objective]))
+            for row in self.top_k_indices(k, objective).tolist()
+        ]
+
+    def pareto_front_indices(self) -> np.ndarray:
+        """Returns the rows of the trials that aren't dominated by any other trial, in order."""
+        return np.array(sorted(self._front), dtype=np.int64)
+
+    def pareto_front(self) -> list[HP]:
+        """Returns the configurations of the trials on the Pareto front, in insertion order."""
+        return [self.hparams[row] for row in self.pareto_front_indices().tolist()]
+
+    def _index_row(self, row: int) -> None:
+        key = int(self._fingerprints[row])
+        if key in self._index:
+            raise ValueError(f"Duplicate configuration in the history: {self.hparams[row]}")
+        self._index[key] = row
+        # NOTE: Objectives that are minimized are all converted to "lower is better".
+        signed = self._objectives[row] * self._signs
+        if np.isnan(signed).any():
+            return
+        for objective, value in enumerate(signed.tolist()):
+            bisect.insort(self._sorted[objective], (value, row))
+        self._add_to_front(row, signed)
+
+    def _add_to_front(self, row: int, signed: np.ndarray) -> None:
+        if self._front:
+            front = self._objectives[self._front] * self._signs
+            if ((front <= signed).all(axis=1) & (front < signed).any(axis=1)).any():
+                return
+            dominated = (signed <= front).all(axis=1) & (signed < front).any(axis=1)
+            if dominated.any():
+                self._front = [r for r, d in zip(self._front, dominated.tolist()) if not d]
+        self._front.append(row)
+
+    def _update_views(self) -> None:
+        # The fields are views of the filled part of the buffers, so they can be serialized.
+        self.fingerprints = self._fingerprints[: self._size]
+        self.objectives = self._objectives[: self._size]
+
+    def __repr__(self) -> str:
+        best = [
+            math.nan if not self._sorted[i] else self._sorted[i][0][0] * self._signs[i]
+            for i in range(len(self.minimize))
+        ]
+        return f"{type(self).__name__}(trials={self._size}, best={best})"
+
+
+def _key(hparams: HyperParameters) -> int:
+    return int(hparams.id(), 16)
@@ -0,0 +1,101 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from simple_parsing.helpers.serialization import load, save
+
+from .history import TrialHistory
+from .hparam import uniform
+from .hyperparameters import HyperParameters, Point
+
+np = pytest.importorskip("numpy")
+
+
+@dataclass
+class Config(HyperParameters):
+    x: float = uniform(0.0, 1.0)
+    y: int = uniform(0, 100, discrete=True)
+
+
+def _brute_force_front(signed: np.ndarray) -> list[int]:
+    front = []
+    for i, a in enumerate(signed):
+        dominated = any((b <= a).all() and (b < a).any() for j, b in enumerate(signed) if j != i)
+        if not dominated:
+            front.append(i)
+    return front
+
+
+@pytest.fixture
+def history() -> TrialHistory:
+    rng = np.random.default_rng(123)
+    history = TrialHistory(minimize=[True, False, True])
+    for config in Config.sample_batch(300, seed=1):
+        history.add(config, rng.integers(0, 10, size=3))
+    return history
+
+
+def test_duplicates(history: TrialHistory):
+    n = len(history)
+    # 300 samples of a space of 101 discrete values for `y`, and a float `x` can't collide.
+    assert n == 300
+    config = history.hparams[0]
+    assert config in history
+    assert not history.add(Config(x=config.x, y=config.y), (0, 0, 0))
+    assert len(history) == n
+    assert Config(x=2.0, y=3) not in history
+
+
+def test_top_k(history: TrialHistory):
+    for objective, minimize in enumerate(history.minimize):
+        values = history.objectives[:, objective]
+        rows = history.top_k_indices(10, objective)
+        expected = np.sort(values)[:10] if minimize else np.sort(values)[::-1][:10]
+        assert values[rows].tolist() == expected.tolist()
+
+    points = history.top_k(3)
+    assert all(isinstance(p, Point) for p in points)
+    assert [p.perf for p in points] == sorted(p.perf for p in points)
+
+
+def test_pareto_front(history: TrialHistory):
+    signed = history.objectives * np.array([1, -1, 1])
+    assert history.pareto_front_indices().tolist() == _brute_force_front(signed)
+    assert history.pareto_front() == [history.hparams[i] for i in _brute_force_front(signed)]
+
+
+def test_nan_objectives_are_ignored():
+    history = TrialHistory()
+    history.add(Config(x=0.1, y=1), float("nan"))
+    history.add(Config(x=0.2, y=1), 3.0)
+    assert len(history) == 2
+    assert history.top_k_indices(5).tolist() == [1]
+    assert history.pareto_front_indices().tolist() == [1]
+
+
+@pytest.mark.parametrize("extension", [".json", ".yaml", ".pkl"])
+def test_save_and_load(history: TrialHistory, tmp_path: Path, extension: str):
+    path = tmp_path / f"history{extension}"
+    save(history, path)
+    loaded = load(TrialHistory, path)
+    assert len(loaded) == len(history)
+    assert loaded.hparams == history.hparams
+    assert (loaded.fingerprints == history.fingerprints).all()
+    assert (loaded.objectives == history.objectives).all()
+    assert loaded.pareto_front_indices().tolist() == history.pareto_front_indices().tolist()
+    assert loaded.top_k_indices(5, 1).tolist() == history.top_k_indices(5, 1).tolist()
+    # The loaded history can still be extended.
+    assert loaded.add(Config(x=2.0, y=3), (-1, 100, -1))
+    assert loaded.pareto_front_indices().tolist() == [len(history)]
+
+
+def test_point_comparisons():
+    a = Point(Config(x=0.5, y=1), 1.0)
+    b = Point(Config(x=0.2, y=2), 2.0)
+    assert sorted([b, a]) == [a, b]
+    assert a == (Config(x=0.5, y=1), 1.0)
+    assert a == ({"x": 0.5, "y": 1}, 1.0)
+    assert a != ({"x": 0.5, "y": 2}, 1.0)
+    with pytest.raises(TypeError):
+        _ = a > (Config(), "bob")
@@ -11,23 +11,28 @@ from dataclasses import Field, dataclass, fields
 from functools import singledispatch, total_ordering
 from logging import getLogger
 from pathlib import Path
-from typing import Any, ClassVar, NamedTuple, TypeVar
+from typing import Any, ClassVar, Iterator, NamedTuple, TypeVar
+
+from typing_extensions import Literal
 
 from simple_parsing import utils
+from simple_parsing.helpers.serialization.fingerprint import fingerprint
 from simple_parsing.helpers.serialization.serializable import Serializable
 from simple_parsing.utils import (
-    compute_identity,
     dict_union,
     field_dict,
     get_type_arguments,
 )
 
 from .hparam import ValueOutsidePriorException
-from .priors import Prior
+from .priors import Prior, numpy_installed
 
 if typing.TYPE_CHECKING:
     import numpy
 
+    from .sampling import ArrayBounds
+    from .search_space import SearchSpace
+
 logger = getLogger(__name__)
 T = TypeVar("T")
 HP = TypeVar("HP", bound="HyperParameters")
@@ -48,9 +53,10 @@ class HyperParameters(Serializable, decode_into_subclasses=True):  # type: ignor
     """Base class for dataclasses of HyperParameters."""
 
     # Class variable holding the random number generator used to create the
-    # samples.
+    # samples. This is the global `random` module by default (so that `random.seed` applies), and
+    # gets replaced with a `random.Random` when calling `seed`.
 
-    rng: ClassVar[random.Random] = random.Random()
+    rng: ClassVar[random.Random] = random  # type: ignore
 
     def __post_init__(self):
         for name, f in field_dict(self).items():
@@ -73,43 +79,190 @@ class HyperParameters(Serializable, decode_into_subclasses=True):  # type: ignor
     def field_names(cls) -> list[str]:
         return [f.name for f in fields(cls)]
 
-    def id(self):
-        return compute_identity(**self.to_dict())
+    def id(self) -> str:
+        """Returns a canonical fingerprint of this set of hyper-parameters.
+
+        See `simple_parsing.helpers.serialization.fingerprint` for more info.
+        """
+        return fingerprint(self)
+
+    @classmethod
+    def seed(cls, seed: int | None) -> None:
+        """Seeds the priors of this class (recursively if nested dataclasses are present), so that
+        `sample` becomes reproducible, independently of the global random state.
+
+        Each prior gets its own independent random stream, spawned from the given seed.
+        NOTE: The priors are shared with the subclasses, which are also affected.
+        """
+        cls.rng = random.Random(seed)
+        priors = list(_iter_priors(cls))
+        if numpy_installed:
+            import numpy as np
+
+            seeds = np.random.SeedSequence(seed).spawn(len(priors))
+        else:
+            seeds = [cls.rng.getrandbits(64) for _ in priors]
+        for prior, prior_seed in zip(priors, seeds):
+            prior.seed(prior_seed)
+
+    @classmethod
+    def sample_batch(
+        cls: type[HP], n: int, seed: int | None = None, stream: int = 0, start: int = 0
+    ) -> list[HP]:
+        """Samples `n` sets of hyper-parameters at once.
+
+        The samples are reproducible and don't depend on the global random state: the samples
+        `start` to `start + n` of the random stream identified by `seed` and `stream` are returned.
+        The results are therefore bit-identical regardless of how the work is split into batches,
+        and distinct `stream`s (for example one per worker) give independent samples.
+
+        NOTE: This requires numpy.
+
+        >>> from simple_parsing.helpers.hparams import uniform
+        >>> @dataclass
+        ... class Config(HyperParameters):
+        ...     lr: float = uniform(0.0, 1.0)
+        >>> samples = Config.sample_batch(4, seed=123)
+        >>> samples[2:] == Config.sample_batch(2, seed=123, start=2)
+        True
+        >>> samples == Config.sample_batch(4, seed=123, stream=1)
+        False
+        """
+        from . import sampling
+
+        if seed is None:
+            seed = sampling.random_entropy()
+        return sampling.sample_batch(cls, n, seed=seed, key=(stream,), start=start)
+
+    @classmethod
+    def sample_design(
+        cls: type[HP],
+        n: int | None,
+        method: Literal["sobol", "lhs", "grid"] = "sobol",
+        seed: int | None = None,
+        num_levels: int | None = 5,
+        columnar: bool = False,
+    ) -> list[HP] | dict[str, Any]:
+        """Samples `n` sets of hyper-parameters that evenly cover the search space.
+
+        The points are generated in the unit hypercube with one of these designs, and are then
+        mapped to the values of each prior with its inverse CDF (`Prior.ppf`):
+        - "sobol": A (scrambled) Sobol low-discrepancy sequence. Works best when `n` is a power of
+          two;
+        - "lhs": A Latin hypercube design;
+        - "grid": A grid with `num_levels` values for each continuous prior, and all the values of
+          the discrete priors (and of the categorical priors). The full grid is used if `n` is
+          None, otherwise `n` points evenly spread over the full grid.
+
+        When `columnar` is True, a dict with an array of values for each field is returned,
+        instead of a list of instances.
+
+        NOTE: This requires numpy.
+
+        >>> from simple_parsing.helpers.hparams import categorical, uniform
+        >>> @dataclass
+        ... class Config(HyperParameters):
+        ...     lr: float = uniform(0.0, 1.0)
+        ...     optimizer: str = categorical("sgd", "adam")
+        >>> for config in Config.sample_design(None, method="grid", num_levels=2):
+        ...     print(config)
+        Config(lr=0.25, optimizer='sgd')
+        Config(lr=0.25, optimizer='adam')
+        Config(lr=0.75, optimizer='sgd')
+        Config(lr=0.75, optimizer='adam')
+        >>> columns = Config.sample_design(8, method="sobol", seed=123, columnar=True)
+        >>> sorted(columns["optimizer"].tolist())
+        ['adam', 'adam', 'adam', 'adam', 'sgd', 'sgd', 'sgd', 'sgd']
+        """
+        from . import sampling
+
+        if method == "grid":
+            points = sampling.grid(cls, n, num_levels=num_levels)
+        elif n is None:
+            raise ValueError(f"The number of points is required with the {method!r} method.")
+        elif method == "sobol":
+            points = sampling.sobol(n, sampling.num_dimensions(cls), seed=seed)
+        elif method == "lhs":
+            points = sampling.latin_hypercube(n, sampling.num_dimensions(cls), seed=seed)
+        else:
+            raise ValueError(f"Unknown sampling method {method!r}.")
+        return sampling.from_unit_cube(cls, points, columnar=columnar)
+
+    @classmethod
+    def space_size(cls, num_levels: int | None = None) -> int | None:
+        """Returns the number of distinct configurations in the search space of this class, or
+        None if it is infinite (e.g. when a prior is continuous and `num_levels` isn't set)."""
+        from .sampling import space_size
+
+        return space_size(cls, num_levels)
 
-    def seed(self, seed: int | None) -> None:
-        """TODO: Seed all priors with the given seed. (recursively if nested dataclasses
-        are present.)
+    @classmethod
+    def enumerate_space(
+        cls: type[HP], shard: int = 0, num_shards: int = 1, num_levels: int | None = None
+    ) -> Iterator[HP]:
+        """Lazily yields all the configurations of the (finite) search space, or of one shard.
+
+        This makes it possible for `num_shards` independent workers to each enumerate a disjoint
+        part of the space, without any coordination: shard `i` contains the configurations at the
+        indices `i, i + num_shards, i + 2 * num_shards, ...` (see `from_index`).
+        The space needs to be finite, unless `num_levels` is set, in which case the continuous
+        priors are discretized into `num_levels` values, like in `sample_design`.
+
+        NOTE: This requires numpy.
+
+        >>> from simple_parsing.helpers.hparams import categorical, uniform
+        >>> @dataclass
+        ... class Config(HyperParameters):
+        ...     layers: int = uniform(1, 3, discrete=True)
+        ...     optimizer: str = categorical("sgd", "adam")
+        >>> for config in Config.enumerate_space(shard=1, num_shards=2):
+        ...     print(config)
+        Config(layers=1, optimizer='adam')
+        Config(layers=2, optimizer='adam')
+        Config(layers=3, optimizer='adam')
+        >>> Config.from_index(3)
+        Config(layers=2, optimizer='adam')
         """
-        raise NotImplementedError("TODO")
+        from .sampling import enumerate_space
+
+        return enumerate_space(cls, shard, num_shards, num_levels=num_levels)  # type: ignore
+
+    @classmethod
+    def from_index(cls: type[HP], index: int, num_levels: int | None = None) -> HP:
+        """Returns the configuration at the given index in the (finite) search space.
+
+        The space is indexed in mixed radix (like `itertools.product` over the fields), so this
+        doesn't depend on the size of the space. See `enumerate_space` for more info.
+        """
+        from .sampling import configs_at
+
+        return configs_at(cls, [index], num_levels)[0]  # type: ignore
+
+    @classmethod
+    def get_search_space(cls) -> SearchSpace:
+        """Returns an immutable, flattened view of the search space of this class.
+
+        It is computed once per class, and is shared by the methods below and the samplers.
+        """
+        from .search_space import get_search_space
+
+        return get_search_space(cls)
 
     @classmethod
     def get_priors(cls) -> dict[str, Prior]:
-        """Returns a dictionary of the Priors for the hparam fields in this class."""
-        priors_dict: dict[str, Prior] = {}
-        for field in fields(cls):
-            # If a HyperParameters class contains another HyperParameters class as a field
-            # we perform returned a flattened dict.
-            if inspect.isclass(field.type) and issubclass(field.type, HyperParameters):
-                priors_dict[field.name] = field.type.get_priors()
-            else:
-                prior: Prior | None = field.metadata.get("prior")
-                if prior:
-                    priors_dict[field.name] = prior
-        return priors_dict
+        """Returns a dictionary of the Priors for the hparam fields in this class.
+
+        NOTE: This is a copy of the dict stored in the (cached) search space of this class.
+        """
+        from .search_space import _thaw
+
+        return _thaw(cls.get_search_space().priors_dict)
 
     @classmethod
     def get_orion_space_dict(cls) -> dict[str, str]:
-        result: dict[str, str] = {}
-        for field in fields(cls):
-            # If a HyperParameters class contains another HyperParameters class as a field
-            # we perform returned a flattened dict.
-            if inspect.isclass(field.type) and issubclass(field.type, HyperParameters):
-                result[field.name] = field.type.get_orion_space_dict()
-            else:
-                prior: Prior | None = field.metadata.get("prior")
-                if prior:
-                    result[field.name] = prior.get_orion_space_string()
-        return result
+        from .search_space import _thaw
+
+        return _thaw(cls.get_search_space().orion_space_dict)
 
     def get_orion_space(self) -> dict[str, str]:
         """NOTE: This might be more useful in some cases than the above classmethod
@@ -130,8 +283,8 @@ class HyperParameters(Serializable, decode_into_subclasses=True):  # type: ignor
         return result
 
     @classmethod
-    def space_id(cls):
-        return compute_identity(**cls.get_orion_space_dict())
+    def space_id(cls) -> str:
+        return cls.get_search_space().id
 
     @classmethod
     def get_bounds(cls) -> list[BoundInfo]:
@@ -173,19 +326,13 @@ class HyperParameters(Serializable, decode_into_subclasses=True):  # type: ignor
                 inspect.isclass(v) and issubclass(v, HyperParameters)
                 for v in utils.get_type_arguments(field.type)
             ):
-                chosen_class = random.choice(get_type_arguments(field.type))
+                chosen_class = cls.rng.choice(get_type_arguments(field.type))
                 # BUG: Seems to be a bit of a bug here, when the numpy rng is set!
                 value = chosen_class.sample()
                 kwargs[field.name] = value
             else:
                 prior: Prior | None = field.metadata.get("prior")
                 if prior is not None:
-                    try:
-                        import numpy as np
-
-                        prior.np_rng = np.random
-                    except ImportError:
-                        prior.rng = cls.rng
                     value = prior.sample()
                     shape = getattr(prior, "shape", None)
                     if shape == () and hasattr(value, "item") and callable(value.item):
@@ -240,11 +387,60 @@ class HyperParameters(Serializable, decode_into_subclasses=True):  # type: ignor
         return cls.from_dict(d)
 
     def clip_within_bounds(self: HP) -> HP:
-        d = self.to_dict()
+        changes: dict[str, Any] = {}
         for bound in self.get_bounds():
             min_v, max_v = bound.domain
-            d[bound.name] = min(max_v, max(min_v, d[bound.name]))
-        return self.from_dict(d)
+            changes[bound.name] = min(max_v, max(min_v, getattr(self, bound.name)))
+        return dataclasses.replace(self, **changes)
+
+    @classmethod
+    def get_array_bounds(cls) -> ArrayBounds:
+        """Returns arrays with the lower and upper bounds of each column of the arrays of values
+        of this class, which also cover nested dataclasses, categorical priors (indices) and
+        priors with a shape. These are computed once per class.
+
+        See `ArrayBounds` for a description of the columns.
+        """
+        from .sampling import array_bounds
+
+        return array_bounds(cls)
+
+    @classmethod
+    def clip_array(cls, array: numpy.ndarray, out: numpy.ndarray | None = None) -> numpy.ndarray:
+        """Clips a whole population of configurations (one per row) within the bounds at once.
+
+        The columns of `array` are described by `get_array_bounds`. The values of the discrete
+        priors (and the indices of the categorical priors) are also rounded.
+
+        >>> import numpy as np
+        >>> from simple_parsing.helpers.hparams import categorical, uniform
+        >>> @dataclass
+        ... class Config(HyperParameters):
+        ...     lr: float = uniform(0.0, 1.0)
+        ...     layers: int = uniform(1, 8, discrete=True)
+        ...     optimizer: str = categorical("sgd", "adam", "rmsprop")
+        >>> Config.get_array_bounds().names
+        ('lr', 'layers', 'optimizer')
+        >>> Config.clip_array(np.array([[1.5, 3.7, -1.0], [0.5, 12.0, 1.2]])).tolist()
+        [[1.0, 4.0, 0.0], [0.5, 8.0, 1.0]]
+        """
+        from .sampling import clip_array
+
+        return clip_array(cls, array, out=out)
+
+
+def _iter_priors(cls: type[HyperParameters]):
+    """Yields the priors of the fields of `cls`, recursively, in a deterministic order."""
+    for field in fields(cls):
+        field_types = [field.type]
+        if utils.is_union(field.type):
+            field_types = list(get_type_arguments(field.type))
+        for field_type in field_types:
+            if inspect.isclass(field_type) and issubclass(field_type, HyperParameters):
+                yield from _iter_priors(field_type)
+        prior: Prior | None = field.metadata.get("prior")
+        if prior is not None:
+            yield prior
 
 
 @singledispatch
@@ -277,27 +473,34 @@ class Point(NamedTuple):
         other_hp, other_perf = other
         hps_equal = self.hp == other_hp
         if not hps_equal and isinstance(other_hp, dict):
-            other_id = compute_identity(**other_hp)
-            # this is hairy, but need to check if the dicts would be equal.
-            if isinstance(self.hp, dict):
-                # This should ideally never be the case, we would hope that
-                # people are using HyperParameter objects in the Point tuples.
-                hp_id = compute_identity(**self.hp)
-            else:
-                hp_id = self.hp.id()
-            hps_equal = hp_id == other_id
-        return hps_equal and self.perf == other[1]
+            # Compare the dicts directly, rather than their identity hashes.
+            hp_dict = self.hp if isinstance(self.hp, dict) else self.hp.to_dict()
+            hps_equal = hp_dict == other_hp
+        return hps_equal and self.perf == other_perf
 
     def __gt__(self, other: tuple[object, ...]) -> bool:
         # Even though the tuple has (hp, perf), compare based on the order
         # (perf, hp).
         # This means that sorting a list of Points will work as expected!
-        if isinstance(other, (Point, tuple)):
-            hp, perf = other
-            if not isinstance(perf, float):
-                print(other)
-                exit()
+        perf = _get_perf(other)
+        if perf is None:
+            return NotImplemented
         return self.perf > perf
 
+    def __lt__(self, other: tuple[object, ...]) -> bool:
+        # NOTE: `total_ordering` doesn't replace the comparison methods of `tuple`.
+        perf = _get_perf(other)
+        if perf is None:
+            return NotImplemented
+        return self.perf < perf
+
     # def __repr__(self):
     #     return super().__repr__()
+
+
+def _get_perf(other: object) -> float | None:
+    """Returns the performance of an `(hp, perf)` tuple, or None if `other` isn't one."""
+    if not isinstance(other, tuple) or len(other) != 2:
+        return None
+    perf = other[1]
+    return perf if isinstance(perf, (int, float)) else None
@@ -1,8 +1,10 @@
-from dataclasses import dataclass
+import dataclasses
+from dataclasses import dataclass, field
 from typing import Sequence, Union
 
 import pytest
 
+from . import sampling
 from .hparam import categorical, log_uniform, uniform
 from .hyperparameters import HyperParameters
 
@@ -267,3 +269,228 @@ def test_field_types():
         assert all(c.f.dtype == int for c in cs)
     else:
         assert all(all(isinstance(v, int) for v in c.f) for c in cs)
+
+
+@dataclass
+class Child1(HyperParameters):
+    foo: int = uniform(0, 10, default=5)
+
+
+@dataclass
+class Child2(HyperParameters):
+    bar: float = log_uniform(1e-3, 1.0, default=0.1)
+
+
+@dataclass
+class Mixed(HyperParameters):
+    a: float = uniform(0.0, 1.0)
+    b: int = uniform(-10, 10, discrete=True)
+    c: str = categorical("foo", "bar", "baz")
+    d: Sequence[float] = uniform(0.0, 1.0, default=0.5, shape=3)
+    child: Child1 = field(default_factory=Child1)
+    either: Union[Child1, Child2] = field(default_factory=Child1)
+
+
+def _values(hp: HyperParameters) -> dict:
+    return {k: v.tolist() if hasattr(v, "tolist") else v for k, v in hp.to_dict().items()}
+
+
+@pytest.mark.skipif(not numpy_installed, reason="Test requires numpy.")
+def test_sample_batch_is_independent_of_sharding():
+    samples = Mixed.sample_batch(100, seed=123)
+    assert len(samples) == 100
+    assert all(isinstance(s, Mixed) for s in samples)
+    assert all(isinstance(s.b, int) and -10 <= s.b <= 10 for s in samples)
+    assert {s.c for s in samples} == {"foo", "bar", "baz"}
+    assert {type(s.either) for s in samples} == {Child1, Child2}
+
+    sharded = Mixed.sample_batch(30, seed=123) + Mixed.sample_batch(70, seed=123, start=30)
+    assert [_values(s) for s in sharded] == [_values(s) for s in samples]
+    # Odd offsets also work for shaped priors, which use multiple random numbers per sample.
+    assert _values(Mixed.sample_batch(1, seed=123, start=17)[0]) == _values(samples[17])
+
+
+@pytest.mark.skipif(not numpy_installed, reason="Test requires numpy.")
+def test_sample_batch_streams_are_independent():
+    assert _values(Mixed.sample_batch(1, seed=1)[0]) == _values(Mixed.sample_batch(1, seed=1)[0])
+    stream_0 = [s.a for s in Mixed.sample_batch(10, seed=1, stream=0)]
+    stream_1 = [s.a for s in Mixed.sample_batch(10, seed=1, stream=1)]
+    other_seed = [s.a for s in Mixed.sample_batch(10, seed=2, stream=0)]
+    assert len(set(stream_0) | set(stream_1) | set(other_seed)) == 30
+
+
+def test_seed():
+    C.seed(123)
+    first = [C.sample() for _ in range(5)]
+    C.seed(123)
+    assert [C.sample() for _ in range(5)] == first
+    # The priors use different streams.
+    assert all(c.lr != c.momentum for c in first)
+
+
+@pytest.mark.skipif(not numpy_installed, reason="Test requires numpy.")
+@pytest.mark.parametrize("method", ["sobol", "lhs"])
+def test_sample_design_is_stratified(method: str):
+    n = 64
+    columns = Mixed.sample_design(n, method=method, seed=123, columnar=True)
+    assert sorted(columns.keys()) == sorted(Mixed.field_names())
+    # Each of the `n` equal intervals of the prior of `a` contains exactly one point.
+    assert sorted((columns["a"] * n).astype(int).tolist()) == list(range(n))
+    assert columns["d"].shape == (n, 3)
+    assert sorted(np.unique(columns["c"], return_counts=True)[1].tolist()) == [21, 21, 22]
+    assert isinstance(columns["child"], dict) and columns["child"]["foo"].shape == (n,)
+
+    samples = Mixed.sample_design(n, method=method, seed=123)
+    assert [s.a for s in samples] == columns["a"].tolist()
+    assert {type(s.either) for s in samples} == {Child1, Child2}
+    assert _values(samples[0]) != _values(Mixed.sample_design(n, method=method, seed=456)[0])
+
+
+@pytest.mark.skipif(not numpy_installed, reason="Test requires numpy.")
+def test_sample_grid():
+    @dataclass
+    class Grid(HyperParameters):
+        a: int = uniform(0, 2, discrete=True)
+        b: str = categorical("x", "y", "z", probabilities={"x": 0.5, "y": 0.0, "z": 0.5})
+        c: float = log_uniform(1, 100, base=10)
+
+    full = Grid.sample_design(None, method="grid", num_levels=3)
+    assert len(full) == 18
+    # The choices with a probability of zero are excluded.
+    assert [(g.a, g.b) for g in full[::3]] == [(a, b) for a in (0, 1, 2) for b in ("x", "z")]
+    assert [g.c for g in full[:3]] == pytest.approx([10 ** (1 / 3), 10, 10 ** (5 / 3)])
+
+    partial = Grid.sample_design(6, method="grid", num_levels=3)
+    assert [_values(g) for g in partial] == [_values(g) for g in full[::3]]
+
+
+@pytest.mark.skipif(not numpy_installed, reason="Test requires numpy.")
+def test_sample_grid_with_union_field():
+    full = Mixed.sample_design(None, method="grid", num_levels=2)
+    size = Mixed.space_size(num_levels=2)
+    assert len(full) == size
+    # Only the fields of the chosen class vary, so there are no duplicate configurations.
+    assert len({repr(config) for config in full}) == size
+    assert [_values(g) for g in full] == [
+        _values(c) for c in sampling.configs_at(Mixed, range(size), num_levels=2)
+    ]
+
+
+@pytest.mark.skipif(not numpy_installed, reason="Test requires numpy.")
+@pytest.mark.parametrize("num_shards", [1, 3, 7])
+def test_enumerate_space_shards(num_shards: int):
+    @dataclass
+    class Finite(HyperParameters):
+        a: int = uniform(0, 4, discrete=True)
+        b: str = categorical("foo", "bar", "baz", default="foo")
+        c: Sequence[int] = uniform(0, 1, default=0, discrete=True, shape=2)
+        either: Union[Child1, C] = field(default_factory=Child1)
+
+    with pytest.raises(ValueError, match="isn't finite"):
+        list(Finite.enumerate_space())
+    # With 11 levels for `lr` and `momentum`, `C` has 121 configurations, `Child1` has 11.
+    size = Finite.space_size(num_levels=11)
+    assert size == 5 * 3 * 2**2 * (11 + 121)
+
+    shards = [
+        [_values(f) for f in Finite.enumerate_space(i, num_shards, num_levels=11)]
+        for i in range(num_shards)
+    ]
+    assert sorted(len(shard) for shard in shards) == sorted(
+        len(range(i, size, num_shards)) for i in range(num_shards)
+    )
+    configs = [config for shard in shards for config in shard]
+    assert len({repr(config) for config in configs}) == size
+    last = Finite.from_index(size - 1, num_levels=11)
+    assert _values(last) == shards[(size - 1) % num_shards][-1]
+
+
+@pytest.mark.skipif(not numpy_installed, reason="Test requires numpy.")
+def test_from_index_in_huge_space():
+    @dataclass
+    class Huge(HyperParameters):
+        a: Sequence[int] = uniform(0, 9, default=0, discrete=True, shape=40)
+        b: str = categorical("foo", "bar", default="foo")
+
+    size = Huge.space_size()
+    assert size == 10**40 * 2
+    last = Huge.from_index(size - 1)
+    assert last.a.tolist() == [9] * 40 and last.b == "bar"
+    assert Huge.from_index(3).a.tolist() == [0] * 39 + [1]
+    with pytest.raises(IndexError):
+        Huge.from_index(size)
+
+
+@pytest.mark.skipif(not numpy_installed, reason="Test requires numpy.")
+def test_array_bounds():
+    bounds = Mixed.get_array_bounds()
+    assert bounds.names == (
+        "a",
+        "b",
+        "c",
+        "d[0]",
+        "d[1]",
+        "d[2]",
+        "child.foo",
+        "either",
+        "either.Child1.foo",
+        "either.Child2.bar",
+    )
+    assert bounds.lower.tolist() == [0, -10, 0, 0, 0, 0, 0, 0, 0, 1e-3]
+    assert bounds.upper.tolist() == [1, 10, 2, 1, 1, 1, 10, 1, 10, 1]
+    assert bounds.integral.tolist() == [0, 1, 1, 0, 0, 0, 1, 1, 1, 0]
+    # The arrays are cached, so they are read-only.
+    assert Mixed.get_array_bounds() is bounds
+    assert Mixed.get_search_space().array_bounds is bounds
+    with pytest.raises(ValueError):
+        bounds.lower[0] = 1
+
+
+@pytest.mark.skipif(not numpy_installed, reason="Test requires numpy.")
+def test_clip_array():
+    bounds = Mixed.get_array_bounds()
+    population = np.random.default_rng(123).normal(0, 20, size=(1000, len(bounds.names)))
+    clipped = Mixed.clip_array(population)
+    assert clipped is not population
+    assert ((bounds.lower <= clipped) & (clipped <= bounds.upper)).all()
+    assert (clipped[:, bounds.integral] == np.round(clipped[:, bounds.integral])).all()
+    inside = (bounds.lower <= population) & (population <= bounds.upper) & ~bounds.integral
+    assert (clipped[inside] == population[inside]).all()
+
+    assert Mixed.clip_array(population, out=population) is population
+    assert (population == clipped).all()
+    assert Mixed.clip_array(population[0]).tolist() == clipped[0].tolist()
+    with pytest.raises(ValueError, match="Expected arrays with 10 columns"):
+        Mixed.clip_array(population[:, :3])
+
+
+def test_search_space_is_cached():
+    space = Mixed.get_search_space()
+    assert Mixed.get_search_space() is space
+    assert list(space.priors) == [
+        "a",
+        "b",
+        "c",
+        "d",
+        "child.foo",
+        "either.Child1.foo",
+        "either.Child2.bar",
+    ]
+    assert dict(space.unions) == {"either": (Child1, Child2)}
+    assert space.num_dimensions == 10
+    assert space.size is None
+    with pytest.raises(TypeError):
+        space.priors["a"] = None  # type: ignore
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        space.hparams_type = C  # type: ignore
+
+    # The classes have their own search space.
+    assert Child1.get_search_space() is not Mixed.get_search_space()
+    assert Child1.get_search_space().size == 11
+    assert Mixed.space_id() == Mixed.space_id()
+
+    # The returned dicts are copies, so modifying them doesn't affect the cached values.
+    priors = Mixed.get_priors()
+    assert priors["child"] == {"foo": Child1.get_priors()["foo"]}
+    priors["child"].clear()
+    assert Mixed.get_priors()["child"] != {}
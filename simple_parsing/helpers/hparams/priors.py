@@ -43,13 +43,73 @@ class Prior(Generic[T]):
     def sample(self) -> T:
         pass
 
-    def seed(self, seed: Optional[int]) -> None:
-        # Should this seed this individual prior?
+    def seed(self, seed: Optional[Union[int, "np.random.SeedSequence"]]) -> None:
+        """Seeds this prior, so that `sample` uses its own random number generator.
+
+        With numpy, `seed` can also be a `numpy.random.SeedSequence`, for example one of the child
+        sequences spawned from a parent seed, to get independent streams for different priors.
+        """
         if numpy_installed:
-            self.np_rng = np.random.RandomState(seed)
+            self.np_rng = np.random.default_rng(seed)
         else:
             self.rng = random.Random(seed)
 
+    @property
+    def size(self) -> int:
+        """The number of values in each sample of this prior (the product of its `shape`)."""
+        shape = getattr(self, "shape", None)
+        if not shape:
+            return 1
+        if isinstance(shape, int):
+            return shape
+        return math.prod(shape)
+
+    def ppf(self, u: "np.ndarray") -> "np.ndarray":
+        """Maps points of the unit interval to values of this prior (the inverse of its CDF).
+
+        `u` is an array of shape `(n, self.size)`, with values in [0, 1). Returns an array with the
+        `n` samples, of shape `(n,)`, or `(n, *shape)` for priors with a shape.
+        """
+        raise NotImplementedError(f"The {type(self).__name__} prior doesn't support `ppf`.")
+
+    def unit_grid(self, num: Optional[int] = None) -> "np.ndarray":
+        """Returns the points of the unit interval used for a grid over this prior.
+
+        These are the `num` mid-points of equal-sized intervals, or, for priors with a finite
+        number of values, a point for each value (when there are at most `num` of them).
+        Raises a ValueError if `num` is None and this prior doesn't have a finite set of values.
+        """
+        if num is None:
+            raise ValueError(
+                f"The {type(self).__name__} prior doesn't have a finite number of values, so the "
+                f"number of grid points needs to be passed."
+            )
+        return (np.arange(num) + 0.5) / num
+
+    def bounds(self) -> Tuple[float, float]:
+        """Returns the (inclusive) bounds of the values of this prior, for each of its elements.
+
+        For categorical priors, these are the bounds of the index of the chosen value.
+        """
+        return (-math.inf, math.inf)
+
+    @property
+    def integral(self) -> bool:
+        """Whether the values of this prior (or their indices, if categorical) are integers."""
+        return bool(getattr(self, "discrete", False))
+
+    def to_values(self, array: "np.ndarray") -> List[Any]:
+        """Converts the samples in an array from `ppf` to the values returned by `sample`."""
+        if getattr(self, "shape", None):
+            return list(array)
+        return array.tolist()
+
+    def _reshape(self, values: "np.ndarray") -> "np.ndarray":
+        shape = getattr(self, "shape", None)
+        if not shape:
+            return values[:, 0]
+        return values.reshape((len(values),) + ((shape,) if isinstance(shape, int) else shape))
+
     @abstractmethod
     def get_orion_space_string(self) -> str:
         """Gets the 'Orion-formatted space string' for this Prior object."""
@@ -94,6 +154,12 @@ class NormalPrior(Prior):
             return round(value)
         return value
 
+    def ppf(self, u: "np.ndarray") -> "np.ndarray":
+        values = self.mu + self.sigma * _standard_normal_ppf(u)
+        if self.discrete:
+            values = np.round(values).astype(int)
+        return self._reshape(values)
+
     def get_orion_space_string(self) -> str:
         raise NotImplementedError(
             "TODO: Add this for the normal prior, didn't check how its done in " "Orion yet."
@@ -145,6 +211,22 @@ class UniformPrior(Prior):
             return round(value)
         return value
 
+    def ppf(self, u: "np.ndarray") -> "np.ndarray":
+        values = self.min + u * (self.max - self.min)
+        if self.discrete:
+            values = np.round(values).astype(int)
+        return self._reshape(values)
+
+    def unit_grid(self, num: Optional[int] = None) -> "np.ndarray":
+        if self.discrete:
+            values = np.arange(math.ceil(self.min), math.floor(self.max) + 1)
+            if num is None or len(values) <= num:
+                return (values - self.min) / ((self.max - self.min) or 1)
+        return super().unit_grid(num)
+
+    def bounds(self) -> Tuple[float, float]:
+        return (self.min, self.max)
+
     def get_orion_space_string(self) -> str:
         string = f"uniform({self.min}, {self.max}"
         if self.discrete:
@@ -170,12 +252,17 @@ class CategoricalPrior(Prior[T]):
     def __post_init__(self):
         super().__post_init__()
         if isinstance(self.choices, dict):
-            choices = []
-            self.probabilities = []
-            for k, v in self.choices.items():
-                choices.append(k)
+            probabilities = []
+            for v in self.choices.values():
                 assert isinstance(v, (int, float)), "probs should be int or float"
-                self.probabilities.append(v)
+                probabilities.append(v)
+            self.probabilities = probabilities
+        # NOTE: The tables used for sampling are computed once here, rather than on every call.
+        self._values: List[T] = list(self.choices)
+        self._alias_probabilities, self._aliases = _alias_table(
+            self.probabilities or [1.0] * len(self._values)
+        )
+        self._alias_arrays: Optional[Tuple["np.ndarray", "np.ndarray"]] = None
 
     @overload
     def sample(self, n: int) -> List[T]:
@@ -187,26 +274,65 @@ class CategoricalPrior(Prior[T]):
 
     def sample(self, n: int = None) -> Union[T, List[T]]:
         assert self.choices
-        # n = n or 1
-        # assert isinstance(n, int), n
-        choices: List = []
-        probabilities: List[float] = []
-        if isinstance(self.choices, dict):
-            for k, v in self.choices.items():
-                choices.append(k)
-                probabilities.append(v)
-        else:
-            choices = self.choices
-            probabilities = self.probabilities
+        values = self._values
+        samples = [values[i] for i in self.sample_indices(n or 1)]
+        return samples[0] if n in {None, 1} else samples
 
-        print(choices, n, probabilities)
-        if numpy_installed:
-            s = self.np_rng.choice(choices, size=n, p=probabilities)
-            samples = [(s_i.item() if isinstance(s_i, np.ndarray) else s_i) for s_i in s]
+    def sample_indices(self, n: int) -> Union["np.ndarray", List[int]]:
+        """Samples the indices of `n` choices at once, using the alias method.
+
+        Returns an array of indices into `list(self.choices)` (a list if numpy isn't installed).
+        """
+        num_choices = len(self._values)
+        if not numpy_installed:
+            indices = []
+            for _ in range(n):
+                x = self.rng.random() * num_choices
+                i = int(x)
+                indices.append(i if x - i < self._alias_probabilities[i] else self._aliases[i])
+            return indices
+        if self._alias_arrays is None:
+            self._alias_arrays = (
+                np.array(self._alias_probabilities, dtype=float),
+                np.array(self._aliases, dtype=np.intp),
+            )
+        alias_probabilities, aliases = self._alias_arrays
+        x = self.np_rng.random(n) * num_choices
+        indices = x.astype(np.intp)
+        return np.where(x - indices < alias_probabilities[indices], indices, aliases[indices])
+
+    def ppf(self, u: "np.ndarray") -> "np.ndarray":
+        """Returns the indices of the chosen values in `self.choices`."""
+        if self.probabilities is None:
+            indices = np.floor(u * len(self._values)).astype(int)
         else:
-            samples = self.rng.choices(choices, weights=probabilities, k=n or 1)
+            cumulative = np.cumsum(self.probabilities, dtype=float)
+            indices = np.searchsorted(cumulative, u * cumulative[-1], side="right")
+        return self._reshape(np.minimum(indices, len(self._values) - 1))
+
+    def unit_grid(self, num: Optional[int] = None) -> "np.ndarray":
+        """Returns a point for each choice, in the middle of its interval in `ppf`.
+
+        NOTE: The choices with a probability of zero are excluded.
+        """
+        probabilities = self.probabilities
+        if probabilities is None:
+            return (np.arange(len(self._values)) + 0.5) / len(self._values)
+        cumulative = np.cumsum(probabilities, dtype=float)
+        starts = np.concatenate([[0.0], cumulative[:-1]])
+        midpoints = (starts + cumulative) / (2 * cumulative[-1])
+        return midpoints[np.asarray(probabilities) > 0]
+
+    def bounds(self) -> Tuple[float, float]:
+        return (0, len(self.choices) - 1)
 
-        return samples[0] if n in {None, 1} else samples
+    @property
+    def integral(self) -> bool:
+        return True
+
+    def to_values(self, array: "np.ndarray") -> List[T]:
+        values = self._values
+        return [values[i] for i in array.tolist()]
 
     def get_orion_space_string(self) -> str:
         string = "choices("
@@ -277,13 +403,22 @@ class LogUniformPrior(Prior):
             return round(value)
         return value
 
+    def ppf(self, u: "np.ndarray") -> "np.ndarray":
+        values = np.power(self.base, self.log_min + u * (self.log_max - self.log_min))
+        if self.discrete:
+            values = np.round(values).astype(int)
+        return self._reshape(values)
+
+    def bounds(self) -> Tuple[float, float]:
+        return (self.min, self.max)
+
     @property
     def log_min(self) -> Union[int, float]:
         if numpy_installed:
             if self.base in {np.e, math.e}:
                 log_min = np.log(self.min)
             else:
-                log_min = np.log(self.min)
+                log_min = np.log(self.min) / np.log(self.base)
         else:
             if self.base is math.e:
                 log_min = math.log(self.min)
@@ -354,3 +489,62 @@ class LogUniformPrior(Prior):
                 for i, v_i in enumerate(v)
             )
         return isinstance(v, (int, float)) and (self.min <= v < self.max)
+
+
+def _alias_table(probabilities: Sequence[float]) -> Tuple[List[float], List[int]]:
+    """Builds the table of the alias method (Vose's algorithm) for the given probabilities.
+
+    A sample is drawn by choosing an index `i` uniformly, and keeping it with probability
+    `alias_probabilities[i]`, or returning `aliases[i]` otherwise.
+    """
+    num = len(probabilities)
+    total = sum(probabilities)
+    scaled = [p * num / total for p in probabilities]
+    alias_probabilities = [1.0] * num
+    aliases = list(range(num))
+    small = [i for i, p in enumerate(scaled) if p < 1]
+    large = [i for i, p in enumerate(scaled) if p >= 1]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        alias_probabilities[less] = scaled[less]
+        aliases[less] = more
+        scaled[more] += scaled[less] - 1
+        (small if scaled[more] < 1 else large).append(more)
+    # NOTE: Any leftovers are due to rounding errors, and have a probability of (almost) 1.
+    return alias_probabilities, aliases
+
+
+# Coefficients of the rational approximations of the inverse of the standard normal CDF, from
+# Peter J. Acklam's algorithm (relative error below 1.15e-9).
+_A = (-39.69683028665376, 220.9460984245205, -275.9285104469687, 138.3577518672690,
+      -30.66479806614716, 2.506628277459239)  # fmt: skip
+_B = (-54.47609879822406, 161.5858368580409, -155.6989798598866, 66.80131188771972,
+      -13.28068155288572)  # fmt: skip
+_C = (-0.007784894002430293, -0.3223964580411365, -2.400758277161838, -2.549732539343734,
+      4.374664141464968, 2.938163982698783)  # fmt: skip
+_D = (0.007784695709041462, 0.3224671290700398, 2.445134137142996, 3.754408661907416)
+
+
+def _standard_normal_ppf(u: "np.ndarray") -> "np.ndarray":
+    """Vectorized inverse of the CDF of the standard normal distribution."""
+    # NOTE: Avoid returning infinite values for u == 0.
+    u = np.clip(u, 2.0**-53, 1 - 2.0**-53)
+    low = u < 0.02425
+    high = u > 1 - 0.02425
+    result = np.empty_like(u)
+
+    mid = ~(low | high)
+    q = u[mid] - 0.5
+    r = q * q
+    a, b = _A, _B
+    result[mid] = (
+        (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5])
+        * q
+        / (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1)
+    )
+    for mask, sign in ((low, 1.0), (high, -1.0)):
+        q = np.sqrt(-2 * np.log(u[mask] if sign > 0 else 1 - u[mask]))
+        c, d = _C, _D
+        numerator = ((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]
+        result[mask] = sign * numerator / ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1)
+    return result
@@ -6,7 +6,7 @@ import pytest
 
 from .hparam import hparam
 from .hyperparameters import HyperParameters
-from .priors import CategoricalPrior, LogUniformPrior, UniformPrior
+from .priors import CategoricalPrior, LogUniformPrior, NormalPrior, UniformPrior
 from .utils import set_seed
 
 numpy_installed = False
@@ -132,3 +132,39 @@ def test_log_uniform_with_shape():
     prior = LogUniformPrior(min=1e-6, max=1, default=0.001, shape=2)
     assert len(prior.sample()) == 2
     assert [0.1, 0.2] in prior
+
+
+@pytest.mark.skipif(not numpy_installed, reason="Test requires numpy.")
+def test_ppf():
+    u = np.array([[0.0], [0.025], [0.5], [0.975]])
+    assert UniformPrior(min=-1, max=3).ppf(u).tolist() == [-1, -0.9, 1, 2.9]
+    log_uniform_quantiles = LogUniformPrior(min=1, max=1e4, base=10).ppf(u)
+    assert np.allclose(log_uniform_quantiles, [1, 1.2589, 100, 7943.28], rtol=1e-4)
+    normal_quantiles = NormalPrior(mu=1, sigma=2).ppf(u)[1:]
+    assert np.allclose(normal_quantiles, [1 - 2 * 1.959964, 1, 1 + 2 * 1.959964])
+    assert np.isfinite(NormalPrior().ppf(u)).all()
+
+    prior = CategoricalPrior({"a": 0.1, "b": 0.1, "c": 0.8})
+    assert prior.to_values(prior.ppf(u)) == ["a", "a", "c", "c"]
+    assert prior.to_values(prior.ppf(np.array([[0.15]]))) == ["b"]
+
+    shaped = UniformPrior(min=0, max=10, discrete=True, shape=2)
+    values = shaped.ppf(np.array([[0.0, 0.51], [0.26, 0.99]]))
+    assert values.tolist() == [[0, 5], [3, 10]]
+    assert values.dtype == int
+
+
+def test_categorical_prior_sample_indices(capsys: pytest.CaptureFixture):
+    prior = CategoricalPrior({"a": 0.1, "b": 0.0, "c": 0.6, "d": 0.3})
+    prior.seed(123)
+    indices = prior.sample_indices(100_000)
+    counts = Counter(indices.tolist() if numpy_installed else indices)
+    assert counts[1] == 0
+    for index, probability in [(0, 0.1), (2, 0.6), (3, 0.3)]:
+        assert counts[index] / 100_000 == pytest.approx(probability, abs=0.01)
+
+    prior = CategoricalPrior(["foo", "bar"])
+    assert prior.sample() in {"foo", "bar"}
+    assert set(prior.sample(10)) <= {"foo", "bar"}
+    # Sampling shouldn't print anything.
+    assert capsys.readouterr().out == ""
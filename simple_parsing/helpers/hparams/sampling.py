@@ -0,0 +1,666 @@
+"""Reproducible, columnar sampling of `HyperParameters`, using counter-based random streams.
+
+Each prior gets its own stream of uniform random numbers, derived from the seed, the `stream`
+index (e.g. the index of a worker) and the path of the field in the (possibly nested) dataclass,
+using `numpy.random.SeedSequence`. The streams use the counter-based `Philox` bit generator, so
+jumping to the `start`-th sample of a stream costs the same as generating the first one. This makes
+the samples bit-identical regardless of how the work is split: `sample_batch(100, seed=s)` gives
+the same samples as `sample_batch(50, seed=s) + sample_batch(50, seed=s, start=50)`.
+
+The uniform numbers are mapped to the values of each prior with `Prior.ppf`.
+
+This module also contains quasi-random and stratified designs (Sobol, Latin hypercube, grid), which
+cover the search space more evenly than independent random samples. These generate points in the
+unit hypercube, with one dimension per value sampled from a prior (see `num_dimensions`), which are
+then mapped to the values of each prior, in a vectorized way, with `from_unit_cube`.
+"""
+from __future__ import annotations
+
+import dataclasses
+import functools
+import inspect
+import math
+import typing
+import zlib
+from typing import Any, NamedTuple, Sequence
+
+from simple_parsing import utils
+
+from .priors import Prior
+from .search_space import get_search_space
+
+if typing.TYPE_CHECKING:
+    import numpy
+
+    from .hyperparameters import HyperParameters
+
+# Number of 64-bit outputs produced by each step of the counter of the Philox bit generator.
+_PHILOX_BLOCK_SIZE = 4
+
+
+def _key_of(name: str) -> int:
+    # NOTE: Use a stable hash of the field name (rather than its index), so that adding a field to
+    # a class doesn't change the samples of the other fields.
+    return zlib.crc32(name.encode())
+
+
+def random_entropy() -> int:
+    """Returns a new random seed, to use when no seed is passed."""
+    import numpy as np
+
+    return np.random.SeedSequence().entropy  # type: ignore
+
+
+def uniforms(seed: int, key: tuple[int, ...], n: int, size: int = 1, start: int = 0):
+    """Returns an array of shape `(n, size)` of uniform random numbers in [0, 1).
+
+    These are the samples `start` to `start + n` of the random stream identified by `seed` and
+    `key`, each sample being `size` consecutive numbers of the stream.
+    """
+    import numpy as np
+
+    sequence = np.random.SeedSequence(seed, spawn_key=key)
+    bit_generator = np.random.Philox(key=sequence.generate_state(2, np.uint64))
+    skip = start * size
+    bit_generator.advance(skip // _PHILOX_BLOCK_SIZE)
+    generator = np.random.Generator(bit_generator)
+    if skip % _PHILOX_BLOCK_SIZE:
+        generator.random(skip % _PHILOX_BLOCK_SIZE)
+    return generator.random(n * size).reshape(n, size)
+
+
+def sample_prior(
+    prior: Prior, n: int, seed: int, key: tuple[int, ...], start: int = 0
+) -> numpy.ndarray:
+    """Returns `n` samples of `prior` (from `Prior.ppf`), using the given random stream."""
+    return prior.ppf(uniforms(seed, key, n=n, size=prior.size, start=start))
+
+
+def sample_fields(
+    cls: type[HyperParameters], n: int, seed: int, key: tuple[int, ...], start: int = 0
+) -> dict[str, list[Any]]:
+    """Returns the sampled values of each field of `cls`, as a dict of columns of length `n`."""
+    columns: dict[str, list[Any]] = {}
+    for field in dataclasses.fields(cls):
+        if not field.init:
+            continue
+        field_key = key + (_key_of(field.name),)
+        options = _union_options(field.type)
+        if _is_hparams_class(field.type):
+            columns[field.name] = sample_batch(field.type, n, seed, field_key, start)
+        elif options:
+            chosen = (uniforms(seed, field_key, n, start=start)[:, 0] * len(options)).astype(int)
+            # NOTE: Each option is sampled with its own stream, so that the samples of an option
+            # don't depend on which options were chosen for the other samples.
+            values = [
+                sample_batch(option, n, seed, field_key + (i,), start)
+                for i, option in enumerate(options)
+            ]
+            columns[field.name] = [values[c][i] for i, c in enumerate(chosen.tolist())]
+        else:
+            prior: Prior | None = field.metadata.get("prior")
+            if prior is not None:
+                columns[field.name] = prior.to_values(
+                    sample_prior(prior, n, seed, field_key, start)
+                )
+    return columns
+
+
+def sample_batch(
+    cls: type[HyperParameters], n: int, seed: int, key: tuple[int, ...], start: int = 0
+) -> list[HyperParameters]:
+    columns = sample_fields(cls, n, seed, key, start)
+    return [cls(**{name: column[i] for name, column in columns.items()}) for i in range(n)]
+
+
+def _is_hparams_class(t: Any) -> bool:
+    from .hyperparameters import HyperParameters
+
+    return inspect.isclass(t) and issubclass(t, HyperParameters)
+
+
+def _union_options(t: Any) -> tuple[type[HyperParameters], ...] | None:
+    """Returns the options of a field annotated with a Union of HyperParameters classes."""
+    if utils.is_union(t):
+        options = utils.get_type_arguments(t)
+        if all(_is_hparams_class(option) for option in options):
+            return options
+    return None
+
+
+def num_dimensions(cls: type[HyperParameters]) -> int:
+    """Returns the number of dimensions of the unit hypercube used in `from_unit_cube`."""
+    return get_search_space(cls).num_dimensions
+
+
+def from_unit_cube(
+    cls: type[HyperParameters], u: numpy.ndarray, columnar: bool = False
+) -> list[HyperParameters] | dict[str, Any]:
+    """Maps points of the unit hypercube to instances of `cls`, using the `ppf` of each prior.
+
+    `u` is an array of shape `(n, num_dimensions(cls))`. The dimensions are assigned to the fields
+    in order, nested dataclasses included, each prior using `prior.size` dimensions, and fields
+    with a Union of HyperParameters classes using one dimension to choose the class.
+
+    When `columnar` is True, a dict with an array of values for each field is returned instead
+    (a nested dict for nested dataclasses, and an array of objects for Union fields).
+    """
+    columns, used = _unit_cube_columns(cls, u, 0)
+    if used != u.shape[1]:
+        raise ValueError(
+            f"Expected points with {used} dimensions for {cls.__qualname__}, got {u.shape[1]}."
+        )
+    if columnar:
+        return _values_columns(cls, columns)
+    return _instances(cls, columns, len(u))
+
+
+def _unit_cube_columns(
+    cls: type[HyperParameters], u: numpy.ndarray, offset: int
+) -> tuple[dict[str, Any], int]:
+    import numpy as np
+
+    columns: dict[str, Any] = {}
+    for field in dataclasses.fields(cls):
+        if not field.init:
+            continue
+        options = _union_options(field.type)
+        if _is_hparams_class(field.type):
+            columns[field.name], offset = _unit_cube_columns(field.type, u, offset)
+        elif options:
+            chosen = np.minimum((u[:, offset] * len(options)).astype(int), len(options) - 1)
+            offset += 1
+            values = []
+            for option in options:
+                option_columns, offset = _unit_cube_columns(option, u, offset)
+                values.append(_instances(option, option_columns, len(u)))
+            column = np.empty(len(u), dtype=object)
+            column[:] = [values[c][i] for i, c in enumerate(chosen.tolist())]
+            columns[field.name] = column
+        else:
+            prior: Prior | None = field.metadata.get("prior")
+            if prior is not None:
+                columns[field.name] = prior.ppf(u[:, offset : offset + prior.size])
+                offset += prior.size
+    return columns, offset
+
+
+def _instances(
+    cls: type[HyperParameters], columns: dict[str, Any], n: int
+) -> list[HyperParameters]:
+    values: dict[str, list[Any]] = {}
+    for field in dataclasses.fields(cls):
+        if field.name not in columns:
+            continue
+        column = columns[field.name]
+        if isinstance(column, dict):
+            values[field.name] = _instances(field.type, column, n)
+        elif _union_options(field.type):
+            values[field.name] = list(column)
+        else:
+            values[field.name] = field.metadata["prior"].to_values(column)
+    return [cls(**{name: column[i] for name, column in values.items()}) for i in range(n)]
+
+
+def _values_columns(cls: type[HyperParameters], columns: dict[str, Any]) -> dict[str, Any]:
+    import numpy as np
+
+    from .priors import CategoricalPrior
+
+    result: dict[str, Any] = {}
+    for field in dataclasses.fields(cls):
+        if field.name not in columns:
+            continue
+        column = columns[field.name]
+        prior = field.metadata.get("prior")
+        if isinstance(column, dict):
+            result[field.name] = _values_columns(field.type, column)
+        elif isinstance(prior, CategoricalPrior):
+            result[field.name] = np.asarray(prior.to_values(column))
+        else:
+            result[field.name] = column
+    return result
+
+
+def grid(
+    cls: type[HyperParameters], n: int | None = None, num_levels: int | None = 5
+) -> numpy.ndarray:
+    """Returns the points of a grid over the search space of `cls`, in the unit hypercube.
+
+    Priors with a finite set of values (discrete uniform priors with at most `num_levels` values,
+    categorical priors) use all their values, while the others use `num_levels` points.
+    The full grid is returned when `n` is None, otherwise `n` points evenly spread over the (lazily
+    indexed) full grid are returned.
+
+    The grid has a point for each configuration of the space of `space_size(cls, num_levels)`, in
+    the same order as `configs_at`. For fields with a Union of HyperParameters classes, only the
+    dimensions of the chosen class vary (the others are left at 0.5).
+    """
+    import numpy as np
+
+    total = math.prod(size for _, size in _field_sizes(cls, num_levels))
+    if n is None or n >= total:
+        indices: Sequence[int] = range(total)
+    else:
+        indices = [i * total // n for i in range(n)]
+    return _grid_points(cls, np.array(indices, dtype=object), num_levels)
+
+
+def _grid_points(
+    cls: type[HyperParameters], indices: numpy.ndarray, num_levels: int | None
+) -> numpy.ndarray:
+    import numpy as np
+
+    field_sizes = _field_sizes(cls, num_levels)
+    digits = unflatten_indices(indices, [size for _, size in field_sizes])
+    blocks: list[numpy.ndarray] = [np.empty((len(indices), 0))]
+    for (field, _), field_digits in zip(field_sizes, digits):
+        options = _union_options(field.type)
+        if _is_hparams_class(field.type):
+            blocks.append(_grid_points(field.type, field_digits, num_levels))
+        elif options:
+            choice = np.empty((len(indices), 1))
+            option_blocks = [np.full((len(indices), num_dimensions(o)), 0.5) for o in options]
+            start = 0
+            for i, (option, option_block) in enumerate(zip(options, option_blocks)):
+                option_size = space_size(option, num_levels)
+                assert option_size is not None
+                positions = np.flatnonzero(
+                    (field_digits >= start) & (field_digits < start + option_size)
+                )
+                choice[positions] = (i + 0.5) / len(options)
+                option_block[positions] = _grid_points(
+                    option, field_digits[positions] - start, num_levels
+                )
+                start += option_size
+            blocks.append(choice)
+            blocks.extend(option_blocks)
+        else:
+            prior: Prior = field.metadata["prior"]
+            unit_grid = prior.unit_grid(num_levels)
+            element_digits = unflatten_indices(field_digits, [len(unit_grid)] * prior.size)
+            blocks.append(np.stack([unit_grid[d] for d in element_digits], axis=1))
+    return np.concatenate(blocks, axis=1)
+
+
+def unflatten_indices(indices: Sequence[int], radices: Sequence[int]) -> list[numpy.ndarray]:
+    """Converts flat indices into a mixed-radix index space into the digits for each dimension.
+
+    The last dimension varies the fastest, like in `itertools.product`. This works with arbitrarily
+    large index spaces, since the indices are python integers.
+    """
+    import numpy as np
+
+    remainders = np.array(indices, dtype=object)
+    digits: list[numpy.ndarray] = [None] * len(radices)  # type: ignore
+    for dim in reversed(range(len(radices))):
+        # NOTE: The digits stay python integers if they might not fit in an int64.
+        digits[dim] = (remainders % radices[dim]).astype(
+            np.int64 if radices[dim] <= 2**63 else object
+        )
+        remainders = remainders // radices[dim]
+    return digits
+
+
+def latin_hypercube(n: int, d: int, seed: int | None = None) -> numpy.ndarray:
+    """Returns a Latin hypercube design of `n` points in `[0, 1)^d`.
+
+    Each of the `n` equal intervals of each dimension contains exactly one point.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    strata = rng.permuted(np.tile(np.arange(n), (d, 1)), axis=1).T
+    return (strata + rng.random((n, d))) / n
+
+
+# The number of bits of precision of the points of the Sobol sequence. This also limits the number
+# of points to 2**32.
+_SOBOL_BITS = 32
+
+# Initial direction numbers of the first dimensions of the Sobol sequence (after the first one),
+# from S. Joe and F. Y. Kuo, "Constructing Sobol sequences with better two-dimensional
+# projections" (2008). Each entry corresponds to the next primitive polynomial, by degree.
+_SOBOL_INITIAL_DIRECTION_NUMBERS = (
+    (1,),
+    (1, 3),
+    (1, 3, 1),
+    (1, 1, 1),
+    (1, 1, 3, 3),
+    (1, 3, 5, 13),
+    (1, 1, 5, 5, 17),
+    (1, 1, 5, 5, 5),
+    (1, 1, 7, 11, 19),
+    (1, 1, 5, 1, 1),
+    (1, 1, 1, 3, 11),
+    (1, 3, 5, 5, 31),
+    (1, 3, 3, 9, 7, 49),
+    (1, 1, 1, 15, 21, 21),
+    (1, 3, 1, 13, 27, 49),
+    (1, 1, 1, 15, 7, 5),
+    (1, 3, 1, 15, 13, 25),
+    (1, 1, 5, 5, 19, 61),
+    (1, 3, 7, 11, 23, 15, 103),
+    (1, 3, 7, 13, 13, 15, 69),
+)
+
+
+def _primitive_polynomials():
+    """Yields the primitive polynomials over GF(2) as (degree, coefficients), by degree.
+
+    The coefficients are the bits of the polynomial, except for the leading and constant terms.
+    """
+    degree = 1
+    while True:
+        order = 2**degree - 1
+        prime_factors = [p for p in range(2, order + 1) if order % p == 0 and _is_prime(p)]
+        for coefficients in range(2 ** (degree - 1)):
+            polynomial = (1 << degree) | (coefficients << 1) | 1
+            if _power_of_x_mod(order, polynomial) == 1 and all(
+                _power_of_x_mod(order // p, polynomial) != 1 for p in prime_factors
+            ):
+                yield degree, coefficients
+        degree += 1
+
+
+def _is_prime(n: int) -> bool:
+    return n > 1 and all(n % p for p in range(2, math.isqrt(n) + 1))
+
+
+def _power_of_x_mod(exponent: int, polynomial: int) -> int:
+    """Computes x**exponent modulo `polynomial`, with polynomials over GF(2) as bits of ints."""
+    degree = polynomial.bit_length() - 1
+
+    def mul_mod(a: int, b: int) -> int:
+        result = 0
+        while b:
+            if b & 1:
+                result ^= a
+            b >>= 1
+            a <<= 1
+            if a >> degree:
+                a ^= polynomial
+        return result
+
+    result, base = 1, 2 % polynomial
+    while exponent:
+        if exponent & 1:
+            result = mul_mod(result, base)
+        base = mul_mod(base, base)
+        exponent >>= 1
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _sobol_direction_numbers(d: int) -> numpy.ndarray:
+    """Returns the direction numbers of the first `d` dimensions of the Sobol sequence."""
+    import numpy as np
+
+    directions = np.zeros((d, _SOBOL_BITS), dtype=np.uint64)
+    # The first dimension is the van der Corput sequence.
+    directions[0] = [1 << (_SOBOL_BITS - 1 - j) for j in range(_SOBOL_BITS)]
+    # NOTE: The dimensions after the ones from the table use random (odd) initial direction
+    # numbers, which are still valid, but don't have optimized two-dimensional projections.
+    rng = np.random.default_rng(0)
+    polynomials = _primitive_polynomials()
+    for dim in range(1, d):
+        degree, coefficients = next(polynomials)
+        if dim <= len(_SOBOL_INITIAL_DIRECTION_NUMBERS):
+            m = _SOBOL_INITIAL_DIRECTION_NUMBERS[dim - 1]
+        else:
+            m = tuple(2 * int(rng.integers(2**k)) + 1 for k in range(degree))
+        v = [m_k << (_SOBOL_BITS - 1 - k) for k, m_k in enumerate(m[:_SOBOL_BITS])]
+        for j in range(degree, _SOBOL_BITS):
+            value = v[j - degree] ^ (v[j - degree] >> degree)
+            for k in range(1, degree):
+                if (coefficients >> (degree - 1 - k)) & 1:
+                    value ^= v[j - k]
+            v.append(value)
+        directions[dim] = v
+    return directions
+
+
+def sobol(
+    n: int, d: int, seed: int | None = None, start: int = 0, scramble: bool = True
+) -> numpy.ndarray:
+    """Returns the points `start` to `start + n` of the Sobol sequence in `[0, 1)^d`.
+
+    The Sobol sequence is a low-discrepancy sequence: its first `2**k` points are evenly spread,
+    with exactly one point in each of the `2**k` equal intervals of each dimension.
+    When `scramble` is True, a random digital shift (which preserves this property) derived from
+    `seed` is applied to the points, so that different seeds give different designs.
+
+    >>> sobol(4, 2, scramble=False).tolist()
+    [[0.0, 0.0], [0.5, 0.5], [0.75, 0.25], [0.25, 0.75]]
+    """
+    import numpy as np
+
+    if start + n > 2**_SOBOL_BITS:
+        raise ValueError(f"Can't generate more than {2**_SOBOL_BITS} points of a Sobol sequence.")
+    directions = _sobol_direction_numbers(d)
+    index = np.arange(start, start + n, dtype=np.uint64)
+    # NOTE: The points are generated in Gray code order, which gives the same set of points.
+    gray_code = index ^ (index >> np.uint64(1))
+    points = np.zeros((n, d), dtype=np.uint64)
+    for j in range(int(gray_code.max(initial=0)).bit_length()):
+        bit_set = ((gray_code >> np.uint64(j)) & np.uint64(1)).astype(bool)
+        points[bit_set] ^= directions[:, j]
+    if scramble:
+        shift = np.random.default_rng(seed).integers(2**_SOBOL_BITS, size=d, dtype=np.uint64)
+        points ^= shift
+    return points / 2.0**_SOBOL_BITS
+
+
+def space_size(cls: type[HyperParameters], num_levels: int | None = None) -> int | None:
+    """Returns the number of distinct configurations of `cls`, or None if it is infinite.
+
+    The space is finite when all the priors have a finite set of values (discrete uniform priors
+    and categorical priors), or when `num_levels` is set, in which case the other priors are
+    discretized into `num_levels` values (see `Prior.unit_grid`). Fields with a Union of
+    HyperParameters classes contribute the sum of the sizes of the spaces of each class.
+    """
+    if num_levels is None:
+        # NOTE: This is stored in the search space of the class, so it's only computed once.
+        return get_search_space(cls).size
+    return _space_size(cls, num_levels)
+
+
+def _space_size(cls: type[HyperParameters], num_levels: int | None) -> int | None:
+    try:
+        field_sizes = _field_sizes(cls, num_levels)
+    except ValueError:
+        return None
+    return math.prod(size for _, size in field_sizes)
+
+
+def _field_sizes(
+    cls: type[HyperParameters], num_levels: int | None
+) -> list[tuple[dataclasses.Field, int]]:
+    """Returns the number of values of each field of `cls` in its (finite) search space.
+
+    Raises a ValueError if the space isn't finite.
+    """
+    sizes: list[tuple[dataclasses.Field, int]] = []
+    for field in dataclasses.fields(cls):
+        if not field.init:
+            continue
+        options = _union_options(field.type)
+        if _is_hparams_class(field.type):
+            size = math.prod(s for _, s in _field_sizes(field.type, num_levels))
+        elif options:
+            size = sum(
+                math.prod(s for _, s in _field_sizes(option, num_levels)) for option in options
+            )
+        elif field.metadata.get("prior") is not None:
+            prior: Prior = field.metadata["prior"]
+            size = len(prior.unit_grid(num_levels)) ** prior.size
+        else:
+            continue
+        sizes.append((field, size))
+    return sizes
+
+
+def configs_at(
+    cls: type[HyperParameters], indices: Sequence[int], num_levels: int | None = None
+) -> list[HyperParameters]:
+    """Returns the configurations at the given indices of the (finite) search space of `cls`.
+
+    The space is indexed in mixed radix, with one digit per field, the last field varying the
+    fastest. The cost doesn't depend on the indices, and the space is never materialized.
+    """
+    import numpy as np
+
+    size = space_size(cls, num_levels)
+    if size is None:
+        raise ValueError(
+            f"The search space of {cls.__qualname__} isn't finite, pass `num_levels` to "
+            f"discretize the continuous priors."
+        )
+    indices = np.array(indices, dtype=object).reshape(-1)
+    if len(indices) and not ((0 <= indices) & (indices < size)).all():
+        raise IndexError(f"Indices out of range for a space of {size} configurations.")
+    return _instances(cls, _space_columns(cls, indices, num_levels), len(indices))
+
+
+def _space_columns(
+    cls: type[HyperParameters], indices: numpy.ndarray, num_levels: int | None
+) -> dict[str, Any]:
+    import numpy as np
+
+    field_sizes = _field_sizes(cls, num_levels)
+    digits = unflatten_indices(indices, [size for _, size in field_sizes])
+    columns: dict[str, Any] = {}
+    for (field, _), field_digits in zip(field_sizes, digits):
+        options = _union_options(field.type)
+        if _is_hparams_class(field.type):
+            columns[field.name] = _space_columns(field.type, field_digits, num_levels)
+        elif options:
+            column = np.empty(len(indices), dtype=object)
+            start = 0
+            for option in options:
+                option_size = space_size(option, num_levels)
+                assert option_size is not None
+                positions = np.flatnonzero(
+                    (field_digits >= start) & (field_digits < start + option_size)
+                )
+                option_indices = field_digits[positions] - start
+                option_columns = _space_columns(option, option_indices, num_levels)
+                for position, value in zip(
+                    positions, _instances(option, option_columns, len(positions))
+                ):
+                    column[position] = value
+                start += option_size
+            columns[field.name] = column
+        else:
+            prior: Prior = field.metadata["prior"]
+            unit_grid = prior.unit_grid(num_levels)
+            element_digits = unflatten_indices(field_digits, [len(unit_grid)] * prior.size)
+            u = np.stack([unit_grid[d] for d in element_digits], axis=1).reshape(-1, prior.size)
+            columns[field.name] = prior.ppf(u)
+    return columns
+
+
+def enumerate_space(
+    cls: type[HyperParameters],
+    shard: int = 0,
+    num_shards: int = 1,
+    num_levels: int | None = None,
+    chunk_size: int = 1024,
+) -> typing.Iterator[HyperParameters]:
+    """Lazily yields the configurations of the (finite) search space of `cls` in shard `shard`.
+
+    Shard `i` out of `N` contains the configurations at indices `i, i + N, i + 2 * N, ...`, so the
+    shards are disjoint, cover the whole space, and have sizes that differ by at most one.
+    """
+    if not 0 <= shard < num_shards:
+        raise ValueError(f"Invalid shard {shard} for {num_shards} shards.")
+    size = space_size(cls, num_levels)
+    if size is None:
+        raise ValueError(
+            f"The search space of {cls.__qualname__} isn't finite, pass `num_levels` to "
+            f"discretize the continuous priors."
+        )
+    indices = range(shard, size, num_shards)
+    for chunk_start in range(0, len(indices), chunk_size):
+        yield from configs_at(cls, indices[chunk_start : chunk_start + chunk_size], num_levels)
+
+
+class ArrayBounds(NamedTuple):
+    """The bounds of each column of the arrays of values of a HyperParameters class.
+
+    The columns are the same as the dimensions of `from_unit_cube`: one per value sampled from a
+    prior (each element of a prior with a shape has its own column), in the order of the fields,
+    nested dataclasses included. Categorical priors, and the choice of class for fields with a
+    Union of HyperParameters classes, use the index of the chosen value.
+    """
+
+    names: tuple[str, ...]
+    """The name of each column, e.g. "lr", "child.foo", "sizes[1]" or "model.Transformer.depth"."""
+    lower: numpy.ndarray
+    upper: numpy.ndarray
+    integral: numpy.ndarray
+    """Whether the values of each column are integers (discrete priors and indices)."""
+
+
+def array_bounds(cls: type[HyperParameters]) -> ArrayBounds:
+    """Returns the (read-only) bound arrays of `cls`, which are computed once per class."""
+    # NOTE: This is stored in the search space of the class, so it's only computed once.
+    return get_search_space(cls).array_bounds
+
+
+def _array_bounds(cls: type[HyperParameters]) -> ArrayBounds:
+    import numpy as np
+
+    rows = _bounds_rows(cls, prefix="")
+    names = tuple(row[0] for row in rows)
+    lower = np.array([row[1] for row in rows], dtype=float)
+    upper = np.array([row[2] for row in rows], dtype=float)
+    integral = np.array([row[3] for row in rows], dtype=bool)
+    for array in (lower, upper, integral):
+        array.flags.writeable = False
+    return ArrayBounds(names, lower, upper, integral)
+
+
+def _bounds_rows(cls: type[HyperParameters], prefix: str) -> list[tuple[str, float, float, bool]]:
+    rows: list[tuple[str, float, float, bool]] = []
+    for field in dataclasses.fields(cls):
+        if not field.init:
+            continue
+        name = prefix + field.name
+        options = _union_options(field.type)
+        if _is_hparams_class(field.type):
+            rows.extend(_bounds_rows(field.type, prefix=name + "."))
+        elif options:
+            rows.append((name, 0, len(options) - 1, True))
+            for option in options:
+                rows.extend(_bounds_rows(option, prefix=f"{name}.{option.__name__}."))
+        elif field.metadata.get("prior") is not None:
+            prior: Prior = field.metadata["prior"]
+            low, high = prior.bounds()
+            if prior.size == 1 and not getattr(prior, "shape", None):
+                rows.append((name, low, high, prior.integral))
+            else:
+                rows.extend((f"{name}[{i}]", low, high, prior.integral) for i in range(prior.size))
+    return rows
+
+
+def clip_array(
+    cls: type[HyperParameters], array: numpy.ndarray, out: numpy.ndarray | None = None
+) -> numpy.ndarray:
+    """Clips the values in `array` within the bounds of `cls`, and rounds the integral columns.
+
+    `array` has a row of values for each configuration (or is a single row), with the columns
+    described in `ArrayBounds`. Pass `out=array` to modify the array in-place.
+    """
+    import numpy as np
+
+    bounds = array_bounds(cls)
+    if array.shape[-1] != len(bounds.names):
+        raise ValueError(
+            f"Expected arrays with {len(bounds.names)} columns for {cls.__qualname__}, got "
+            f"shape {array.shape}."
+        )
+    result = np.clip(array, bounds.lower, bounds.upper, out=out)
+    if bounds.integral.any():
+        result[..., bounds.integral] = np.round(result[..., bounds.integral])
+    return result
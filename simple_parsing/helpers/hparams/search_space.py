@@ -0,0 +1,173 @@
+"""Immutable, flattened views of the search space of `HyperParameters` classes.
+
+The views are computed once per class (the first time they are needed), and stored on the class
+itself, so they are recomputed only if the class is redefined.
+"""
+from __future__ import annotations
+
+import dataclasses
+import functools
+import inspect
+import types
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Mapping
+
+from simple_parsing import utils
+from simple_parsing.utils import compute_identity
+
+from .priors import Prior
+
+if TYPE_CHECKING:
+    from .sampling import ArrayBounds
+
+# Name of the attribute where the search space of each class is stored.
+_SEARCH_SPACE_ATTRIBUTE = "_search_space"
+
+
+@dataclass(frozen=True)
+class SearchSpace:
+    """The search space of a `HyperParameters` class, flattened.
+
+    >>> from simple_parsing.helpers.hparams import HyperParameters, categorical, uniform
+    >>> @dataclass
+    ... class Config(HyperParameters):
+    ...     layers: int = uniform(1, 3, discrete=True)
+    ...     optimizer: str = categorical("sgd", "adam", default="sgd")
+    ...     lr: float = uniform(0.0, 1.0, default=0.1)
+    >>> space = Config.get_search_space()
+    >>> list(space.priors)
+    ['layers', 'optimizer', 'lr']
+    >>> space.size is None, space.num_dimensions
+    (True, 3)
+    >>> space is Config.get_search_space()
+    True
+    """
+
+    hparams_type: type
+    """The HyperParameters class."""
+
+    priors: Mapping[str, Prior]
+    """The priors of all the fields, with dotted names for the fields of nested dataclasses.
+
+    The fields of the classes of a Union field `name` are prefixed with `name.<class name>.`.
+    """
+
+    unions: Mapping[str, tuple[type, ...]]
+    """The classes of each field with a Union of HyperParameters classes."""
+
+    priors_dict: Mapping[str, Any] = dataclasses.field(repr=False)
+    """The (nested) dict of priors returned by `HyperParameters.get_priors`."""
+
+    @property
+    def size(self) -> int | None:
+        """The number of distinct configurations, or None if the space is infinite."""
+        return self._size
+
+    @property
+    def num_dimensions(self) -> int:
+        """The number of values sampled from priors (see `sampling.from_unit_cube`)."""
+        return len(self.unions) + sum(prior.size for prior in self.priors.values())
+
+    @functools.cached_property
+    def _size(self) -> int | None:
+        from .sampling import _space_size
+
+        return _space_size(self.hparams_type, num_levels=None)
+
+    @functools.cached_property
+    def array_bounds(self) -> ArrayBounds:
+        """The bounds of the columns of the arrays of values (see `sampling.ArrayBounds`)."""
+        from .sampling import _array_bounds
+
+        return _array_bounds(self.hparams_type)
+
+    @functools.cached_property
+    def orion_space_dict(self) -> Mapping[str, Any]:
+        """The (nested) dict of Orion space strings, see `HyperParameters.get_orion_space_dict`."""
+        return _freeze(_orion_space_dict(self.hparams_type))
+
+    @functools.cached_property
+    def id(self) -> str:
+        """An identifier of this search space (see `HyperParameters.space_id`)."""
+        return compute_identity(**_thaw(self.orion_space_dict))
+
+
+def get_search_space(cls: type) -> SearchSpace:
+    """Returns the search space of a HyperParameters class, which is only computed once."""
+    space = cls.__dict__.get(_SEARCH_SPACE_ATTRIBUTE)
+    if space is None:
+        priors: dict[str, Prior] = {}
+        unions: dict[str, tuple[type, ...]] = {}
+        _flatten(cls, "", priors, unions)
+        space = SearchSpace(
+            hparams_type=cls,
+            priors=types.MappingProxyType(priors),
+            unions=types.MappingProxyType(unions),
+            priors_dict=_freeze(_priors_dict(cls)),
+        )
+        # NOTE: Stored on the class itself (rather than in a dict indexed by class), so that a
+        # redefined class gets a new search space.
+        setattr(cls, _SEARCH_SPACE_ATTRIBUTE, space)
+    return space
+
+
+def _is_hparams_class(t: Any) -> bool:
+    from .hyperparameters import HyperParameters
+
+    return inspect.isclass(t) and issubclass(t, HyperParameters)
+
+
+def _flatten(
+    cls: type, prefix: str, priors: dict[str, Prior], unions: dict[str, tuple[type, ...]]
+) -> None:
+    for field in dataclasses.fields(cls):
+        if not field.init:
+            continue
+        name = prefix + field.name
+        if _is_hparams_class(field.type):
+            _flatten(field.type, name + ".", priors, unions)
+        elif utils.is_union(field.type) and all(
+            _is_hparams_class(t) for t in utils.get_type_arguments(field.type)
+        ):
+            options = utils.get_type_arguments(field.type)
+            unions[name] = options
+            for option in options:
+                _flatten(option, f"{name}.{option.__name__}.", priors, unions)
+        elif field.metadata.get("prior") is not None:
+            priors[name] = field.metadata["prior"]
+
+
+def _priors_dict(cls: type) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    for field in dataclasses.fields(cls):
+        # If a HyperParameters class contains another HyperParameters class as a field
+        # we perform returned a flattened dict.
+        if _is_hparams_class(field.type):
+            result[field.name] = _priors_dict(field.type)
+        else:
+            prior: Prior | None = field.metadata.get("prior")
+            if prior:
+                result[field.name] = prior
+    return result
+
+
+def _orion_space_dict(cls: type) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    for field in dataclasses.fields(cls):
+        if _is_hparams_class(field.type):
+            result[field.name] = _orion_space_dict(field.type)
+        else:
+            prior: Prior | None = field.metadata.get("prior")
+            if prior:
+                result[field.name] = prior.get_orion_space_string()
+    return result
+
+
+def _freeze(d: dict[str, Any]) -> Mapping[str, Any]:
+    frozen = {k: _freeze(v) if isinstance(v, dict) else v for k, v in d.items()}
+    return types.MappingProxyType(frozen)
+
+
+def _thaw(d: Mapping[str, Any]) -> dict[str, Any]:
+    """Returns a (mutable) copy of a frozen nested dict."""
+    return {k: _thaw(v) if isinstance(v, Mapping) else v for k, v in d.items()}
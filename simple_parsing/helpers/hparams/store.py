@@ -0,0 +1,200 @@
+"""Append-only store of trials (configurations and their metrics), indexed by config fingerprint.
+
+The trials are stored in a SQLite database (from the standard library), with the fingerprint of
+each configuration (see `HyperParameters.id`) as the primary key, and an index over the values of
+each metric. This makes it possible to check whether a configuration was already run, get its
+results, or get the best trials, without loading all the trials. SQLite locks the database file
+during writes, so several local processes can append trials concurrently.
+"""
+from __future__ import annotations
+
+import json
+import math
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Generic, Iterator, Mapping, NamedTuple
+
+from simple_parsing.helpers.serialization.encoding import encode
+
+from .hyperparameters import HP
+
+if TYPE_CHECKING:
+    import sqlite3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trials (
+    fingerprint INTEGER PRIMARY KEY,
+    config TEXT NOT NULL,
+    metrics TEXT NOT NULL,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    name TEXT NOT NULL,
+    value REAL NOT NULL,
+    fingerprint INTEGER NOT NULL REFERENCES trials(fingerprint),
+    PRIMARY KEY (name, value, fingerprint)
+) WITHOUT ROWID;
+"""
+
+
+class Trial(NamedTuple):
+    """A trial from a `TrialStore`."""
+
+    hparams: Any
+    metrics: dict[str, float]
+    created: float
+    """The time at which the trial was added to the store (as returned by `time.time()`)."""
+
+
+class TrialStore(Generic[HP]):
+    """Append-only, indexed store of the trials of a `HyperParameters` class, in a SQLite file.
+
+    >>> import tempfile
+    >>> from dataclasses import dataclass
+    >>> from simple_parsing.helpers.hparams import HyperParameters, uniform
+    >>> @dataclass
+    ... class Config(HyperParameters):
+    ...     lr: float = uniform(0.0, 1.0)
+    >>> with tempfile.TemporaryDirectory() as tmp_dir:
+    ...     with TrialStore(Config, f"{tmp_dir}/trials.sqlite") as store:
+    ...         store.add(Config(lr=0.1), {"loss": 0.5})
+    ...         store.add(Config(lr=0.2), {"loss": 0.3})
+    ...         store.add(Config(lr=0.1), {"loss": 0.4})  # Already in the store.
+    ...         print(Config(lr=0.2) in store, store.get(Config(lr=0.1)).metrics)
+    ...         print([trial.hparams for trial in store.top_k(1, "loss")])
+    True
+    True
+    False
+    True {'loss': 0.5}
+    [Config(lr=0.2)]
+    """
+
+    def __init__(self, hparams_type: type[HP], path: str | Path, timeout: float = 60.0):
+        """
+        Parameters
+        ----------
+        hparams_type : type[HP]
+            The type of HyperParameters of the trials.
+        path : str | Path
+            The path of the database file. It is created if it doesn't exist.
+        timeout : float, optional
+            How long to wait (in seconds) for other processes to release their lock on the
+            database before failing, by default 60.
+        """
+        # NOTE: Imported here, so that importing simple_parsing doesn't import sqlite3.
+        import sqlite3
+
+        self.hparams_type = hparams_type
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # NOTE: The connection is shared between threads, so its use is serialized with a lock.
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            self.path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        with self._lock:
+            # NOTE: With the write-ahead log, readers don't block the writers (and vice-versa).
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+
+    def add(self, hparams: HP, metrics: Mapping[str, float]) -> bool:
+        """Adds a trial. Returns False (and doesn't add it) if the config was already run."""
+        config = json.dumps(hparams.to_dict(), default=_json_default, sort_keys=True)
+        metrics = {name: float(value) for name, value in metrics.items()}
+        fingerprint = _key(hparams)
+        with self._lock:
+            cursor = self._connection.cursor()
+            # NOTE: Take the write lock right away, so that the check and the insert are atomic.
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.execute(
+                    "INSERT OR IGNORE INTO trials VALUES (?, ?, ?, ?)",
+                    (fingerprint, config, json.dumps(metrics), time.time()),
+                )
+                added = cursor.rowcount == 1
+                if added:
+                    # NOTE: SQLite stores NaNs as NULL, so the non-finite values are only kept in
+                    # the metrics of the trial, and aren't indexed.
+                    cursor.executemany(
+                        "INSERT INTO metrics VALUES (?, ?, ?)",
+                        [
+                            (name, value, fingerprint)
+                            for name, value in metrics.items()
+                            if math.isfinite(value)
+                        ],
+                    )
+                cursor.execute("COMMIT")
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+        return added
+
+    def __contains__(self, hparams: HP) -> bool:
+        row = self._fetch_one("SELECT 1 FROM trials WHERE fingerprint = ?", _key(hparams))
+        return row is not None
+
+    def get(self, hparams: HP) -> Trial | None:
+        """Returns the trial of this configuration, or None if it wasn't run."""
+        row = self._fetch_one(
+            "SELECT config, metrics, created FROM trials WHERE fingerprint = ?", _key(hparams)
+        )
+        return None if row is None else self._to_trial(*row)
+
+    def top_k(self, k: int, metric: str, minimize: bool = True) -> list[Trial]:
+        """Returns the `k` best trials according to the given metric, best first.
+
+        The trials without this metric (or with a non-finite value for it) are ignored.
+        """
+        order = "ASC" if minimize else "DESC"
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT trials.config, trials.metrics, trials.created FROM metrics "
+                "JOIN trials ON trials.fingerprint = metrics.fingerprint "
+                f"WHERE metrics.name = ? ORDER BY metrics.value {order} LIMIT ?",
+                (metric, k),
+            ).fetchall()
+        return [self._to_trial(*row) for row in rows]
+
+    def __len__(self) -> int:
+        return self._fetch_one("SELECT COUNT(*) FROM trials")[0]
+
+    def __iter__(self) -> Iterator[Trial]:
+        """Iterates over all the trials, in the order they were added."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT config, metrics, created FROM trials ORDER BY created"
+            ).fetchall()
+        return (self._to_trial(*row) for row in rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> TrialStore[HP]:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _fetch_one(self, query: str, *params: Any) -> tuple | None:
+        with self._lock:
+            return self._connection.execute(query, params).fetchone()
+
+    def _to_trial(self, config: str, metrics: str, created: float) -> Trial:
+        return Trial(self.hparams_type.from_dict(json.loads(config)), json.loads(metrics), created)
+
+
+def _key(hparams: Any) -> int:
+    # NOTE: The 64-bit fingerprint is stored as a signed integer, which is what SQLite supports.
+    return int.from_bytes(bytes.fromhex(hparams.id()), "big", signed=True)
+
+
+def _json_default(value: Any) -> Any:
+    # NOTE: Converts numpy arrays and scalars (e.g. from priors with a shape) to lists and numbers.
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    encoded = encode(value)
+    if encoded is value:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+    return encoded
@@ -0,0 +1,88 @@
+import math
+import multiprocessing
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from .hparam import categorical, uniform
+from .hyperparameters import HyperParameters
+from .store import TrialStore
+
+pytest.importorskip("numpy")
+
+
+@dataclass
+class Config(HyperParameters):
+    a: int = uniform(0, 100, discrete=True)
+    b: str = categorical("foo", "bar", default="foo")
+
+
+def test_add_and_get(tmp_path: Path):
+    with TrialStore(Config, tmp_path / "trials.sqlite") as store:
+        assert store.add(Config(a=1), {"loss": 0.5, "accuracy": 0.9})
+        assert not store.add(Config(a=1), {"loss": 0.1})
+        assert len(store) == 1
+        assert Config(a=1) in store
+        assert Config(a=2) not in store
+        trial = store.get(Config(a=1))
+        assert trial.hparams == Config(a=1)
+        assert trial.metrics == {"loss": 0.5, "accuracy": 0.9}
+        assert store.get(Config(a=1, b="bar")) is None
+
+
+def test_top_k(tmp_path: Path):
+    with TrialStore(Config, tmp_path / "trials.sqlite") as store:
+        for a in range(20):
+            metrics = {"loss": (a - 7) ** 2 + a / 100} if a % 2 else {"accuracy": a}
+            store.add(Config(a=a), metrics)
+        assert [t.hparams.a for t in store.top_k(3, "loss")] == [7, 5, 9]
+        assert [t.hparams.a for t in store.top_k(2, "loss", minimize=False)] == [19, 17]
+        assert [t.hparams.a for t in store.top_k(2, "accuracy", minimize=False)] == [18, 16]
+        assert store.top_k(5, "other") == []
+
+
+def test_non_finite_metrics(tmp_path: Path):
+    with TrialStore(Config, tmp_path / "trials.sqlite") as store:
+        assert store.add(Config(a=1), {"loss": float("nan"), "accuracy": 0.5})
+        assert store.add(Config(a=2), {"loss": float("inf")})
+        assert store.add(Config(a=3), {"loss": 1.0})
+        assert math.isnan(store.get(Config(a=1)).metrics["loss"])
+        assert store.get(Config(a=2)).metrics == {"loss": float("inf")}
+        # The non-finite values aren't indexed.
+        assert [t.hparams.a for t in store.top_k(3, "loss", minimize=False)] == [3]
+        assert [t.hparams.a for t in store.top_k(3, "accuracy")] == [1]
+
+
+def test_persists_between_stores(tmp_path: Path):
+    path = tmp_path / "trials.sqlite"
+    with TrialStore(Config, path) as store:
+        store.add(Config(a=1), {"loss": 1.0})
+        store.add(Config(a=2), {"loss": 2.0})
+    with TrialStore(Config, path) as store:
+        assert [trial.hparams for trial in store] == [Config(a=1), Config(a=2)]
+        assert not store.add(Config(a=2), {"loss": 0.0})
+
+
+def _add_trials(path: Path, worker: int) -> None:
+    with TrialStore(Config, path) as store:
+        for a in range(50):
+            # Every worker tries to add the same configs, with different metrics.
+            store.add(Config(a=a, b="bar" if a % 2 else "foo"), {"loss": a + worker / 10})
+
+
+def test_concurrent_processes(tmp_path: Path):
+    path = tmp_path / "trials.sqlite"
+    TrialStore(Config, path).close()
+    processes = [
+        multiprocessing.Process(target=_add_trials, args=(path, worker)) for worker in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+    with TrialStore(Config, path) as store:
+        assert len(store) == 50
+        assert len({trial.hparams.id() for trial in store}) == 50
+        assert store.top_k(1, "loss")[0].hparams == Config(a=0)
@@ -1,9 +1,15 @@
 from .decoding import *
 from .encoding import *
+from .fingerprint import fingerprint, register_fingerprint_fn, update_fingerprint
+from .records import RecordFile, RecordsExtension, load_records, save_records
 from .serializable import (
     FrozenSerializable,
+    LoadError,
     Serializable,
     SerializableMixin,
+    aload,
+    aload_all,
+    asave,
     dump,
     dump_json,
     dump_yaml,
@@ -12,8 +18,10 @@ from .serializable import (
     dumps_yaml,
     from_dict,
     load,
+    load_all,
     load_json,
     load_yaml,
+    register_dc_types,
     save,
     save_json,
     save_yaml,
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import inspect
-import sys
+import threading
 import warnings
+import weakref
 from collections import OrderedDict
 from collections.abc import Mapping
 from dataclasses import Field
@@ -58,6 +59,35 @@ def _register(t: type, func: Callable, overwrite: bool = False) -> None:
     if t not in _decoding_fns or overwrite:
         # logger.debug(f"Registering the type {t} with decoding function {func}")
         _decoding_fns[t] = func
+        _field_decoding_fns.clear()
+
+
+# The resolved type and decoding function of the fields of each dataclass, indexed by field name.
+# NOTE: This is cleared whenever a new decoding function is registered.
+_field_decoding_fns: weakref.WeakKeyDictionary[
+    type, dict[str, tuple[Field, Any, Callable]]
+] = weakref.WeakKeyDictionary()
+
+
+def _get_field_decoding_fn(
+    field: Field, containing_dataclass: type | None
+) -> tuple[Any, Callable[..., Any]]:
+    """Returns the (evaluated) type annotation of the field, and the function to decode it."""
+    fields_cache = (
+        _field_decoding_fns.setdefault(containing_dataclass, {})
+        if containing_dataclass is not None
+        else {}
+    )
+    cached = fields_cache.get(field.name)
+    if cached is not None and cached[0] is field:
+        return cached[1], cached[2]
+
+    field_type = field.type
+    if isinstance(field_type, str) and containing_dataclass:
+        field_type = evaluate_string_annotation(field_type, containing_dataclass)
+    decoding_function = get_decoding_fn(field_type)
+    fields_cache[field.name] = (field, field_type, decoding_function)
+    return field_type, decoding_function
 
 
 C = TypeVar("C", bound=Callable[[Any], Any])
@@ -76,13 +106,30 @@ def decoding_fn_for_type(some_type: type) -> Callable[[C], C]:
     return _wrapper
 
 
+# Per-thread state of `decode_field`: whether an unsafe cast occurred while decoding the current
+# field (or None when not decoding a field).
+_decoding_state = threading.local()
+
+
+def _unsafe_cast(raw_value: Any, decoded_value: Any) -> None:
+    """Reports that a lossy cast was performed when decoding `raw_value`.
+
+    Inside `decode_field`, this marks the field as unsafely casted, which results in a single
+    warning for the field. Otherwise, an `UnsafeCastingWarning` is emitted.
+    """
+    if getattr(_decoding_state, "unsafe_cast", None) is None:
+        warnings.warn(UnsafeCastingWarning(raw_value=raw_value, decoded_value=decoded_value))
+    else:
+        _decoding_state.unsafe_cast = True
+
+
 @decoding_fn_for_type(int)
 def _decode_int(v: str) -> int:
     int_v = int(v)
     if isinstance(v, bool):
-        warnings.warn(UnsafeCastingWarning(raw_value=v, decoded_value=int_v))
+        _unsafe_cast(raw_value=v, decoded_value=int_v)
     elif int_v != float(v):
-        warnings.warn(UnsafeCastingWarning(raw_value=v, decoded_value=int_v))
+        _unsafe_cast(raw_value=v, decoded_value=int_v)
     return int_v
 
 
@@ -90,7 +137,7 @@ def _decode_int(v: str) -> int:
 def _decode_float(v: Any) -> float:
     float_v = float(v)
     if isinstance(v, bool):
-        warnings.warn(UnsafeCastingWarning(raw_value=v, decoded_value=float_v))
+        _unsafe_cast(raw_value=v, decoded_value=float_v)
     return float_v
 
 
@@ -101,7 +148,7 @@ def _decode_bool(v: Any) -> bool:
     else:
         bool_v = bool(v)
         if isinstance(v, (int, float)) and v not in (0, 1, 0.0, 1.0):
-            warnings.warn(UnsafeCastingWarning(raw_value=v, decoded_value=bool_v))
+            _unsafe_cast(raw_value=v, decoded_value=bool_v)
     return bool_v
 
 
@@ -136,34 +183,24 @@ def decode_field(
     if custom_decoding_fn is not None:
         return custom_decoding_fn(raw_value)
 
-    if isinstance(field_type, str) and containing_dataclass:
-        field_type = evaluate_string_annotation(field_type, containing_dataclass)
-
-    decoding_function = get_decoding_fn(field_type)
-
-    _kwargs = dict(category=UnsafeCastingWarning) if sys.version_info >= (3, 11) else {}
+    field_type, decoding_function = _get_field_decoding_fn(field, containing_dataclass)
 
-    with warnings.catch_warnings(record=True, **_kwargs) as warning_messages:
+    # NOTE: Rather than recording the warnings (which modifies the global state of the `warnings`
+    # module, and isn't thread-safe), the decoding functions report unsafe casts to the state of
+    # the current thread (see `_unsafe_cast`).
+    previous_unsafe_cast = getattr(_decoding_state, "unsafe_cast", None)
+    _decoding_state.unsafe_cast = False
+    try:
         if is_dataclass_type(field_type) and drop_extra_fields is not None:
             # Pass the drop_extra_fields argument to the decoding function.
             decoded_value = decoding_function(raw_value, drop_extra_fields=drop_extra_fields)
         else:
             decoded_value = decoding_function(raw_value)
+        unsafe_cast = _decoding_state.unsafe_cast
+    finally:
+        _decoding_state.unsafe_cast = previous_unsafe_cast
 
-    for warning_message in warning_messages.copy():
-        if not isinstance(warning_message.message, UnsafeCastingWarning):
-            warnings.warn_explicit(
-                message=warning_message.message,
-                category=warning_message.category,
-                filename=warning_message.filename,
-                lineno=warning_message.lineno,
-                # module=warning_message.module,
-                # registry=warning_message.registry,
-                # module_globals=warning_message.module_globals,
-            )
-            warning_messages.remove(warning_message)
-
-    if warning_messages:
+    if unsafe_cast:
         warnings.warn(
             RuntimeWarning(
                 f"Unsafe casting occurred when deserializing field '{name}' of type {field_type}: "
@@ -249,6 +286,10 @@ def get_decoding_fn(type_annotation: type[T] | str) -> Callable[..., T]:
     if is_dataclass_type(t):
         return partial(from_dict, t)
 
+    if getattr(t, "__module__", None) == "numpy" and getattr(t, "__name__", None) == "ndarray":
+        # NOTE: Checking the module avoids having to import numpy here.
+        return _decode_ndarray
+
     if t is Any:
         logger.debug(f"Decoding an Any type: {t}")
         return no_op
@@ -313,6 +354,13 @@ def get_decoding_fn(type_annotation: type[T] | str) -> Callable[..., T]:
     return try_constructor(t)
 
 
+def _decode_ndarray(val: Any) -> Any:
+    import numpy
+
+    # NOTE: `asanyarray` doesn't copy arrays, and keeps memory-mapped arrays as-is.
+    return numpy.asanyarray(val)
+
+
 def decode_optional(t: type[T]) -> Callable[[Any | None], T | None]:
     decode = get_decoding_fn(t)
 
@@ -10,6 +10,7 @@ def encode_ndarray(obj: np.ndarray) -> str:
 """
 import copy
 import json
+import sys
 from argparse import Namespace
 from collections.abc import Mapping
 from dataclasses import fields, is_dataclass
@@ -86,9 +87,14 @@ def encode(obj: Any) -> Any:
                     logger.error(f"Unable to encode field {field.name}: {e}")
                     raise e
             return d
-        else:
-            # logger.debug(f"Deepcopying object {obj} of type {type(obj)}")
-            return copy.deepcopy(obj)
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and isinstance(obj, numpy.ndarray):
+            # NOTE: Registered here rather than at import time, so that numpy is only needed (and
+            # imported) when there are arrays to encode.
+            encode.register(numpy.ndarray, encode_ndarray)
+            return encode_ndarray(obj)
+        # logger.debug(f"Deepcopying object {obj} of type {type(obj)}")
+        return copy.deepcopy(obj)
     except Exception as e:
         logger.debug(f"Cannot encode object {obj}: {e}")
         raise e
@@ -126,6 +132,14 @@ def encode_dict(obj: Mapping) -> Dict[Any, Any]:
     return type(obj)((encode(k), encode(v)) for k, v in obj.items())
 
 
+def encode_ndarray(obj: Any) -> Any:
+    """Returns numpy arrays as-is, rather than copying them (e.g. so `save` can write them to
+    `.npy` files directly). Arrays of python objects are still copied."""
+    if obj.dtype.hasobject:
+        return copy.deepcopy(obj)
+    return obj
+
+
 @encode.register(PathLike)
 def encode_path(obj: PathLike) -> str:
     return obj.__fspath__()
@@ -0,0 +1,300 @@
+"""Canonical, streaming fingerprints (hashes) of dataclass configs.
+
+The fingerprint of an object is computed by feeding a canonical, type-aware binary encoding of the
+object directly into a `hashlib` object, without first converting it to a dict or a string. The
+fields to visit for each dataclass type are computed once and cached, so fingerprinting many
+configs of the same class is cheap. Fingerprints are stable across processes and Python sessions,
+which makes them usable as cache keys, for example to detect duplicate experiments:
+
+>>> from dataclasses import dataclass
+>>> @dataclass
+... class Config:
+...     lr: float = 0.1
+...     layers: tuple = (32, 32)
+>>> fingerprint(Config()) == fingerprint(Config(lr=0.1, layers=(32, 32)))
+True
+>>> fingerprint(Config()) == fingerprint(Config(lr=0.2))
+False
+
+To support a new type, register a function converting its values to something that can be
+fingerprinted (e.g. a tuple of primitives):
+
+>>> import fractions
+>>> try:
+...     register_fingerprint_fn(fractions.Fraction, lambda f: (f.numerator, f.denominator))
+...     print(len(fingerprint(fractions.Fraction(1, 3))))
+... finally:  # (Only so that this example doesn't affect the other tests.)
+...     _unregister_fingerprint_fn(fractions.Fraction)
+16
+"""
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import math
+import struct
+from collections.abc import Mapping
+from enum import Enum
+from logging import getLogger
+from os import PathLike
+from typing import Any, Callable, Protocol, TypeVar
+
+logger = getLogger(__name__)
+
+T = TypeVar("T")
+
+Write = Callable[[bytes], Any]
+"""Function that consumes bytes, e.g. the `update` method of a `hashlib` object."""
+Encoder = Callable[[Write, Any], None]
+
+
+class HashObject(Protocol):
+    def update(self, __data: bytes) -> None:
+        ...
+
+    def hexdigest(self) -> str:
+        ...
+
+
+H = TypeVar("H", bound=HashObject)
+
+_pack_length = struct.Struct(">q").pack
+_pack_float = struct.Struct(">d").pack
+
+# The encoding function to use for each type. Populated lazily for new types.
+_encoders: dict[type, Encoder] = {}
+# Functions registered by the user, which convert a value to something that can be fingerprinted.
+_fingerprint_fns: dict[type, Callable[[Any], Any]] = {}
+
+
+def fingerprint(
+    obj: Any, size: int = 16, hash_fn: Callable[[], HashObject] = hashlib.sha256
+) -> str:
+    """Returns a canonical hash of `obj` (typically a dataclass instance), as a hex string.
+
+    Equal configs have the same fingerprint. For dataclasses, only the fields that are used in the
+    equality comparison (`compare=True`, the default) are considered.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to fingerprint.
+    size : int, optional
+        The number of hex characters to keep from the digest, by default 16.
+    hash_fn : Callable[[], HashObject], optional
+        The hash object constructor to use, by default `hashlib.sha256`.
+    """
+    return update_fingerprint(hash_fn(), obj).hexdigest()[:size]
+
+
+def update_fingerprint(hash_object: H, obj: Any) -> H:
+    """Feeds the canonical encoding of `obj` into the given `hashlib` object, and returns it."""
+    _write(hash_object.update, obj)
+    return hash_object
+
+
+def register_fingerprint_fn(some_type: type[T], function: Callable[[T], Any]) -> None:
+    """Register a function used to fingerprint values of (a subclass of) type `some_type`.
+
+    The function should convert the value to an object that can itself be fingerprinted, for
+    example a tuple of ints, floats and strings.
+    """
+    _fingerprint_fns[some_type] = function
+    _reset_encoders()
+
+
+def _unregister_fingerprint_fn(some_type: type) -> None:
+    _fingerprint_fns.pop(some_type, None)
+    _reset_encoders()
+
+
+def _reset_encoders() -> None:
+    # Types that were already resolved might be affected by the registered functions.
+    _encoders.clear()
+    _encoders.update(_builtin_encoders)
+
+
+def _write(write: Write, value: Any) -> None:
+    encoder = _encoders.get(type(value))
+    if encoder is None:
+        encoder = _encoders[type(value)] = _get_encoder(type(value))
+    encoder(write, value)
+
+
+def _write_none(write: Write, value: None) -> None:
+    write(b"N")
+
+
+def _write_bool(write: Write, value: bool) -> None:
+    write(b"T" if value else b"F")
+
+
+def _write_int(write: Write, value: int) -> None:
+    data = int(value).to_bytes(value.bit_length() // 8 + 1, "big", signed=True)
+    write(b"i")
+    write(_pack_length(len(data)))
+    write(data)
+
+
+def _write_float(write: Write, value: float) -> None:
+    write(b"f")
+    if math.isnan(value):
+        write(b"nan")
+    else:
+        # NOTE: Adding 0.0 turns -0.0 into 0.0, since they compare equal.
+        write(_pack_float(float(value) + 0.0))
+
+
+def _write_str(write: Write, value: str) -> None:
+    data = value.encode("utf-8")
+    write(b"s")
+    write(_pack_length(len(data)))
+    write(data)
+
+
+def _write_bytes(write: Write, value: bytes) -> None:
+    write(b"b")
+    write(_pack_length(len(value)))
+    write(value)
+
+
+def _write_sequence(tag: bytes) -> Encoder:
+    def _write_items(write: Write, value: list | tuple) -> None:
+        write(tag)
+        write(_pack_length(len(value)))
+        for item in value:
+            _write(write, item)
+
+    return _write_items
+
+
+def _canonical_bytes(value: Any) -> bytes:
+    buffer = bytearray()
+    _write(buffer.extend, value)
+    return bytes(buffer)
+
+
+def _write_set(write: Write, value: set | frozenset) -> None:
+    # Sets have no order, so the items are sorted by their canonical encoding.
+    write(b"S")
+    write(_pack_length(len(value)))
+    for item_bytes in sorted(map(_canonical_bytes, value)):
+        write(item_bytes)
+
+
+def _write_mapping(write: Write, value: Mapping) -> None:
+    # The items are sorted by the canonical encoding of their keys, so that the insertion order
+    # doesn't matter, just like with dict equality.
+    write(b"M")
+    write(_pack_length(len(value)))
+    for key_bytes, item in sorted(
+        ((_canonical_bytes(k), v) for k, v in value.items()), key=lambda kv: kv[0]
+    ):
+        write(key_bytes)
+        _write(write, item)
+
+
+def _qualified_name(t: type) -> bytes:
+    return f"{t.__module__}.{t.__qualname__}".encode()
+
+
+def _write_enum_type(enum_type: type[Enum]) -> Encoder:
+    header = b"E" + _pack_length(len(_qualified_name(enum_type))) + _qualified_name(enum_type)
+
+    def _write_enum(write: Write, value: Enum) -> None:
+        write(header)
+        _write_str(write, value.name)
+
+    return _write_enum
+
+
+def _write_dataclass_type(dataclass_type: type) -> Encoder:
+    """Precomputes the field walk for the given dataclass type."""
+    field_names = tuple(f.name for f in dataclasses.fields(dataclass_type) if f.compare)
+    name = _qualified_name(dataclass_type)
+    header = b"D" + _pack_length(len(name)) + name + _pack_length(len(field_names))
+    fields_and_prefixes = tuple(
+        (field_name, _canonical_bytes(field_name)) for field_name in field_names
+    )
+
+    def _write_dataclass(write: Write, value: Any) -> None:
+        write(header)
+        for field_name, prefix in fields_and_prefixes:
+            write(prefix)
+            _write(write, getattr(value, field_name))
+
+    return _write_dataclass
+
+
+def _write_ndarray(write: Write, value: Any) -> None:
+    import numpy as np
+
+    if value.dtype.hasobject:
+        write(b"A")
+        _write(write, value.shape)
+        _write(write, value.tolist())
+        return
+    write(b"a")
+    _write_str(write, value.dtype.str)
+    _write(write, value.shape)
+    write(np.ascontiguousarray(value).data)
+
+
+def _write_numpy_scalar(write: Write, value: Any) -> None:
+    # Numpy scalars are fingerprinted like the equivalent python value.
+    _write(write, value.item())
+
+
+def _write_registered(function: Callable[[Any], Any]) -> Encoder:
+    def _write_converted(write: Write, value: Any) -> None:
+        write(b"R")
+        _write(write, function(value))
+
+    return _write_converted
+
+
+def _write_pathlike(write: Write, value: PathLike) -> None:
+    write(b"P")
+    _write(write, value.__fspath__())
+
+
+def _get_encoder(t: type) -> Encoder:
+    for registered_type, function in _fingerprint_fns.items():
+        if issubclass(t, registered_type):
+            return _write_registered(function)
+    if dataclasses.is_dataclass(t):
+        return _write_dataclass_type(t)
+    if issubclass(t, Enum):
+        return _write_enum_type(t)
+    if t.__module__ == "numpy":
+        if t.__name__ == "ndarray":
+            return _write_ndarray
+        if hasattr(t, "item"):
+            return _write_numpy_scalar
+    for base, encoder in _builtin_encoders.items():
+        if issubclass(t, base):
+            return encoder
+    if issubclass(t, Mapping):
+        return _write_mapping
+    if issubclass(t, PathLike):
+        return _write_pathlike
+    raise TypeError(
+        f"Don't know how to fingerprint values of type {t}. Register a function for this type "
+        f"with `register_fingerprint_fn`."
+    )
+
+
+_builtin_encoders: dict[type, Encoder] = {
+    type(None): _write_none,
+    bool: _write_bool,
+    int: _write_int,
+    float: _write_float,
+    str: _write_str,
+    bytes: _write_bytes,
+    list: _write_sequence(b"l"),
+    tuple: _write_sequence(b"t"),
+    set: _write_set,
+    frozenset: _write_set,
+    dict: _write_mapping,
+}
+_encoders.update(_builtin_encoders)
@@ -0,0 +1,458 @@
+"""Compact binary files of many serialized configs of the same dataclass type.
+
+Each record in a records file is the serialized dict of one config (as returned by `to_dict`).
+Rather than repeating the field names in each record, the field names are stored once, in a schema
+in the header of the file, and each record only stores its values, positionally. The values are
+written in a small, msgpack-like tagged binary encoding. An index of the record offsets is written
+at the end of the file, so records can be read by index without decoding the rest of the file:
+
+>>> import tempfile, os
+>>> from dataclasses import dataclass
+>>> @dataclass
+... class Config:
+...     lr: float = 0.1
+...     optimizer: str = "sgd"
+>>> path = os.path.join(tempfile.mkdtemp(), "configs.records")
+>>> save_records([Config(lr=0.5 * i) for i in range(1, 4)], path)
+3
+>>> with RecordFile(path, Config) as records:
+...     print(len(records), records[1])
+3 Config(lr=1.0, optimizer='sgd')
+
+The header also contains a fingerprint of the dataclass fields, which is checked when loading the
+records with a different version of the class. The `.records` extension is registered in the
+`extensions` dictionary, so `save` and `load` can also be used with a single config.
+
+Layout of a file:
+- `MAGIC`
+- header length (uint32) and header (json): schema, dataclass type and fingerprint;
+- the records;
+- the offset of each record (uint64 each);
+- the number of records and the offset of the index (uint64 each).
+"""
+from __future__ import annotations
+
+import dataclasses
+import json
+import struct
+import warnings
+from itertools import chain
+from logging import getLogger
+from pathlib import Path
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Sequence,
+    overload,
+)
+
+from simple_parsing.utils import DataclassT
+
+from .fingerprint import fingerprint
+from .serializable import FormatExtension, extensions, from_dict, to_dict
+
+if TYPE_CHECKING:
+    import mmap
+
+logger = getLogger(__name__)
+
+MAGIC = b"SPREC\x01"
+
+_header_length = struct.Struct("<I")
+_footer = struct.Struct("<QQ")
+_int64 = struct.Struct("<q")
+_float64 = struct.Struct("<d")
+
+# Tags of the encoded values. Non-negative ints smaller than 128 are stored in a single byte, with
+# the highest bit set.
+_NONE = 0x00
+_FALSE = 0x01
+_TRUE = 0x02
+_INT = 0x03
+_BIG_INT = 0x04
+_FLOAT = 0x05
+_STR = 0x06
+_BYTES = 0x07
+_LIST = 0x08
+_MAP = 0x09
+_RECORD = 0x0A
+_FIXINT = 0x80
+
+
+class _Schema(NamedTuple):
+    """The field names of a record, and the schemas of the records nested in it (if any)."""
+
+    names: tuple[str, ...]
+    children: tuple[_Schema | None, ...]
+
+
+def _get_schema(d: dict) -> _Schema | None:
+    """Returns the schema of the given serialized dict, or None if it can't be a record."""
+    if not d or not all(isinstance(k, str) for k in d):
+        return None
+    return _Schema(
+        names=tuple(d),
+        children=tuple(_get_schema(v) if isinstance(v, dict) else None for v in d.values()),
+    )
+
+
+def _schema_to_json(schema: _Schema | None) -> list | None:
+    if schema is None:
+        return None
+    return [
+        name if child is None else [name, _schema_to_json(child)]
+        for name, child in zip(schema.names, schema.children)
+    ]
+
+
+def _schema_from_json(entries: list | None) -> _Schema | None:
+    if entries is None:
+        return None
+    names: list[str] = []
+    children: list[_Schema | None] = []
+    for entry in entries:
+        if isinstance(entry, str):
+            names.append(entry)
+            children.append(None)
+        else:
+            name, child_entries = entry
+            names.append(name)
+            children.append(_schema_from_json(child_entries))
+    return _Schema(tuple(names), tuple(children))
+
+
+def get_type_fingerprint(dataclass_type: type) -> str:
+    """Returns a fingerprint of the names and type annotations of the fields of a dataclass type.
+
+    This changes whenever a field is added, removed, renamed or has its annotation changed.
+    """
+    return fingerprint(
+        (
+            f"{dataclass_type.__module__}.{dataclass_type.__qualname__}",
+            [(f.name, str(f.type)) for f in dataclasses.fields(dataclass_type)],
+        )
+    )
+
+
+def _write_uvarint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_uvarint(data: bytes | mmap.mmap, pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _encode(out: bytearray, value: Any, schema: _Schema | None = None) -> None:
+    """Appends the encoding of `value` to `out`.
+
+    Dicts with exactly the fields of `schema` are encoded positionally, other dicts are encoded
+    with their keys.
+    """
+    if value is None:
+        out.append(_NONE)
+    elif value is True:
+        out.append(_TRUE)
+    elif value is False:
+        out.append(_FALSE)
+    elif isinstance(value, int):
+        if 0 <= value < 0x80:
+            out.append(_FIXINT | value)
+        elif -(2**63) <= value < 2**63:
+            out.append(_INT)
+            out += _int64.pack(value)
+        else:
+            out.append(_BIG_INT)
+            _encode_str(out, str(value))
+    elif isinstance(value, float):
+        out.append(_FLOAT)
+        out += _float64.pack(value)
+    elif isinstance(value, str):
+        out.append(_STR)
+        _encode_str(out, value)
+    elif isinstance(value, (bytes, bytearray)):
+        out.append(_BYTES)
+        _write_uvarint(out, len(value))
+        out += value
+    elif isinstance(value, dict):
+        if (
+            schema is not None
+            and len(value) == len(schema.names)
+            and all(name in value for name in schema.names)
+        ):
+            out.append(_RECORD)
+            for name, child in zip(schema.names, schema.children):
+                _encode(out, value[name], child)
+        else:
+            out.append(_MAP)
+            _write_uvarint(out, len(value))
+            for k, v in value.items():
+                _encode(out, k)
+                _encode(out, v)
+    elif isinstance(value, (list, tuple)):
+        out.append(_LIST)
+        _write_uvarint(out, len(value))
+        for item in value:
+            _encode(out, item)
+    else:
+        raise TypeError(
+            f"Can't store value {value!r} of type {type(value)} in a records file. Only the "
+            f"values of serialized dicts (None, bool, int, float, str, bytes, list, dict) are "
+            f"supported."
+        )
+
+
+def _encode_str(out: bytearray, value: str) -> None:
+    encoded = value.encode("utf-8")
+    _write_uvarint(out, len(encoded))
+    out += encoded
+
+
+def _decode(data: bytes | mmap.mmap, pos: int, schema: _Schema | None = None) -> tuple[Any, int]:
+    """Decodes the value at position `pos` in `data`. Returns the value and the next position."""
+    tag = data[pos]
+    pos += 1
+    if tag & _FIXINT:
+        return tag & 0x7F, pos
+    if tag == _NONE:
+        return None, pos
+    if tag == _TRUE:
+        return True, pos
+    if tag == _FALSE:
+        return False, pos
+    if tag == _INT:
+        return _int64.unpack_from(data, pos)[0], pos + 8
+    if tag == _FLOAT:
+        return _float64.unpack_from(data, pos)[0], pos + 8
+    if tag in (_STR, _BIG_INT, _BYTES):
+        length, pos = _read_uvarint(data, pos)
+        raw = bytes(data[pos : pos + length])
+        pos += length
+        if tag == _BYTES:
+            return raw, pos
+        return (raw.decode("utf-8") if tag == _STR else int(raw)), pos
+    if tag == _RECORD:
+        if schema is None:
+            raise ValueError(f"Found a record without a schema at position {pos - 1}.")
+        d: dict[str, Any] = {}
+        for name, child in zip(schema.names, schema.children):
+            d[name], pos = _decode(data, pos, child)
+        return d, pos
+    if tag == _MAP:
+        length, pos = _read_uvarint(data, pos)
+        d = {}
+        for _ in range(length):
+            k, pos = _decode(data, pos)
+            d[k], pos = _decode(data, pos)
+        return d, pos
+    if tag == _LIST:
+        length, pos = _read_uvarint(data, pos)
+        items = []
+        for _ in range(length):
+            item, pos = _decode(data, pos)
+            items.append(item)
+        return items, pos
+    raise ValueError(f"Invalid tag {tag:#x} at position {pos - 1}.")
+
+
+def write_records(
+    fp: IO[bytes],
+    records: Iterable[dict],
+    dataclass_type: type | None = None,
+    single: bool = False,
+) -> int:
+    """Writes the serialized dicts `records` to the binary file object `fp`.
+
+    The schema is taken from the first record. Returns the number of records written.
+    """
+    records = iter(records)
+    first = next(records, None)
+    schema = _get_schema(first) if isinstance(first, dict) else None
+    header = {
+        "schema": _schema_to_json(schema),
+        "type": None,
+        "fingerprint": None,
+        "single": single,
+    }
+    if dataclass_type is not None:
+        header["type"] = f"{dataclass_type.__module__}.{dataclass_type.__qualname__}"
+        header["fingerprint"] = get_type_fingerprint(dataclass_type)
+    encoded_header = json.dumps(header).encode("utf-8")
+
+    out = bytearray(MAGIC)
+    out += _header_length.pack(len(encoded_header))
+    out += encoded_header
+    offsets: list[int] = []
+    position = 0
+    if first is not None:
+        for record in chain([first], records):
+            offsets.append(position + len(out))
+            _encode(out, record, schema)
+            # Flush the buffer regularly, to avoid holding all the encoded records in memory.
+            if len(out) > 1 << 20:
+                fp.write(out)
+                position += len(out)
+                out.clear()
+    index_offset = position + len(out)
+    out += struct.pack(f"<{len(offsets)}Q", *offsets)
+    out += _footer.pack(len(offsets), index_offset)
+    fp.write(out)
+    return len(offsets)
+
+
+class RecordFile(Sequence):
+    """Read-only sequence of the records in a records file, with random access by index.
+
+    The file is memory-mapped, and the records are only decoded when accessed. When `cls` is
+    passed, the records are decoded into instances of `cls` with `from_dict`, otherwise the
+    serialized dicts are returned.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        cls: type[DataclassT] | None = None,
+        drop_extra_fields: bool | None = None,
+    ):
+        self.path = Path(path)
+        self.cls = cls
+        self.drop_extra_fields = drop_extra_fields
+        # NOTE: Imported here, so that importing simple_parsing doesn't import mmap.
+        import mmap
+
+        with open(self.path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._data[: len(MAGIC)] != MAGIC:
+            self._data.close()
+            raise ValueError(f"{self.path} is not a records file.")
+        (header_length,) = _header_length.unpack_from(self._data, len(MAGIC))
+        header_start = len(MAGIC) + _header_length.size
+        self.header: dict[str, Any] = json.loads(
+            self._data[header_start : header_start + header_length]
+        )
+        self._schema = _schema_from_json(self.header["schema"])
+        self._length, index_offset = _footer.unpack_from(
+            self._data, len(self._data) - _footer.size
+        )
+        self._offsets = struct.unpack_from(f"<{self._length}Q", self._data, index_offset)
+
+        if cls is not None and self.header["fingerprint"] not in (None, get_type_fingerprint(cls)):
+            warnings.warn(
+                RuntimeWarning(
+                    f"The records in {self.path} were saved with a different version of the "
+                    f"dataclass {self.header['type']}: the fields of {cls} have changed since."
+                )
+            )
+
+    def get_dict(self, index: int) -> dict:
+        """Returns the serialized dict of the record at the given index."""
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(f"Record index out of range: {index}")
+        return _decode(self._data, self._offsets[index], self._schema)[0]
+
+    @overload
+    def __getitem__(self, index: int) -> Any:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list:
+        ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        d = self.get_dict(index)
+        if self.cls is None:
+            return d
+        return from_dict(self.cls, d, drop_extra_fields=self.drop_extra_fields)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self[i] for i in range(self._length))
+
+    def close(self) -> None:
+        self._data.close()
+
+    def __enter__(self) -> RecordFile:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def save_records(
+    objs: Iterable[Any],
+    path: str | Path,
+    to_dict_fn: Callable[[Any], dict] = to_dict,
+) -> int:
+    """Saves the given dataclass instances to a records file. Returns the number of records.
+
+    All the instances should be of the same type, to benefit from the positional encoding.
+    """
+    objs = iter(objs)
+    first = next(objs, None)
+    dataclass_type = type(first) if dataclasses.is_dataclass(first) else None
+    records = (to_dict_fn(obj) for obj in (() if first is None else chain([first], objs)))
+    with open(path, "wb") as f:
+        return write_records(f, records, dataclass_type=dataclass_type)
+
+
+def load_records(
+    cls: type[DataclassT], path: str | Path, drop_extra_fields: bool | None = None
+) -> list[DataclassT]:
+    """Loads all the records in the given records file as instances of `cls`."""
+    with RecordFile(path, cls, drop_extra_fields=drop_extra_fields) as records:
+        return list(records)
+
+
+class RecordsExtension(FormatExtension):
+    """Format extension for records files.
+
+    Saving a dict writes a file with a single record, which is loaded back as a dict. Saving a list
+    of dicts writes one record per dict, and is loaded back as a list of dicts.
+    """
+
+    binary: bool = True
+
+    def load(self, io: IO[bytes]) -> Any:
+        data = io.read()
+        if data[: len(MAGIC)] != MAGIC:
+            raise ValueError("Not a records file.")
+        (header_length,) = _header_length.unpack_from(data, len(MAGIC))
+        header_start = len(MAGIC) + _header_length.size
+        header = json.loads(data[header_start : header_start + header_length])
+        schema = _schema_from_json(header["schema"])
+        length, index_offset = _footer.unpack_from(data, len(data) - _footer.size)
+        offsets = struct.unpack_from(f"<{length}Q", data, index_offset)
+        records = [_decode(data, offset, schema)[0] for offset in offsets]
+        if header["single"]:
+            return records[0]
+        return records
+
+    def dump(self, obj: Any, io: IO[bytes], **kwargs) -> None:
+        if isinstance(obj, dict):
+            write_records(io, [obj], single=True, **kwargs)
+        else:
+            write_records(io, obj, **kwargs)
+
+
+extensions[".records"] = RecordsExtension()
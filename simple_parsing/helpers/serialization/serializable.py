@@ -1,19 +1,25 @@
 from __future__ import annotations
 
+import contextlib
 import json
+import math
+import os
 import pickle
+import re
+import sys
+import threading
 import warnings
+import weakref
 from collections import OrderedDict
 from dataclasses import MISSING, Field, dataclass, fields, is_dataclass
-from functools import partial
+from functools import lru_cache, partial
 from importlib import import_module
-from itertools import chain
 from logging import getLogger
 from pathlib import Path
 from types import ModuleType
-from typing import IO, Any, Callable, ClassVar, TypeVar, Union
+from typing import IO, TYPE_CHECKING, Any, Callable, ClassVar, Iterable, Iterator, TypeVar, Union
 
-from typing_extensions import Protocol
+from typing_extensions import Literal, Protocol
 
 from simple_parsing.utils import (
     DataclassT,
@@ -26,6 +32,14 @@ from simple_parsing.utils import (
 from .decoding import decode_field, register_decoding_fn
 from .encoding import SimpleJsonEncoder, encode
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore
+
 DumpFn = Callable[[Any, IO], None]
 DumpsFn = Callable[[Any], str]
 LoadFn = Callable[[IO], dict]
@@ -35,6 +49,11 @@ logger = getLogger(__name__)
 
 D = TypeVar("D", bound="SerializableMixin")
 
+# Index of the subclasses of each dataclass type, used by `from_dict` (see `_SubclassIndex`).
+# NOTE: The indices are only kept for subclasses of `SerializableMixin`, since all their
+# subclasses go through `SerializableMixin.__init_subclass__`, which clears the indices.
+_subclass_indices: weakref.WeakKeyDictionary[type, _SubclassIndex] = weakref.WeakKeyDictionary()
+
 try:
     import yaml
 
@@ -61,6 +80,9 @@ except ImportError:
 
 class FormatExtension(Protocol):
     binary: ClassVar[bool] = False
+    supports_arrays: ClassVar[bool] = False
+    """Whether numpy arrays can be stored in this format directly. When False, arrays are saved in
+    separate `.npy` files next to the file (see `save`)."""
 
     @staticmethod
     def load(fp: IO) -> Any:
@@ -78,6 +100,7 @@ class JSONExtension(FormatExtension):
 
 class PickleExtension(FormatExtension):
     binary: ClassVar[bool] = True
+    supports_arrays: ClassVar[bool] = True
     load: ClassVar[Callable[[IO], Any]] = staticmethod(pickle.load)
     dump: ClassVar[Callable[[Any, IO[bytes]], None]] = staticmethod(pickle.dump)
 
@@ -86,7 +109,8 @@ class YamlExtension(FormatExtension):
     def load(self, io: IO) -> Any:
         import yaml
 
-        return yaml.safe_load(io)
+        # NOTE: The libyaml-based loader is several times faster, when it is available.
+        return yaml.load(io, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
     def dump(self, obj: Any, io: IO, **kwargs) -> None:
         import yaml
@@ -96,6 +120,7 @@ class YamlExtension(FormatExtension):
 
 class NumpyExtension(FormatExtension):
     binary: bool = True
+    supports_arrays: bool = True
 
     def load(self, io: IO) -> Any:
         import numpy
@@ -113,6 +138,7 @@ class NumpyExtension(FormatExtension):
 
 class TorchExtension(FormatExtension):
     binary: bool = True
+    supports_arrays: bool = True
 
     def load(self, io: IO) -> None:
         import torch  # type: ignore
@@ -214,6 +240,8 @@ class SerializableMixin:
         cls.decode_into_subclasses = decode_into_subclasses or False
         if cls not in SerializableMixin.subclasses:
             SerializableMixin.subclasses.append(cls)
+        # The new class might be a better match when decoding into the subclasses of its parents.
+        _subclass_indices.clear()
 
         encode.register(cls, cls.to_dict)
         register_decoding_fn(cls, cls.from_dict)
@@ -305,6 +333,20 @@ class SerializableMixin:
         """
         return load(cls, path=path, drop_extra_fields=drop_extra_fields, load_fn=load_fn, **kwargs)
 
+    @classmethod
+    def load_all(
+        cls: type[D],
+        paths: Iterable[str | Path],
+        workers: int | None = None,
+        backend: Literal["process", "thread"] = "process",
+        **kwargs,
+    ) -> list[D | LoadError]:
+        """Loads an instance of `cls` from each of the given files, in parallel.
+
+        See the `load_all` function for more info.
+        """
+        return load_all(cls, paths, workers=workers, backend=backend, **kwargs)
+
     @classmethod
     def _load(
         cls: type[D],
@@ -359,6 +401,31 @@ class SerializableMixin:
     def save(self, path: str | Path, format: FormatExtension | None = None) -> None:
         save(self, path=path, format=format)
 
+    async def asave(self, path: str | Path, format: FormatExtension | None = None) -> None:
+        """Saves this object to the given file without blocking the event loop.
+
+        See the `asave` function for more info.
+        """
+        await asave(self, path=path, format=format)
+
+    @classmethod
+    async def aload(cls: type[D], path: Path | str, **kwargs) -> D:
+        """Loads an instance of `cls` from the given file without blocking the event loop.
+
+        See the `aload` function for more info.
+        """
+        return await aload(cls, path, **kwargs)
+
+    @classmethod
+    async def aload_all(
+        cls: type[D], paths: Iterable[str | Path], **kwargs
+    ) -> list[D | LoadError]:
+        """Loads an instance of `cls` from each of the given files without blocking the event loop.
+
+        See the `aload_all` function for more info.
+        """
+        return await aload_all(cls, paths, **kwargs)
+
     def _save(self, path: str | Path, format: FormatExtension = json_extension, **kwargs) -> None:
         save(self, path=path, format=format, **kwargs)
 
@@ -526,8 +593,12 @@ def load(
     if load_fn is None and isinstance(path, Path):
         # Load a dict from the file.
         d = read_file(path)
+    elif load_fn and isinstance(path, Path) and _uses_array_files(path):
+        d = _read_with_arrays(path, lambda: _read_with(load_fn, path))
+    elif load_fn and isinstance(path, Path):
+        d = _read_with(load_fn, path)
     elif load_fn:
-        with path.open() if isinstance(path, Path) else path as f:
+        with path as f:
             d = load_fn(f)
     else:
         raise ValueError(
@@ -540,6 +611,92 @@ def load(
     return from_dict(cls, d, drop_extra_fields=drop_extra_fields)
 
 
+class LoadError(Exception):
+    """Error raised while loading one of the files passed to `load_all`."""
+
+    def __init__(self, path: str, message: str):
+        super().__init__(path, message)
+        self.path = path
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"Unable to load {self.path}: {self.message}"
+
+
+def _load_chunk(
+    cls: type[DataclassT], paths: list[Path], drop_extra_fields: bool | None
+) -> list[DataclassT | LoadError]:
+    results: list[DataclassT | LoadError] = []
+    for path in paths:
+        try:
+            results.append(load(cls, path, drop_extra_fields=drop_extra_fields))
+        except Exception as e:
+            # NOTE: Only keep the message, since the exception might not be picklable.
+            results.append(LoadError(str(path), f"{type(e).__name__}: {e}"))
+    return results
+
+
+def load_all(
+    cls: type[DataclassT],
+    paths: Iterable[str | Path],
+    workers: int | None = None,
+    backend: Literal["process", "thread"] = "process",
+    chunksize: int | None = None,
+    drop_extra_fields: bool | None = None,
+) -> list[DataclassT | LoadError]:
+    """Loads an instance of `cls` from each of the given files, in parallel.
+
+    The paths are split into chunks, which are loaded with `load` by a pool of `workers` processes
+    (or threads, when `backend` is "thread"). When `cls` is defined in a function or otherwise
+    can't be pickled, use the "thread" backend.
+
+    Args:
+        cls (Type[D]): A dataclass type to load.
+        paths: The files to load.
+        workers: The number of workers. Defaults to None, in which case `os.cpu_count()` is used.
+            When 1, the files are loaded in the current process.
+        backend: Whether to use a pool of processes or of threads.
+        chunksize: The number of files loaded by a worker at a time. Defaults to None, in which
+            case the files are split evenly into about 4 chunks per worker.
+        drop_extra_fields (bool, optional): See `load`.
+
+    Returns:
+        The results, in the same order as `paths`. When a file can't be loaded, the result for that
+        file is a `LoadError`, rather than the exception being raised, so that a single invalid
+        file doesn't abort the whole batch.
+    """
+    paths = [Path(p) for p in paths]
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(paths) / (workers * 4)))
+    chunks = [paths[i : i + chunksize] for i in range(0, len(paths), chunksize)]
+    executor_type: type[Executor]
+    if backend == "process":
+        # NOTE: Imported here, since this imports multiprocessing, which is slow to import.
+        from concurrent.futures import ProcessPoolExecutor
+
+        executor_type = ProcessPoolExecutor
+    elif backend == "thread":
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor_type = ThreadPoolExecutor
+    else:
+        raise ValueError(f"Invalid backend {backend!r}, expected 'process' or 'thread'.")
+
+    results: list[DataclassT | LoadError] = []
+    if workers == 1 or len(chunks) <= 1:
+        results = _load_chunk(cls, paths, drop_extra_fields)
+    else:
+        with executor_type(max_workers=min(workers, len(chunks))) as executor:
+            load_chunk = partial(_load_chunk, cls, drop_extra_fields=drop_extra_fields)
+            for chunk_results in executor.map(load_chunk, chunks):
+                results.extend(chunk_results)
+    errors = [r for r in results if isinstance(r, LoadError)]
+    if errors:
+        logger.warning(f"Unable to load {len(errors)} out of {len(paths)} files: {errors[0]}, ...")
+    return results
+
+
 def load_json(
     cls: type[DataclassT],
     path: str | Path,
@@ -605,8 +762,19 @@ def read_file(path: str | Path) -> dict:
     }
     """
     format = get_extension(path)
-    with open(path, mode="rb" if format.binary else "r") as f:
-        return format.load(f)
+
+    def _read() -> dict:
+        with open(path, mode="rb" if format.binary else "r") as f:
+            return format.load(f)
+
+    if getattr(format, "supports_arrays", False):
+        return _read()
+    return _read_with_arrays(Path(path), _read)
+
+
+def _read_with(load_fn: LoadFn, path: Path) -> dict:
+    with path.open() as f:
+        return load_fn(f)
 
 
 def save(
@@ -616,13 +784,259 @@ def save(
     save_dc_types: bool = False,
     **kwargs,
 ) -> None:
-    """Save the given dataclass or dictionary to the given file."""
+    """Save the given dataclass or dictionary to the given file.
+
+    When the format can't store numpy arrays directly (e.g. json or yaml), the arrays are saved in
+    separate `.npy` files in a `<path>.arrays` directory next to the file, and are replaced with a
+    reference of the form `{"__simple_parsing_ndarray__": "<key>.<save id>.npy"}` in the file. These arrays are then
+    loaded back as read-only memory-mapped arrays by `load`.
+
+    The file is written to a temporary file first, which then atomically replaces `path`. The
+    arrays of the previous version of the file are only removed after that, so concurrent readers
+    always see a file along with its own arrays.
+    """
     if not isinstance(obj, dict):
         obj = to_dict(obj, save_dc_types=save_dc_types)
     if format is None:
         format = get_extension(path)
-    with open(path, mode="wb" if format.binary else "w") as f:
-        return format.dump(obj, f, **kwargs)
+    path = Path(path)
+    arrays: dict[str, Any] = {}
+    if not getattr(format, "supports_arrays", False):
+        obj = _extract_arrays(obj, arrays)
+    arrays_dir = _get_arrays_dir(path)
+    if not arrays and not arrays_dir.is_dir():
+        _write_atomically(obj, path, format, **kwargs)
+        return
+    # NOTE: The arrays get new file names at each save, and the arrays of the previous versions of
+    # the file are only removed once it has been replaced. Saves to the same path are serialized,
+    # so that a save never removes the arrays of a concurrent one.
+    with _lock_arrays_dir(arrays_dir):
+        import numpy
+
+        for filename, array in arrays.items():
+            numpy.save(arrays_dir / filename, array, allow_pickle=False)
+        _write_atomically(obj, path, format, **kwargs)
+        for stale_file in arrays_dir.glob("*.npy"):
+            if stale_file.name not in arrays:
+                stale_file.unlink()
+        if not arrays:
+            (arrays_dir / _LOCK_FILE).unlink()
+            with contextlib.suppress(OSError):
+                arrays_dir.rmdir()  # Fails if there are other files: leave them alone.
+
+
+def _write_atomically(obj: dict, path: Path, format: FormatExtension, **kwargs) -> None:
+    # Write to a temporary file which then replaces the file atomically, so that concurrent readers
+    # never see a partially written file.
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(temp_path, mode="wb" if format.binary else "w") as f:
+            format.dump(obj, f, **kwargs)
+        os.replace(temp_path, path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
+_io_executor: ThreadPoolExecutor | None = None
+_io_executor_lock = threading.Lock()
+
+
+def _get_io_executor() -> ThreadPoolExecutor:
+    """Returns the executor used by the async functions (`asave`, `aload`, etc) by default."""
+    global _io_executor
+    with _io_executor_lock:
+        if _io_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            _io_executor = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) + 4),
+                thread_name_prefix="simple_parsing_io",
+            )
+        return _io_executor
+
+
+async def _run_in_executor(executor: Executor | None, fn: Callable[..., T], *args, **kwargs) -> T:
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor or _get_io_executor(), partial(fn, *args, **kwargs))
+
+
+async def asave(
+    obj: Any,
+    path: str | Path,
+    format: FormatExtension | None = None,
+    save_dc_types: bool = False,
+    executor: Executor | None = None,
+    **kwargs,
+) -> None:
+    """Async version of `save`: saves the object in a thread of a bounded executor.
+
+    The file is replaced atomically, so concurrent saves to the same path never produce a torn
+    file: the last save to finish wins.
+
+    Args:
+        executor: The executor to use. Defaults to None, in which case a thread pool shared by
+            all the async functions of this module is used.
+        Other args: See `save`.
+    """
+    await _run_in_executor(
+        executor, save, obj, path, format=format, save_dc_types=save_dc_types, **kwargs
+    )
+
+
+async def aload(
+    cls: type[DataclassT],
+    path: Path | str,
+    drop_extra_fields: bool | None = None,
+    load_fn: LoadFn | None = None,
+    executor: Executor | None = None,
+) -> DataclassT:
+    """Async version of `load`: reads and decodes the file in a thread of a bounded executor.
+
+    Args:
+        executor: The executor to use. Defaults to None, in which case a thread pool shared by
+            all the async functions of this module is used.
+        Other args: See `load`.
+    """
+    return await _run_in_executor(
+        executor, load, cls, path, drop_extra_fields=drop_extra_fields, load_fn=load_fn
+    )
+
+
+async def aload_all(
+    cls: type[DataclassT],
+    paths: Iterable[str | Path],
+    drop_extra_fields: bool | None = None,
+    executor: Executor | None = None,
+) -> list[DataclassT | LoadError]:
+    """Async version of `load_all`: loads each file in a thread of a bounded executor.
+
+    Like `load_all`, the results are in the same order as `paths`, and files that can't be loaded
+    give a `LoadError` instead of raising an exception.
+    """
+    import asyncio
+
+    chunks = await asyncio.gather(
+        *(
+            _run_in_executor(executor, _load_chunk, cls, [Path(path)], drop_extra_fields)
+            for path in paths
+        )
+    )
+    return [result for chunk in chunks for result in chunk]
+
+
+# Key of the references to the `.npy` files of the arrays, in the files that can't store arrays.
+_ARRAY_KEY = "__simple_parsing_ndarray__"
+
+
+def _uses_array_files(path: Path) -> bool:
+    """Whether the arrays of a file at `path` are saved in separate files (see `save`)."""
+    format = extensions.get(path.suffix)
+    return format is not None and not getattr(format, "supports_arrays", False)
+
+
+def _get_arrays_dir(path: Path) -> Path:
+    """Returns the directory where the arrays of the file at `path` are stored."""
+    return path.with_name(path.name + ".arrays")
+
+
+_LOCK_FILE = ".lock"
+_MAX_READ_ATTEMPTS = 10
+
+
+def _extract_arrays(d: dict, arrays: dict[str, Any]) -> dict:
+    """Returns a copy of `d` where the numpy arrays are replaced with references to `.npy` files.
+
+    The arrays are added to `arrays`, indexed by the name of their file. The names are unique to
+    this save, so that the files of other versions of the file are never overwritten.
+    """
+    # NOTE: If numpy isn't imported, then there can't be any arrays in the dict.
+    numpy = sys.modules.get("numpy")
+    if numpy is None:
+        return d
+    save_id = os.urandom(6).hex()
+
+    def _replace(value: Any, key: str) -> Any:
+        if isinstance(value, numpy.ndarray) and not value.dtype.hasobject:
+            name = re.sub(r"[^\w.-]", "_", key)
+            filename = f"{name}.{save_id}.npy"
+            if filename in arrays:
+                filename = f"{name}_{len(arrays)}.{save_id}.npy"
+            arrays[filename] = value
+            return {_ARRAY_KEY: filename}
+        if isinstance(value, dict):
+            return type(value)(
+                (k, _replace(v, f"{key}.{k}" if key else str(k))) for k, v in value.items()
+            )
+        if isinstance(value, (list, tuple)):
+            return [_replace(v, f"{key}.{i}") for i, v in enumerate(value)]
+        return value
+
+    return _replace(d, "")
+
+
+@contextlib.contextmanager
+def _lock_arrays_dir(arrays_dir: Path) -> Iterator[None]:
+    """Creates and locks the arrays directory, where `fcntl` is available."""
+    lock_path = arrays_dir / _LOCK_FILE
+    while True:
+        arrays_dir.mkdir(exist_ok=True)
+        try:
+            lock_file = open(lock_path, "a")
+        except FileNotFoundError:
+            continue  # The directory was just removed by the previous save.
+        with lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            # NOTE: The previous save might have removed the directory while we were waiting.
+            locked = False
+            with contextlib.suppress(FileNotFoundError):
+                locked = os.stat(lock_path).st_ino == os.fstat(lock_file.fileno()).st_ino
+            if locked:
+                yield
+                return
+
+
+def _read_with_arrays(path: Path, read: Callable[[], dict]) -> dict:
+    """Reads the file with `read`, and loads the arrays it refers to (see `_load_arrays`).
+
+    The file might be replaced by a concurrent save between the time it is read and the time its
+    arrays are loaded, in which case these arrays are removed. The file is then read again.
+    """
+    attempts = 1
+    while True:
+        d = read()
+        try:
+            return _load_arrays(d, path)
+        except FileNotFoundError:
+            if attempts == _MAX_READ_ATTEMPTS:
+                raise
+            attempts += 1
+
+
+def _load_arrays(d: Any, path: Path) -> Any:
+    """Replaces the array references in `d` with the arrays saved next to `path` by `save`.
+
+    The arrays are memory-mapped in read-only mode, so they aren't read into memory (or copied)
+    until they are used.
+    """
+    arrays_dir = _get_arrays_dir(path)
+
+    def _replace(value: Any) -> Any:
+        if isinstance(value, dict):
+            if len(value) == 1 and isinstance(value.get(_ARRAY_KEY), str):
+                import numpy
+
+                # NOTE: Only use the file name, so references can't point outside the directory.
+                return numpy.load(arrays_dir / Path(value[_ARRAY_KEY]).name, mmap_mode="r")
+            return type(value)((k, _replace(v)) for k, v in value.items())
+        if isinstance(value, list):
+            return [_replace(v) for v in value]
+        return value
+
+    return _replace(d)
 
 
 def save_yaml(obj, path: str | Path, **kwargs) -> None:
@@ -808,10 +1222,7 @@ def from_dict(
 
     if DC_TYPE_KEY in obj_dict:
         target = obj_dict.pop(DC_TYPE_KEY)
-        # module, dc_type = target.rsplit(".", 1)
-        live_dc_type = _locate(target)
-        # live_module = importlib.import_module(module)
-        # live_dc_type = getattr(live_module, dc_type)
+        live_dc_type = get_dc_type(target)
         return from_dict(live_dc_type, obj_dict, drop_extra_fields=drop_extra_fields)
 
     if drop_extra_fields is None:
@@ -827,6 +1238,17 @@ def from_dict(
             drop_extra_fields = False
 
     logger.debug(f"from_dict for {cls}, drop extra fields: {drop_extra_fields}")
+    if not drop_extra_fields:
+        # If there are keys that aren't fields of `cls`, use the first subclass of `cls` that has
+        # all the required fields.
+        index = _get_subclass_index(cls)
+        if not obj_dict.keys() <= index.field_names:
+            required_fields = frozenset(obj_dict.keys() - index.non_init_field_names)
+            child_class = index.find(required_fields)
+            if child_class is not None:
+                logger.debug(f"Using class {child_class} instead of {cls}")
+                return from_dict(child_class, d, drop_extra_fields=False)
+
     for field in fields(cls) if is_dataclass(cls) else []:
         name = field.name
         if name not in obj_dict:
@@ -853,41 +1275,11 @@ def from_dict(
     extra_args = obj_dict
 
     # If there are arguments left over in the dict after taking all fields.
-    if extra_args:
-        if drop_extra_fields:
-            logger.warning(f"Dropping extra args {extra_args}")
-            extra_args.clear()
-
-        else:
-            # Use the first Serializable derived class that has all the required
-            # fields.
-            logger.debug(f"Missing field names: {extra_args.keys()}")
-
-            # Find all the "registered" subclasses of `cls`. (from Serializable)
-            derived_classes: list[type[DataclassT]] = []
-
-            for subclass in all_subclasses(cls):
-                if subclass is not cls:
-                    derived_classes.append(subclass)
-            logger.debug(f"All derived classes of {cls} available: {derived_classes}")
-
-            # All the arguments that the dataclass should be able to accept in
-            # its 'init'.
-            req_init_field_names = set(chain(extra_args, init_args))
-
-            # Sort the derived classes by their number of init fields, so that
-            # we choose the first one with all the required fields.
-            derived_classes.sort(key=lambda dc: len(get_init_fields(dc)))
-
-            for child_class in derived_classes:
-                logger.debug(f"child class: {child_class.__name__}, mro: {child_class.mro()}")
-                child_init_fields: dict[str, Field] = get_init_fields(child_class)
-                child_init_field_names = set(child_init_fields.keys())
-
-                if child_init_field_names >= req_init_field_names:
-                    # `child_class` is the first class with all required fields.
-                    logger.debug(f"Using class {child_class} instead of {cls}")
-                    return from_dict(child_class, d, drop_extra_fields=False)
+    # NOTE: When `drop_extra_fields` is False, no subclass of `cls` has all the required fields
+    # (see above), so we try to pass the extra arguments to `cls`.
+    if extra_args and drop_extra_fields:
+        logger.warning(f"Dropping extra args {extra_args}")
+        extra_args.clear()
 
     init_args.update(extra_args)
     try:
@@ -904,6 +1296,104 @@ def from_dict(
     return instance
 
 
+class _SubclassIndex:
+    """Index used to find the subclass of a dataclass to use when decoding a dict with extra keys.
+
+    The subclasses are sorted by their number of init fields, so that the first one with all the
+    required fields is used. The result for each set of required fields is cached.
+    """
+
+    __slots__ = ("field_names", "non_init_field_names", "candidates", "resolved")
+
+    max_resolved: ClassVar[int] = 1024
+
+    def __init__(self, dataclass: type):
+        dataclass_fields = fields(dataclass) if is_dataclass(dataclass) else ()
+        self.field_names = frozenset(f.name for f in dataclass_fields)
+        self.non_init_field_names = frozenset(f.name for f in dataclass_fields if not f.init)
+        derived_classes = [c for c in all_subclasses(dataclass) if c is not dataclass]
+        self.candidates: list[tuple[frozenset[str], type]] = sorted(
+            ((frozenset(get_init_fields(c)), c) for c in derived_classes),
+            key=lambda candidate: len(candidate[0]),
+        )
+        self.resolved: dict[frozenset[str], type | None] = {}
+
+    def find(self, required_init_fields: frozenset[str]) -> type | None:
+        """Returns the first subclass with all the required init fields, or None."""
+        try:
+            return self.resolved[required_init_fields]
+        except KeyError:
+            pass
+        result = next(
+            (c for names, c in self.candidates if names >= required_init_fields),
+            None,
+        )
+        if len(self.resolved) < self.max_resolved:
+            self.resolved[required_init_fields] = result
+        return result
+
+
+def _get_subclass_index(dataclass: type) -> _SubclassIndex:
+    index = _subclass_indices.get(dataclass)
+    if index is None:
+        index = _SubclassIndex(dataclass)
+        if isinstance(dataclass, type) and issubclass(dataclass, SerializableMixin):
+            _subclass_indices[dataclass] = index
+    return index
+
+
+# Dataclass types registered with `register_dc_types`, indexed by their path.
+_registered_dc_types: dict[str, type] = {}
+_only_registered_dc_types: bool = False
+
+
+def register_dc_types(*dc_types: type | str, only_registered: bool | None = None) -> None:
+    """Registers the dataclass types that can be referenced by the `DC_TYPE_KEY` entries of
+    serialized dicts (see `to_dict` with `save_dc_types=True`).
+
+    The registered types are resolved without importing anything when deserializing.
+
+    Args:
+        dc_types: Dataclass types, or their paths (e.g. "my_project.configs.Config").
+        only_registered: When True, `from_dict` raises an error for the paths of types that aren't
+            registered, rather than importing the module of the type. This prevents loading a file
+            from importing unexpected modules. When None (default), the current mode is kept.
+    """
+    global _only_registered_dc_types
+    for dc_type in dc_types:
+        if isinstance(dc_type, str):
+            path = dc_type
+            dc_type = _locate_dc_type(path)
+        elif not (isinstance(dc_type, type) and is_dataclass(dc_type)):
+            raise TypeError(f"Expected a dataclass type, got {dc_type!r}")
+        else:
+            path = f"{dc_type.__module__}.{dc_type.__qualname__}"
+        _registered_dc_types[path] = dc_type
+    if only_registered is not None:
+        _only_registered_dc_types = only_registered
+
+
+def get_dc_type(path: str) -> type:
+    """Returns the dataclass type at the given path, from the `DC_TYPE_KEY` entry of a dict."""
+    dc_type = _registered_dc_types.get(path)
+    if dc_type is not None:
+        return dc_type
+    if _only_registered_dc_types:
+        raise ImportError(
+            f"Refusing to load dataclass type {path!r}, since it wasn't registered with "
+            f"`register_dc_types`, and only registered types are allowed."
+        )
+    return _locate_dc_type(path)
+
+
+@lru_cache(maxsize=1024)
+def _locate_dc_type(path: str) -> type:
+    dc_type = _locate(path)
+    if not (isinstance(dc_type, type) and is_dataclass(dc_type)):
+        raise TypeError(f"The object at {path!r} isn't a dataclass type: {dc_type!r}")
+    return dc_type
+
+
 def get_init_fields(dataclass: type) -> dict[str, Field]:
     result: dict[str, Field] = {}
     for field in fields(dataclass):
@@ -5,11 +5,13 @@
 from __future__ import annotations
 
 import argparse
+import copy
 import dataclasses
 import functools
 import itertools
 import shlex
 import sys
+import threading
 import typing
 from argparse import SUPPRESS, Action, HelpFormatter, Namespace, _
 from collections import defaultdict
@@ -23,6 +25,8 @@ from simple_parsing.wrappers.dataclass_wrapper import DataclassWrapperType
 from . import utils
 from .conflicts import ConflictResolution, ConflictResolver
 from .help_formatter import SimpleHelpFormatter
+from .helpers.custom_actions import HelpSearchAction
+from .helpers.serialization.fingerprint import fingerprint
 from .helpers.serialization.serializable import read_file
 from .utils import (
     Dataclass,
@@ -99,6 +103,11 @@ class ArgumentParser(argparse.ArgumentParser):
 
     - add_config_path_arg : bool, optional
         When set to `True`, adds a `--config_path` argument, of type Path, which is used to parse
+
+    - add_help_search_arg : bool, optional
+        When set to `True`, adds a `--help-search TERM` argument, which prints the help for only
+        the dataclass argument groups matching TERM (either a dotted prefix of their destination,
+        or a substring of their title or of one of their option strings), and then exits.
     """
 
     def __init__(
@@ -114,6 +123,7 @@ class ArgumentParser(argparse.ArgumentParser):
         add_config_path_arg: bool | None = None,
         config_path: Path | str | Sequence[Path | str] | None = None,
         add_dest_to_option_strings: bool | None = None,
+        add_help_search_arg: bool = False,
         **kwargs,
     ):
         kwargs["formatter_class"] = formatter_class
@@ -129,6 +139,11 @@ class ArgumentParser(argparse.ArgumentParser):
 
         self._conflict_resolver = ConflictResolver(self.conflict_resolution)
         self._wrappers: list[DataclassWrapper] = []
+        # The argument group created for each dataclass wrapper, used when filtering the help.
+        self._wrapper_groups: list[tuple[DataclassWrapper, argparse._ArgumentGroup]] = []
+        # The formatted help strings, keyed by the help filter and the state of the parser.
+        # NOTE: Subgroups are only resolved once per parser, so this is also per-subgroup-selection.
+        self._help_cache: dict[tuple, str] = {}
 
         if add_dest_to_option_strings:
             argument_generation_mode = ArgumentGenerationMode.BOTH
@@ -154,6 +169,13 @@ class ArgumentParser(argparse.ArgumentParser):
                 default=SUPPRESS,
                 help=_("show this help message and exit"),
             )
+        self.add_help_search_arg = add_help_search_arg
+        if self.add_help_search_arg:
+            super().add_argument(
+                "--help-search",
+                action=HelpSearchAction,
+                help="show the help for only the argument groups matching TERM and exit",
+            )
 
         self.config_path = Path(config_path) if isinstance(config_path, str) else config_path
         if add_config_path_arg is None:
@@ -365,9 +387,60 @@ class ArgumentParser(argparse.ArgumentParser):
             conflict_handler=conflict_handler or self.conflict_handler,
         )
 
-    def print_help(self, file=None, args: Sequence[str] | None = None):
+    def print_help(
+        self, file=None, args: Sequence[str] | None = None, help_filter: str | None = None
+    ):
         self._preprocessing(args=list(args) if args else [])
-        return super().print_help(file)
+        if file is None:
+            file = sys.stdout
+        self._print_message(self.format_help(help_filter=help_filter), file)
+
+    def format_help(self, help_filter: str | None = None) -> str:
+        """Returns the (memoized) help string of this parser.
+
+        When `help_filter` is passed, only the argument groups of the dataclasses matching it are
+        formatted. A group matches if `help_filter` is a dotted prefix of one of its destinations
+        (with or without the root), or if it is a substring of the group's title or of one of its
+        option strings (case-insensitive).
+        """
+        formatter = self._get_formatter()
+        # NOTE: The number of actions changes when arguments are added (directly or in groups).
+        cache_key = (
+            help_filter,
+            formatter._width,
+            self.prog,
+            self.usage,
+            self.description,
+            self.epilog,
+            len(self._actions),
+        )
+        help_text = self._help_cache.get(cache_key)
+        if help_text is None:
+            if help_filter is None:
+                help_text = super().format_help()
+            else:
+                help_text = self._format_filtered_help(formatter, help_filter)
+            self._help_cache[cache_key] = help_text
+        return help_text
+
+    def _format_filtered_help(self, formatter: HelpFormatter, help_filter: str) -> str:
+        groups = [
+            group
+            for wrapper, group in self._wrapper_groups
+            if _matches_help_filter(wrapper, group, help_filter)
+        ]
+        actions = [action for group in groups for action in group._group_actions]
+        formatter.add_usage(self.usage, actions, [])
+        formatter.add_text(self.description)
+        if not groups:
+            formatter.add_text(f"No argument group matches {help_filter!r}.")
+        for group in groups:
+            formatter.start_section(group.title)
+            formatter.add_text(group.description)
+            formatter.add_arguments(group._group_actions)
+            formatter.end_section()
+        formatter.add_text(self.epilog)
+        return formatter.format_help()
 
     def set_defaults(self, config_path: str | Path | None = None, **kwargs: Any) -> None:
         """Set the default argument values, either from a config file, or from the given kwargs."""
@@ -423,6 +496,8 @@ class ArgumentParser(argparse.ArgumentParser):
         # For the rest of the values, use the default argparse behaviour (modifying the
         # self._defaults dictionary).
         super().set_defaults(**kwargs)
+        # The defaults are shown in the help text.
+        self._help_cache.clear()
 
     def equivalent_argparse_code(self, args: Sequence[str] | None = None) -> str:
         """Returns the argparse code equivalent to that of `simple_parsing`.
@@ -454,7 +529,14 @@ class ArgumentParser(argparse.ArgumentParser):
         default: DataclassT | dict | None = None,
         dataclass_wrapper_class: type[DataclassWrapperType] = DataclassWrapper,
         parent: DataclassWrapper | None = None,
+        reuse_wrapper: bool = False,
     ) -> DataclassWrapper[DataclassT] | DataclassWrapperType:
+        """Creates the wrapper for the given dataclass.
+
+        When `reuse_wrapper` is True, the wrapper is copied from a cached one (created the first
+        time this dataclass is used with the same `dataclass_fn`, `default` and `prefix`), rather
+        than being created from scratch.
+        """
         assert is_dataclass_type(dataclass_type)
         assert (
             default is None
@@ -479,16 +561,27 @@ class ArgumentParser(argparse.ArgumentParser):
             dataclass_type = type(dataclass_type)
 
         dataclass_fn = dataclass_fn or dataclass_type
-        # Create this object that  holds the dataclass we will create arguments for and the
-        # arguments that were passed.
-        new_wrapper = dataclass_wrapper_class(
-            dataclass=dataclass_type,
-            name=name,
-            prefix=prefix,
-            default=default,
-            parent=parent,
-            dataclass_fn=dataclass_fn,
-        )
+        if reuse_wrapper:
+            new_wrapper = _get_wrapper_template(
+                dataclass_wrapper_class,
+                dataclass_type=dataclass_type,
+                prefix=prefix,
+                default=default,
+                dataclass_fn=dataclass_fn,
+            ).clone(name=name, parent=parent)
+            # NOTE: The dataclass_fn might be equivalent, but not the same object.
+            new_wrapper.dataclass_fn = dataclass_fn
+        else:
+            # Create this object that  holds the dataclass we will create arguments for and the
+            # arguments that were passed.
+            new_wrapper = dataclass_wrapper_class(
+                dataclass=dataclass_type,
+                name=name,
+                prefix=prefix,
+                default=default,
+                parent=parent,
+                dataclass_fn=dataclass_fn,
+            )
 
         if new_wrapper.dest in self._defaults:
             new_wrapper.set_default(self._defaults[new_wrapper.dest])
@@ -534,7 +627,8 @@ class ArgumentParser(argparse.ArgumentParser):
                 f"Parser {id(self)} is Adding arguments for dataclass: {wrapped_dataclass.dataclass} "
                 f"at destinations {wrapped_dataclass.destinations}"
             )
-            wrapped_dataclass.add_arguments(parser=self)
+            group = wrapped_dataclass.add_arguments(parser=self)
+            self._wrapper_groups.append((wrapped_dataclass, group))
 
         self._wrappers = wrapped_dataclasses
         # Save this so we don't re-add all the arguments.
@@ -714,6 +808,7 @@ class ArgumentParser(argparse.ArgumentParser):
                     dataclass_fn=dataclass_fn,
                     default=default,
                     parent=parent_dataclass_wrapper,
+                    reuse_wrapper=True,
                 )
                 # Make the new wrapper a child of the class which contains the field.
                 # - it isn't already a child
@@ -1077,6 +1172,61 @@ def parse_known_args(
     return config, unknown_args
 
 
+_MAX_WRAPPER_TEMPLATES = 1024
+# The wrappers of the subgroup choices, which are copied each time the choice is selected.
+# NOTE: Shared by all the parsers (possibly in different threads), hence the lock.
+_wrapper_templates: dict[tuple, DataclassWrapper] = {}
+_wrapper_templates_lock = threading.Lock()
+
+
+def _get_wrapper_template(
+    dataclass_wrapper_class: type[DataclassWrapperType],
+    dataclass_type: type[Dataclass],
+    prefix: str,
+    default: Dataclass | dict | None,
+    dataclass_fn: Callable[..., Dataclass],
+) -> DataclassWrapperType:
+    """Returns the (cached) wrapper for the given dataclass, which isn't attached to any parser.
+
+    The wrapper doesn't depend on where it ends up in the tree, so the same one can be copied for
+    all the parsers and subgroup fields that use this dataclass with the same `dataclass_fn`,
+    `prefix` and value of `default`. The `dataclass_fn` is ignored when a `default` is given,
+    since it is then a new `functools.partial(dataclasses.replace, default)` every time.
+    """
+    try:
+        # NOTE: The default is identified by its value (not its id), since it might be modified
+        # in-place, or be a new object that reuses the id of one that was garbage-collected.
+        default_key = fingerprint(default) if default is not None else None
+        key: tuple | None = (
+            dataclass_wrapper_class,
+            dataclass_type,
+            prefix,
+            default_key,
+            dataclass_fn if default is None else None,
+        )
+        with _wrapper_templates_lock:
+            template = _wrapper_templates.get(key)
+    except TypeError:
+        # The default can't be fingerprinted, or the dataclass_fn isn't hashable.
+        key = None
+        template = None
+    if template is None:
+        template = dataclass_wrapper_class(
+            dataclass=dataclass_type,
+            name=dataclass_type.__name__,
+            prefix=prefix,
+            # NOTE: Use a copy, so that changes to `default` don't affect the cached template.
+            default=copy.deepcopy(default) if key is not None else default,
+            dataclass_fn=dataclass_fn,
+        )
+        if key is not None:
+            with _wrapper_templates_lock:
+                if len(_wrapper_templates) >= _MAX_WRAPPER_TEMPLATES:
+                    _wrapper_templates.pop(next(iter(_wrapper_templates)))
+                template = _wrapper_templates.setdefault(key, template)
+    return template
+
+
 def _get_subgroup_fields(wrappers: list[DataclassWrapper]) -> dict[str, FieldWrapper]:
     subgroup_fields = {}
     all_wrappers = _flatten_wrappers(wrappers)
@@ -1088,6 +1238,24 @@ def _get_subgroup_fields(wrappers: list[DataclassWrapper]) -> dict[str, FieldWra
     return subgroup_fields
 
 
+def _matches_help_filter(
+    wrapper: DataclassWrapper, group: argparse._ArgumentGroup, help_filter: str
+) -> bool:
+    for destination in wrapper.destinations:
+        without_root = destination.partition(".")[2]
+        for dest in (destination, without_root):
+            if dest == help_filter or dest.startswith(help_filter + "."):
+                return True
+    term = help_filter.lower()
+    if term in (group.title or "").lower():
+        return True
+    return any(
+        term in option_string.lower()
+        for action in group._group_actions
+        for option_string in action.option_strings
+    )
+
+
 def _remove_duplicates(wrappers: list[DataclassWrapper]) -> list[DataclassWrapper]:
     return list(set(wrappers))
 
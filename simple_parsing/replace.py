@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import copy
 import dataclasses
+import functools
 import logging
-from typing import Any, Mapping, overload
+from typing import Any, Iterable, Mapping, overload
 
 from simple_parsing.annotation_utils.get_field_annotations import (
     get_field_type_from_annotations,
@@ -151,6 +152,9 @@ def replace_subgroups(
 
         if is_dataclass_type(value_of_selection):
             field_value = value_of_selection()
+        elif is_dataclass_instance(value_of_selection) and _is_frozen(value_of_selection):
+            # Frozen instances can't be modified, so they can be shared (as with subgroups).
+            field_value = value_of_selection
         elif is_dataclass_instance(value_of_selection):
             field_value = copy.deepcopy(value_of_selection)
         elif field.metadata.get("subgroups", None):
@@ -180,6 +184,148 @@ def replace_subgroups(
     return dataclasses.replace(obj, **replace_kwargs)
 
 
+def replace_many(
+    obj: DataclassT, changes_list: Iterable[Mapping[str, Any]], sep: str = "."
+) -> list[DataclassT]:
+    """Creates one variant of `obj` per dictionary of (flat) changes in `changes_list`.
+
+    This gives the same variants as `[replace(obj, changes) for changes in changes_list]` (each
+    one a new object, even without changes), but is much cheaper when creating lots of variants
+    of a large, deeply nested config:
+    - Each distinct dotted key (e.g. "a.b.c") is only parsed once, into a trie that is shared
+      between all the variants;
+    - Only the dataclasses along the paths that are changed are re-created. All the untouched
+      values and nested dataclasses are shared between the variants and `obj` (no copies).
+
+    NOTE: Since values are shared, mutating a nested value of one variant in-place also affects
+    the other variants and `obj`. Use `copy.deepcopy` on the variants if that is a problem.
+
+    NOTE: Unlike `replace`, which sets the field to a dict in that case, this raises a ValueError
+    when a dotted key goes through a value that isn't a dataclass (e.g. `{"a.b": 1}` when `obj.a`
+    is None). Conflicting changes (e.g. to both "a" and "a.b") also raise a ValueError.
+
+    >>> import dataclasses
+    >>> @dataclasses.dataclass
+    ... class Optimizer:
+    ...     lr: float = 0.1
+    ...     momentum: float = 0.9
+    >>> @dataclasses.dataclass
+    ... class Config:
+    ...     optimizer: Optimizer = dataclasses.field(default_factory=Optimizer)
+    ...     seed: int = 0
+    >>> base = Config()
+    >>> variants = replace_many(base, [{"optimizer.lr": 0.01}, {"seed": 1}])
+    >>> variants
+    [Config(optimizer=Optimizer(lr=0.01, momentum=0.9), seed=0), \
+Config(optimizer=Optimizer(lr=0.1, momentum=0.9), seed=1)]
+    >>> variants[1].optimizer is base.optimizer
+    True
+    """
+    root = _PathTrie(name="", parent=None, original=obj)
+    return [_replace_with_trie(root, changes, sep=sep) for changes in changes_list]
+
+
+class _PathTrie:
+    """Node in the trie of the changed attribute paths, shared between all the variants.
+
+    Each node also holds the (shared) value at that path in the base object, so that it is only
+    retrieved once.
+    """
+
+    __slots__ = ("name", "parent", "depth", "original", "children", "_nodes_for_keys")
+
+    def __init__(self, name: str, parent: _PathTrie | None, original: Any):
+        self.name = name
+        self.parent = parent
+        self.depth: int = 0 if parent is None else parent.depth + 1
+        self.original = original
+        self.children: dict[str, _PathTrie] = {}
+        # The node for each dotted key that was inserted from this node.
+        self._nodes_for_keys: dict[str, _PathTrie] = {}
+
+    @property
+    def path(self) -> str:
+        names = []
+        node: _PathTrie | None = self
+        while node is not None and node.parent is not None:
+            names.append(node.name)
+            node = node.parent
+        return ".".join(reversed(names))
+
+    def child(self, name: str) -> _PathTrie:
+        node = self.children.get(name)
+        if node is None:
+            if not is_dataclass_instance(self.original):
+                raise ValueError(
+                    f"Can't replace the attribute {name!r} at path {self.path!r}: the value at "
+                    f"that path isn't a dataclass ({self.original!r})."
+                )
+            node = _PathTrie(name, parent=self, original=getattr(self.original, name, None))
+            self.children[name] = node
+        return node
+
+    def insert(self, key: str, sep: str = ".") -> _PathTrie:
+        node = self._nodes_for_keys.get(key)
+        if node is None:
+            node = self
+            for name in key.split(sep):
+                node = node.child(name)
+            self._nodes_for_keys[key] = node
+        return node
+
+
+def _replace_with_trie(root: _PathTrie, changes: Mapping[str, Any], sep: str = ".") -> Any:
+    # The new field values of each dataclass (trie node) along the changed paths.
+    new_values: dict[_PathTrie, dict[str, Any]] = {root: {}}
+    for key, value in changes.items():
+        node = root.insert(key, sep=sep)
+        parent = node.parent
+        assert parent is not None
+        if is_dataclass_instance(node.original) and isinstance(value, dict):
+            # Same as in `replace`: dicts of changes for a dataclass field are applied recursively.
+            value = replace(node.original, **value)
+        ancestor = parent
+        while ancestor not in new_values:
+            new_values[ancestor] = {}
+            assert ancestor.parent is not None
+            ancestor = ancestor.parent
+        new_values[parent][node.name] = value
+
+    # Re-create the dataclasses, starting with the most deeply nested ones.
+    for node in sorted(new_values, key=lambda n: n.depth, reverse=True):
+        if node.parent is None:
+            continue
+        parent_values = new_values[node.parent]
+        if node.name in parent_values:
+            raise ValueError(
+                f"Conflicting changes: both {node.path!r} and some of its attributes are replaced."
+            )
+        parent_values[node.name] = _replace_fields(node.original, new_values[node])
+    return _replace_fields(root.original, new_values[root])
+
+
+def _replace_fields(obj: DataclassT, new_values: dict[str, Any]) -> DataclassT:
+    init_fields = _init_field_names(type(obj))
+    for name in new_values:
+        if name not in init_fields and name in _all_field_names(type(obj)):
+            raise ValueError(f"Cannot replace value of non-init field {name}.")
+    return dataclasses.replace(obj, **new_values)
+
+
+@functools.lru_cache(maxsize=None)
+def _init_field_names(dataclass_type: type) -> frozenset[str]:
+    return frozenset(f.name for f in dataclasses.fields(dataclass_type) if f.init)
+
+
+@functools.lru_cache(maxsize=None)
+def _all_field_names(dataclass_type: type) -> frozenset[str]:
+    return frozenset(f.name for f in dataclasses.fields(dataclass_type))
+
+
+def _is_frozen(obj: Any) -> bool:
+    return obj.__dataclass_params__.frozen
+
+
 def _unflatten_selection_dict(
     flattened: Mapping[str, V], keyword: str = "__key__", sep: str = ".", recursive: bool = True
 ) -> PossiblyNestedDict[str, V]:
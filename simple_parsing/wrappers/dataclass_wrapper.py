@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import copy
 import dataclasses
 import functools
 import textwrap
@@ -30,6 +31,24 @@ DataclassWrapperType = TypeVar("DataclassWrapperType", bound="DataclassWrapper")
 
 
 class DataclassWrapper(Wrapper, Generic[DataclassT]):
+    __slots__ = (
+        "dataclass",
+        "dataclass_fn",
+        "prefix",
+        "field_wrapper_class",
+        "fields",
+        "optional",
+        "_name",
+        "_default",
+        "_parent",
+        "_field",
+        "_destinations",
+        "_required",
+        "_explicit",
+        "_children",
+        "_defaults",
+    )
+
     def __init__(
         self,
         dataclass: type[DataclassT],
@@ -63,7 +82,6 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
         self._destinations: list[str] = []
         self._required: bool = False
         self._explicit: bool = False
-        self._dest: str = ""
         self._children: list[DataclassWrapper] = []
         # the default value(s).
         # NOTE: This is a list only because of the `ConflictResolution.ALWAYS_MERGE` option.
@@ -180,7 +198,7 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
 
         logger.debug(f"The dataclass at attribute {self.dest} has default values: {self.defaults}")
 
-    def add_arguments(self, parser: argparse.ArgumentParser):
+    def add_arguments(self, parser: argparse.ArgumentParser) -> argparse._ArgumentGroup:
         from ..parsing import ArgumentParser
 
         parser = cast(ArgumentParser, parser)
@@ -212,6 +230,7 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
             # TODO: Perhaps we could hook into the `action` that is returned here to know if the
             # flag was passed or not for a given field.
             _ = group.add_argument(*wrapped_field.option_strings, **arg_options)
+        return group
 
     def equivalent_argparse_code(self, leading="group") -> str:
         code = ""
@@ -248,10 +267,29 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
     def name(self) -> str:
         return self._name
 
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        self.invalidate()
+
     @property
     def parent(self) -> DataclassWrapper | None:
         return self._parent
 
+    @parent.setter
+    def parent(self, value: DataclassWrapper | None) -> None:
+        self._parent = value
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Clears the cached values of this wrapper and of all the wrappers below it."""
+        super().invalidate()
+        self._destinations = []
+        for field_wrapper in self.fields:
+            field_wrapper.invalidate()
+        for child_wrapper in self._children:
+            child_wrapper.invalidate()
+
     @property
     def defaults(self) -> list[DataclassT | dict[str, Any] | None | Literal[argparse.SUPPRESS]]:
         if self._defaults:
@@ -349,7 +387,7 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
             "\n".join(description.splitlines()[:MAX_DOCSTRING_DESC_LINES_HEIGHT]) + " ..."
         )
 
-        fields_have_docstrings = any(f._docstring.help_string for f in self.fields)
+        fields_have_docstrings = any(f.spec.docstring.help_string for f in self.fields)
         docstring_is_huge = num_lines > MAX_DOCSTRING_DESC_LINES_HEIGHT
         if not fields_have_docstrings:
             # The fields don't have docstrings. Return the entire docstring, regardless of its
@@ -394,17 +432,10 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
             yield from child.descendants
 
     @property
-    def dest(self):
-        lineage = []
-        parent = self.parent
-        while parent is not None:
-            lineage.append(parent.name)
-            parent = parent.parent
-        lineage = list(reversed(lineage))
-        lineage.append(self.name)
-        _dest = ".".join(lineage)
-        # logger.debug(f"getting dest, returning {_dest}")
-        return _dest
+    def dest(self) -> str:
+        if self._dest is None:
+            self._dest = ".".join([w.name for w in reversed(self.lineage())] + [self.name])
+        return self._dest
 
     @property
     def destinations(self) -> list[str]:
@@ -419,6 +450,24 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
     def destinations(self, value: list[str]):
         self._destinations = value
 
+    def clone(self: DataclassWrapperType, name: str, parent: DataclassWrapper | None):
+        """Returns a copy of this tree of wrappers, with the given name and parent.
+
+        The copy shares the (immutable) field specs and default values with `self`, but all the
+        state that is modified while building the parser (prefixes, defaults, destinations, etc.)
+        is copied, so the two trees can be used independently.
+        """
+        new = copy.copy(self)
+        new._name = name
+        new._parent = parent
+        new._dest = None
+        new._lineage = None
+        new._destinations = []
+        new._defaults = list(self._defaults)
+        new.fields = [field_wrapper.clone(parent=new) for field_wrapper in self.fields]
+        new._children = [child.clone(name=child.name, parent=new) for child in self._children]
+        return new
+
     def merge(self, other: DataclassWrapper):
         """Absorb all the relevant attributes from another wrapper.
 
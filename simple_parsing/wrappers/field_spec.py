@@ -0,0 +1,149 @@
+"""Compact, immutable records holding the information about a dataclass field that doesn't depend
+on where the field ends up in the parser.
+
+Everything in a `FieldSpec` is derived from the dataclass and the `dataclasses.Field` alone (the
+resolved type annotation, the help text from the docstrings, the custom argparse options, etc.),
+so it is computed once per field, and shared between all the `FieldWrapper`s for that field (for
+example when the same dataclass is used in multiple places, or in multiple subgroup choices).
+The state that depends on the position of the field in the parser (prefix, dest, defaults, etc.)
+remains on the `FieldWrapper`, since it is modified during conflict resolution.
+"""
+from __future__ import annotations
+
+import dataclasses
+import weakref
+from enum import Enum
+from logging import getLogger
+from typing import Any, NamedTuple
+
+from .. import docstring, utils
+
+logger = getLogger(__name__)
+
+
+class FieldSpec(NamedTuple):
+    """The resolved, position-independent information about a dataclass field."""
+
+    field: dataclasses.Field
+    name: str
+    type: Any
+    """The type annotation of the field, with forward references and `InitVar`s resolved."""
+    docstring: docstring.AttributeDocString
+    help: str | None
+    """The help from the `help` argument of the field, or from the docstrings, if any."""
+    metavar: str | None
+    custom_arg_options: dict[str, Any]
+    aliases: list[str]
+    choices: list | None
+    choice_dict: dict[str, Any] | None
+    is_list: bool
+    is_enum: bool
+    is_tuple: bool
+    is_bool: bool
+    is_optional: bool
+    is_union: bool
+    is_subparser: bool
+    is_subgroup: bool
+
+
+# The specs of the fields of each dataclass type, indexed by field name.
+_field_specs: weakref.WeakKeyDictionary[type, dict[str, FieldSpec]] = weakref.WeakKeyDictionary()
+
+
+def get_field_spec(dataclass: type | None, field: dataclasses.Field) -> FieldSpec:
+    """Returns the `FieldSpec` for the given field of `dataclass`, computing it only once."""
+    if dataclass is None:
+        return _create_field_spec(None, field)
+    specs = _field_specs.setdefault(dataclass, {})
+    spec = specs.get(field.name)
+    # NOTE: Also check the field, in case it was replaced on the dataclass.
+    if spec is None or spec.field is not field:
+        spec = specs[field.name] = _create_field_spec(dataclass, field)
+    return spec
+
+
+def _create_field_spec(dataclass: type | None, field: dataclasses.Field) -> FieldSpec:
+    field_type = _resolve_field_type(dataclass, field)
+    try:
+        attribute_docstring = docstring.get_attribute_docstring(dataclass, field.name)
+    except (SystemExit, Exception) as e:
+        logger.debug(f"Couldn't find attribute docstring for field {field.name}, {e}")
+        attribute_docstring = docstring.AttributeDocString()
+
+    help = field.metadata.get("help") or (
+        attribute_docstring.docstring_below
+        or attribute_docstring.comment_above
+        or attribute_docstring.comment_inline
+        or attribute_docstring.desc_from_cls_docstring
+    )
+    custom_arg_options: dict[str, Any] = field.metadata.get("custom_args", {})
+    return FieldSpec(
+        field=field,
+        name=field.name,
+        type=field_type,
+        docstring=attribute_docstring,
+        # NOTE: Need to make sure this doesn't interfere with the default value added to the help
+        # string.
+        help=help or None,
+        metavar=custom_arg_options.get("metavar"),
+        custom_arg_options=custom_arg_options,
+        aliases=field.metadata.get("alias", []),
+        choices=_get_choices(field, field_type, custom_arg_options),
+        choice_dict=_get_choice_dict(field, field_type),
+        is_list=utils.is_list(field_type),
+        is_enum=utils.is_enum(field_type),
+        is_tuple=utils.is_tuple(field_type),
+        is_bool=utils.is_bool(field_type),
+        is_optional=utils.is_optional(field.type),
+        is_union=utils.is_union(field.type),
+        is_subparser=utils.is_subparser_field(field) and "subgroups" not in field.metadata,
+        is_subgroup="subgroups" in field.metadata,
+    )
+
+
+def _resolve_field_type(dataclass: type | None, field: dataclasses.Field) -> Any:
+    field_type = field.type
+    if isinstance(field_type, str):
+        # The type of the field might be a string when using `from __future__ import annotations`.
+        # NOTE: Here we'd like to convert the fields type to an actual type, in case the
+        # `from __future__ import annotations` feature is used.
+        # This should also resolve most forward references.
+        from simple_parsing.annotation_utils.get_field_annotations import (
+            get_field_type_from_annotations,
+        )
+
+        assert dataclass is not None
+        return get_field_type_from_annotations(dataclass, field.name)
+    if isinstance(field_type, dataclasses.InitVar):
+        return field_type.type
+    return field_type
+
+
+def _get_choices(
+    field: dataclasses.Field, field_type: Any, custom_arg_options: dict[str, Any]
+) -> list | None:
+    """The list of possible values that can be passed on the command-line for this field, or
+    None."""
+    if "choices" in custom_arg_options:
+        return custom_arg_options["choices"]
+    if "choices" in field.metadata:
+        return list(field.metadata["choices"])
+    if "choice_dict" in field.metadata:
+        return list(field.metadata["choice_dict"].keys())
+    if utils.is_literal(field_type):
+        literal_values = list(utils.get_args(field_type))
+        literal_value_names = [v.name if isinstance(v, Enum) else str(v) for v in literal_values]
+        return literal_value_names
+    return None
+
+
+def _get_choice_dict(field: dataclasses.Field, field_type: Any) -> dict[str, Any] | None:
+    if "choice_dict" in field.metadata:
+        return field.metadata["choice_dict"]
+    if utils.is_literal(field_type):
+        literal_values = list(utils.get_args(field_type))
+        assert literal_values, "Literal always has at least one argument."
+        # We map from literal values (as strings) to the actual values.
+        # e.g. from BLUE -> Color.Blue
+        return {(v.name if isinstance(v, Enum) else str(v)): v for v in literal_values}
+    return None
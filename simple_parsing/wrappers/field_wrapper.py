@@ -1,23 +1,26 @@
 from __future__ import annotations
 
 import argparse
+import copy
 import dataclasses
+import functools
 import inspect
 import sys
 import typing
 from enum import Enum, auto
 from logging import getLogger
-from typing import Any, Callable, ClassVar, Hashable, Union, cast
+from typing import Any, Callable, ClassVar, Dict, Hashable, Union, cast
 
 from typing_extensions import Literal
 
 from simple_parsing.help_formatter import TEMPORARY_TOKEN
 
-from .. import docstring, utils
+from .. import utils
 from ..helpers.custom_actions import BooleanOptionalAction
 from ..utils import Dataclass
 from .field_metavar import get_metavar
 from .field_parsing import get_parsing_fn
+from .field_spec import FieldSpec, get_field_spec
 from .wrapper import Wrapper
 
 if typing.TYPE_CHECKING:
@@ -85,8 +88,26 @@ class FieldWrapper(Wrapper):
     in the rest and may overwrite these values, depending on the type of field.
 
     The `field` argument is the actually wrapped `dataclasses.Field` instance.
+
+    The information about the field that doesn't depend on its position in the parser (type, help,
+    choices, etc.) is held in a `FieldSpec`, which is shared between all the wrappers of that field.
     """
 
+    __slots__ = (
+        "field",
+        "prefix",
+        "spec",
+        "_parent",
+        "_option_strings",
+        "_required",
+        "_help",
+        "_metavar",
+        "_default",
+        "_arg_options",
+        "_dest_field",
+        "_results",
+    )
+
     # Whether or not `simple_parsing` should add option_string variants where
     # underscores in attribute names are replaced with dashes.
     # For example, when set to DashVariant.UNDERSCORE_AND_DASH,
@@ -110,25 +131,19 @@ class FieldWrapper(Wrapper):
         self._parent: Any = parent
         # Holders used to 'cache' the properties.
         # (could've used cached_property with Python 3.8).
-        self._option_strings: set[str] | None = None
+        # The option strings are stored along with the values they were computed from.
+        self._option_strings: tuple[tuple, list[str]] | None = None
         self._required: bool | None = None
-
-        try:
-            self._docstring = docstring.get_attribute_docstring(
-                self.parent.dataclass, self.field.name
-            )
-        except (SystemExit, Exception) as e:
-            logger.debug(f"Couldn't find attribute docstring for field {self.name}, {e}")
-            self._docstring = docstring.AttributeDocString()
+        self.spec: FieldSpec = get_field_spec(
+            parent.dataclass if parent is not None else None, field
+        )
 
         self._help: str | None = None
         self._metavar: str | None = None
         self._default: Any | list[Any] | None = None
-        self._dest: str | None = None
         # the argparse-related options:
         self._arg_options: dict[str, Any] = {}
         self._dest_field: FieldWrapper | None = None
-        self._type: type[Any] | None = None
 
         # stores the resulting values for each of the destination attributes.
         self._results: dict[str, Any] = {}
@@ -554,7 +569,7 @@ class FieldWrapper(Wrapper):
         that would usually be passed to the parser.add_argument(
         *option_strings, **kwargs) method.
         """
-        return self.field.metadata.get("custom_args", {})
+        return self.spec.custom_arg_options
 
     @property
     def destinations(self) -> list[str]:
@@ -578,7 +593,20 @@ class FieldWrapper(Wrapper):
 
         For an illustration of this, see the aliases example.
         """
+        # NOTE: The option strings are cached, and recomputed whenever one of the values they
+        # depend on changes (e.g. when the prefix is changed during conflict resolution).
+        cache_key = (
+            self.prefix,
+            self.dest,
+            FieldWrapper.add_dash_variants,
+            type(self).argument_generation_mode,
+            type(self).nested_mode,
+        )
+        if self._option_strings is None or self._option_strings[0] != cache_key:
+            self._option_strings = (cache_key, self._get_option_strings())
+        return list(self._option_strings[1])
 
+    def _get_option_strings(self) -> list[str]:
         dashes: list[str] = []  # contains the leading dashes.
         options: list[str] = []  # contains the name following the dashes.
 
@@ -659,17 +687,19 @@ class FieldWrapper(Wrapper):
 
     @property
     def aliases(self) -> list[str]:
-        return self.field.metadata.get("alias", [])
+        return self.spec.aliases
 
     @property
     def dest(self) -> str:
         """Where the attribute will be stored in the Namespace."""
-        self._dest = super().dest
-        # TODO: If a custom `dest` was passed, and it is a `Field` instance,
-        # find the corresponding FieldWrapper and use its `dest` instead of ours.
-        if self.dest_field:
-            self._dest = self.dest_field.dest
-            self.custom_arg_options.pop("dest", None)
+        if self._dest is None:
+            dest = super().dest
+            # TODO: If a custom `dest` was passed, and it is a `Field` instance,
+            # find the corresponding FieldWrapper and use its `dest` instead of ours.
+            if self.dest_field:
+                dest = self.dest_field.dest
+                self.custom_arg_options.pop("dest", None)
+            self._dest = dest
         return self._dest
 
     @property
@@ -826,25 +856,7 @@ class FieldWrapper(Wrapper):
     @property
     def type(self) -> type[Any]:
         """Returns the wrapped field's type annotation."""
-        # TODO: Refactor this. Really ugly.
-        if self._type is None:
-            self._type = self.field.type
-            if isinstance(self._type, str):
-                # The type of the field might be a string when using `from __future__ import annotations`.
-                # NOTE: Here we'd like to convert the fields type to an actual type, in case the
-                # `from __future__ import annotations` feature is used.
-                # This should also resolve most forward references.
-                from simple_parsing.annotation_utils.get_field_annotations import (
-                    get_field_type_from_annotations,
-                )
-
-                field_type = get_field_type_from_annotations(
-                    self.parent.dataclass, self.field.name
-                )
-                self._type = field_type
-            elif isinstance(self._type, dataclasses.InitVar):
-                self._type = self._type.type
-        return self._type
+        return self.spec.type
 
     def __str__(self):
         return f"""<FieldWrapper for field '{self.dest}'>"""
@@ -857,51 +869,17 @@ class FieldWrapper(Wrapper):
     def choices(self) -> list | None:
         """The list of possible values that can be passed on the command-line for this field, or
         None."""
-
-        if "choices" in self.custom_arg_options:
-            return self.custom_arg_options["choices"]
-        if "choices" in self.field.metadata:
-            return list(self.field.metadata["choices"])
-        if "choice_dict" in self.field.metadata:
-            return list(self.field.metadata["choice_dict"].keys())
-        if utils.is_literal(self.type):
-            literal_values = list(utils.get_args(self.type))
-            literal_value_names = [
-                v.name if isinstance(v, Enum) else str(v) for v in literal_values
-            ]
-            return literal_value_names
-        return None
+        return self.spec.choices
 
     @property
     def choice_dict(self) -> dict[str, Any] | None:
-        if "choice_dict" in self.field.metadata:
-            return self.field.metadata["choice_dict"]
-        if utils.is_literal(self.type):
-            literal_values = list(utils.get_args(self.type))
-            assert literal_values, "Literal always has at least one argument."
-            # We map from literal values (as strings) to the actual values.
-            # e.g. from BLUE -> Color.Blue
-            return {(v.name if isinstance(v, Enum) else str(v)): v for v in literal_values}
-        return None
+        return self.spec.choice_dict
 
     @property
     def help(self) -> str | None:
         if self._help:
             return self._help
-        if self.field.metadata.get("help"):
-            return self.field.metadata.get("help")
-
-        self._help = (
-            self._docstring.docstring_below
-            or self._docstring.comment_above
-            or self._docstring.comment_inline
-            or self._docstring.desc_from_cls_docstring
-        )
-        # NOTE: Need to make sure this doesn't interfere with the default value added to the help
-        # string.
-        if self._help == "":
-            self._help = None
-        return self._help
+        return self.spec.help
 
     @help.setter
     def help(self, value: str):
@@ -912,8 +890,7 @@ class FieldWrapper(Wrapper):
         """Returns the 'metavar' when set using one of the `field` functions, else None."""
         if self._metavar:
             return self._metavar
-        self._metavar = self.custom_arg_options.get("metavar")
-        return self._metavar
+        return self.spec.metavar
 
     @metavar.setter
     def metavar(self, value: str):
@@ -925,35 +902,35 @@ class FieldWrapper(Wrapper):
 
     @property
     def is_list(self):
-        return utils.is_list(self.type)
+        return self.spec.is_list
 
     @property
     def is_enum(self) -> bool:
-        return utils.is_enum(self.type)
+        return self.spec.is_enum
 
     @property
     def is_tuple(self) -> bool:
-        return utils.is_tuple(self.type)
+        return self.spec.is_tuple
 
     @property
     def is_bool(self) -> bool:
-        return utils.is_bool(self.type)
+        return self.spec.is_bool
 
     @property
     def is_optional(self) -> bool:
-        return utils.is_optional(self.field.type)
+        return self.spec.is_optional
 
     @property
     def is_union(self) -> bool:
-        return utils.is_union(self.field.type)
+        return self.spec.is_union
 
     @property
     def is_subparser(self) -> bool:
-        return utils.is_subparser_field(self.field) and "subgroups" not in self.field.metadata
+        return self.spec.is_subparser
 
     @property
     def is_subgroup(self) -> bool:
-        return "subgroups" in self.field.metadata
+        return self.spec.is_subgroup
 
     @property
     def subgroup_choices(self) -> dict[Hashable, Callable[[], Dataclass] | Dataclass]:
@@ -975,6 +952,31 @@ class FieldWrapper(Wrapper):
     def parent(self) -> DataclassWrapper:
         return self._parent
 
+    @parent.setter
+    def parent(self, value: DataclassWrapper) -> None:
+        self._parent = value
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        super().invalidate()
+        self._dest_field = None
+
+    def clone(self, parent: DataclassWrapper) -> FieldWrapper:
+        """Returns a copy of this wrapper, with the given parent.
+
+        See `DataclassWrapper.clone` for more info.
+        """
+        new = copy.copy(self)
+        new._parent = parent
+        new.invalidate()
+        new._option_strings = None
+        new._arg_options = {}
+        new._results = {}
+        if self.field.default_factory is not dataclasses.MISSING and self._default is not None:
+            # Don't share mutable default values (e.g. lists) between the copies.
+            new._default = copy.deepcopy(self._default)
+        return new
+
     @property
     def subparsers_dict(self) -> dict[str, type] | None:
         """The dict of subparsers, which is created either when using a Union[<dataclass_1>,
@@ -1018,13 +1020,28 @@ class FieldWrapper(Wrapper):
         if default_value is not dataclasses.MISSING:
             parser.set_defaults(**{self.dest: default_value})
         # subparsers.required = default_value is dataclasses.MISSING
-        for subcommand, dataclass_type in self.subparsers_dict.items():
-            logger.debug(f"adding subparser '{subcommand}' for type {dataclass_type}")
-            subparser = subparsers.add_parser(subcommand)
-            # Just for typing correctness, as we didn't explicitly change
-            # the return type of subparsers.add_parser method.)
-            subparser = cast("ArgumentParser", subparser)
-            subparser.add_arguments(dataclass_type, dest=self.dest)
+
+        # NOTE: The subparsers are only created when their subcommand is used (or when they are
+        # otherwise accessed), since creating them all up-front is costly when there are many
+        # subcommands with large configs.
+        def _subparser_fn(subcommand: str, dataclass_type: type) -> Callable[[], ArgumentParser]:
+            def _create_subparser() -> ArgumentParser:
+                logger.debug(f"adding subparser '{subcommand}' for type {dataclass_type}")
+                subparser = subparsers.add_parser(subcommand)
+                # Just for typing correctness, as we didn't explicitly change
+                # the return type of subparsers.add_parser method.)
+                subparser = cast("ArgumentParser", subparser)
+                subparser.add_arguments(dataclass_type, dest=self.dest)
+                return subparser
+
+            return _create_subparser
+
+        subparsers._name_parser_map = subparsers.choices = _LazyParserMap(
+            {
+                subcommand: _subparser_fn(subcommand, dataclass_type)
+                for subcommand, dataclass_type in self.subparsers_dict.items()
+            }
+        )
 
     def equivalent_argparse_code(self):
         arg_options = self.arg_options.copy()
@@ -1033,6 +1050,49 @@ class FieldWrapper(Wrapper):
         return f"group.add_argument(*{self.option_strings}, **{arg_options_string})"
 
 
+class _LazyParserMap(Dict[str, Any]):
+    """Mapping from subcommand to subparser, where each subparser is only created when needed.
+
+    This is used as the `choices` of the subparsers action: argparse only needs the keys to check
+    the value of the subcommand, and then retrieves the parser of the chosen subcommand.
+    """
+
+    def __init__(self, parser_fns: dict[str, Callable[[], argparse.ArgumentParser]]):
+        super().__init__(dict.fromkeys(parser_fns))
+        self._parser_fns = parser_fns
+        # The subcommand whose parser is being created with `subparsers.add_parser`.
+        self._creating: str | None = None
+
+    def __getitem__(self, subcommand: str) -> argparse.ArgumentParser:
+        parser_fn = self._parser_fns.pop(subcommand, None)
+        if parser_fn is not None:
+            self._creating = subcommand
+            try:
+                # NOTE: This calls `subparsers.add_parser`, which stores the parser in this map.
+                parser_fn()
+            finally:
+                self._creating = None
+        return super().__getitem__(subcommand)
+
+    def __contains__(self, subcommand: object) -> bool:
+        # NOTE: `add_parser` checks that the subcommand isn't already in the map (in python>=3.11).
+        return subcommand != self._creating and super().__contains__(subcommand)
+
+    def __setitem__(self, subcommand: str, parser: argparse.ArgumentParser) -> None:
+        # A parser added with `subparsers.add_parser` replaces the lazy one.
+        self._parser_fns.pop(subcommand, None)
+        super().__setitem__(subcommand, parser)
+
+    def get(self, subcommand: str, default: Any = None) -> Any:
+        return self[subcommand] if subcommand in self else default
+
+    def values(self):  # type: ignore
+        return [self[subcommand] for subcommand in self]
+
+    def items(self):  # type: ignore
+        return [(subcommand, self[subcommand]) for subcommand in self]
+
+
 def only_keep_action_args(options: dict[str, Any], action: str | Any) -> dict[str, Any]:
     """Remove all the arguments in `options` that aren't required by the Action.
 
@@ -1069,15 +1129,13 @@ def only_keep_action_args(options: dict[str, Any], action: str | Any) -> dict[st
 
     # Remove all the keys that aren't needed by the action constructor:
     action_class = argparse_action_classes[action]
-    argspec = inspect.getfullargspec(action_class)
+    args_to_keep = _get_action_args(action_class)
 
-    if argspec.varargs is not None or argspec.varkw is not None:
+    if args_to_keep is None:
         # if the constructor takes variable arguments, pass all the options.
         logger.debug("Constructor takes var args. returning all options.")
         return options
 
-    args_to_keep = argspec.args + ["action"]
-
     kept_options, deleted_options = utils.keep_keys(options, args_to_keep)
     if deleted_options:
         logger.debug(
@@ -1088,3 +1146,12 @@ def only_keep_action_args(options: dict[str, Any], action: str | Any) -> dict[st
         logger.debug(f"Kept options: \t{kept_options.keys()}")
         logger.debug(f"Removed options: \t{deleted_options.keys()}")
     return kept_options
+
+
+@functools.lru_cache(maxsize=None)
+def _get_action_args(action_class: type[argparse.Action]) -> tuple[str, ...] | None:
+    """Returns the arguments of the Action constructor, or None if it takes variable arguments."""
+    argspec = inspect.getfullargspec(action_class)
+    if argspec.varargs is not None or argspec.varkw is not None:
+        return None
+    return tuple(argspec.args) + ("action",)
@@ -5,8 +5,11 @@ from typing import List, Optional
 
 
 class Wrapper(ABC):
+    __slots__ = ("_dest", "_lineage")
+
     def __init__(self):
         self._dest: Optional[str] = None
+        self._lineage: Optional[List["Wrapper"]] = None
 
     @abstractmethod
     def equivalent_argparse_code(self) -> str:
@@ -25,25 +28,34 @@ class Wrapper(ABC):
     @property
     def dest(self) -> str:
         """Where the attribute will be stored in the Namespace."""
-        lineage_names: List[str] = [w.name for w in self.lineage()]
-        self._dest = ".".join(reversed([self.name] + lineage_names))
-        assert self._dest is not None
+        if self._dest is None:
+            lineage_names: List[str] = [w.name for w in self.lineage()]
+            self._dest = ".".join(reversed([self.name] + lineage_names))
         return self._dest
 
     def lineage(self) -> List["Wrapper"]:
-        lineage: List[Wrapper] = []
-        parent = self.parent
-        while parent is not None:
-            lineage.append(parent)
-            parent = parent.parent
-        return lineage
+        """Returns the parents of this wrapper, starting with the closest one.
+
+        NOTE: The returned list is cached, and shouldn't be modified.
+        """
+        if self._lineage is None:
+            lineage: List[Wrapper] = []
+            parent = self.parent
+            while parent is not None:
+                lineage.append(parent)
+                parent = parent.parent
+            self._lineage = lineage
+        return self._lineage
 
     @property
     def nesting_level(self) -> int:
         return len(self.lineage())
-        level = 0
-        parent = self.parent
-        while parent is not None:
-            parent = parent.parent
-            level += 1
-        return level
+
+    def invalidate(self) -> None:
+        """Clears the cached values that depend on the position of this wrapper in the tree.
+
+        This is called whenever the parent or the name of this wrapper (or one of its parents)
+        changes.
+        """
+        self._dest = None
+        self._lineage = None
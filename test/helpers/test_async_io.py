@@ -0,0 +1,79 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List
+
+from simple_parsing.helpers.serialization import (
+    LoadError,
+    Serializable,
+    aload,
+    aload_all,
+    asave,
+    save,
+)
+
+
+@dataclass
+class Config(Serializable):
+    name: str = "bob"
+    values: List[int] = field(default_factory=list)
+
+
+def test_asave_and_aload(tmp_path: Path):
+    async def main():
+        config = Config(name="alice", values=[1, 2, 3])
+        await config.asave(tmp_path / "config.json")
+        assert await Config.aload(tmp_path / "config.json") == config
+        await asave(config, tmp_path / "config.yaml")
+        assert await aload(Config, tmp_path / "config.yaml") == config
+
+    asyncio.run(main())
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["config.json", "config.yaml"]
+
+
+def test_aload_all(tmp_path: Path):
+    configs = [Config(name=f"config_{i}") for i in range(10)]
+    paths = [tmp_path / f"config_{i}.json" for i in range(10)]
+    for config, path in zip(configs, paths):
+        config.save(path)
+    paths[3].write_text("{")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = asyncio.run(aload_all(Config, paths, executor=executor))
+    assert results[:3] == configs[:3] and results[4:] == configs[4:]
+    assert isinstance(results[3], LoadError)
+    assert asyncio.run(Config.aload_all(paths[:3])) == configs[:3]
+
+
+def test_concurrent_writes_are_atomic(tmp_path: Path):
+    """Readers never see a partially written file, even with many concurrent writers."""
+    path = tmp_path / "config.json"
+    configs = [Config(name=str(i), values=list(range(i * 1000))) for i in range(1, 9)]
+    save(configs[0], path)
+    stop = threading.Event()
+    torn_reads: List[str] = []
+
+    def read_continuously():
+        while not stop.is_set():
+            contents = path.read_text()
+            try:
+                json.loads(contents)
+            except ValueError:
+                torn_reads.append(contents)
+
+    async def write_concurrently():
+        await asyncio.gather(*(asave(config, path) for config in configs * 5))
+
+    reader = threading.Thread(target=read_continuously)
+    reader.start()
+    try:
+        asyncio.run(write_concurrently())
+    finally:
+        stop.set()
+        reader.join()
+    assert not torn_reads
+    assert Config.load(path) in configs
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -57,7 +58,7 @@ def test_encoding_with_dc_types(
 
 @pytest.fixture(autouse=True)
 def reset_encoding_fns():
-    from simple_parsing.helpers.serialization.decoding import _decoding_fns
+    from simple_parsing.helpers.serialization.decoding import _decoding_fns, _field_decoding_fns
 
     copy = _decoding_fns.copy()
     # info = get_decoding_fn.cache_info()
@@ -66,6 +67,7 @@ def reset_encoding_fns():
 
     _decoding_fns.clear()
     _decoding_fns.update(copy)
+    _field_decoding_fns.clear()
 
 
 @pytest.mark.parametrize("file_type", [".json", pytest.param(".yaml", marks=needs_yaml)])
@@ -103,3 +105,45 @@ def test_encoding_inner_dc_types_raises_warning_and_doest_work(tmp_path: Path, f
 
     # assert loaded_obj == obj  # BUG? This comparison fails, because:
     # assert type(loaded_obj.item) == type(obj.item)  # These two types are *sometimes* different?!
+
+
+@pytest.fixture()
+def reset_registered_dc_types():
+    from simple_parsing.helpers.serialization import serializable
+
+    registered = serializable._registered_dc_types.copy()
+    only_registered = serializable._only_registered_dc_types
+    yield
+    serializable._registered_dc_types.clear()
+    serializable._registered_dc_types.update(registered)
+    serializable._only_registered_dc_types = only_registered
+
+
+@pytest.mark.usefixtures("reset_registered_dc_types")
+def test_only_registered_dc_types():
+    from simple_parsing.helpers.serialization import from_dict, register_dc_types, to_dict
+
+    obj = Container(item=BB(b="hey", extra_field=111))
+    d = to_dict(obj, save_dc_types=True)
+
+    register_dc_types(Container, f"{BB.__module__}.BB", only_registered=True)
+    assert from_dict(Container, d) == obj
+
+    module_name = "some_unexpected_module"
+    with pytest.raises(ImportError, match="register_dc_types"):
+        from_dict(Container, {"item": {"_type_": f"{module_name}.A", "a": 1}})
+    assert module_name not in sys.modules
+
+    with pytest.raises(ImportError, match="register_dc_types"):
+        from_dict(Container, to_dict(Container(item=B()), save_dc_types=True))
+    register_dc_types(only_registered=False)
+    assert from_dict(Container, to_dict(Container(item=B()), save_dc_types=True)) == Container(
+        item=B()
+    )
+
+
+def test_dc_type_must_be_a_dataclass():
+    from simple_parsing.helpers.serialization import from_dict
+
+    with pytest.raises(TypeError, match="isn't a dataclass type"):
+        from_dict(Container, {"item": {"_type_": "os.getcwd"}})
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import hashlib
+import importlib
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+
+import pytest
+
+from simple_parsing.helpers.serialization import (
+    fingerprint,
+    register_fingerprint_fn,
+    update_fingerprint,
+)
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@dataclass
+class Inner:
+    a: int = 1
+    b: float = 0.5
+    color: Color = Color.RED
+
+
+@dataclass
+class Outer:
+    inner: Inner = field(default_factory=Inner)
+    name: str = "bob"
+    tags: dict[str, int] = field(default_factory=dict)
+    sizes: tuple[int, ...] = (1, 2)
+    path: Path = Path("foo")
+    cache: dict = field(default_factory=dict, compare=False)
+
+
+def test_equal_configs_have_equal_fingerprints():
+    assert fingerprint(Outer()) == fingerprint(Outer())
+    assert fingerprint(Outer(tags={"a": 1, "b": 2})) == fingerprint(Outer(tags={"b": 2, "a": 1}))
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        Outer(inner=Inner(a=2)),
+        Outer(inner=Inner(b=0.25)),
+        Outer(inner=Inner(color=Color.BLUE)),
+        Outer(name="bobby"),
+        Outer(tags={"a": 1}),
+        Outer(sizes=(1, 2, 3)),
+        Outer(sizes=[1, 2]),  # type: ignore
+        Outer(path=Path("bar")),
+    ],
+)
+def test_different_configs_have_different_fingerprints(other: Outer):
+    assert fingerprint(Outer()) != fingerprint(other)
+
+
+def test_fields_not_compared_are_ignored():
+    assert fingerprint(Outer()) == fingerprint(Outer(cache={"a": 1}))
+
+
+def test_type_aware_encoding():
+    assert fingerprint(1) != fingerprint(1.0)
+    assert fingerprint(1) != fingerprint("1")
+    assert fingerprint(True) != fingerprint(1)
+    assert fingerprint(None) != fingerprint("None")
+    assert fingerprint(0.0) == fingerprint(-0.0)
+    assert fingerprint(float("nan")) == fingerprint(float("nan"))
+    assert fingerprint({1, 2, 3}) == fingerprint({3, 2, 1})
+    assert fingerprint(["ab", "c"]) != fingerprint(["a", "bc"])
+
+
+def test_stable_value():
+    """The fingerprints should be stable across processes and versions."""
+    assert fingerprint((1, 0.5, "red", None, {"a": [True]})) == "48404fbfa1b1a4f8"
+
+
+def test_update_fingerprint():
+    hash_object = update_fingerprint(hashlib.sha256(), Outer())
+    assert hash_object.hexdigest()[:16] == fingerprint(Outer())
+    assert len(fingerprint(Outer(), size=64)) == 64
+    assert fingerprint(Outer(), hash_fn=hashlib.md5) != fingerprint(Outer())
+
+
+def test_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    assert fingerprint(np.arange(6)) == fingerprint(np.arange(6))
+    assert fingerprint(np.arange(6)) != fingerprint(np.arange(6).reshape(2, 3))
+    assert fingerprint(np.arange(6)) != fingerprint(np.arange(6, dtype=np.float32))
+    # Non-contiguous arrays are fingerprinted using their values.
+    assert fingerprint(np.arange(6)[::2]) == fingerprint(np.array([0, 2, 4]))
+    # Numpy scalars are fingerprinted like python scalars.
+    assert fingerprint(np.float64(0.5)) == fingerprint(0.5)
+    assert fingerprint(np.int32(3)) == fingerprint(3)
+
+
+def test_unsupported_type():
+    class Foo:
+        pass
+
+    with pytest.raises(TypeError, match="register_fingerprint_fn"):
+        fingerprint(Foo())
+
+
+@pytest.fixture()
+def reset_fingerprint_fns():
+    # NOTE: `simple_parsing.helpers.serialization.fingerprint` is shadowed by the function.
+    fingerprint_module = importlib.import_module(
+        "simple_parsing.helpers.serialization.fingerprint"
+    )
+    registered = fingerprint_module._fingerprint_fns.copy()
+    yield
+    fingerprint_module._fingerprint_fns.clear()
+    fingerprint_module._fingerprint_fns.update(registered)
+    fingerprint_module._reset_encoders()
+
+
+@pytest.mark.usefixtures("reset_fingerprint_fns")
+def test_register_fingerprint_fn():
+    class Foo:
+        def __init__(self, v: int):
+            self.v = v
+
+    register_fingerprint_fn(Foo, lambda foo: foo.v)
+    assert fingerprint(Foo(1)) == fingerprint(Foo(1))
+    assert fingerprint(Foo(1)) != fingerprint(Foo(2))
@@ -0,0 +1,56 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from simple_parsing.helpers.serialization import LoadError, Serializable, load_all
+
+from ..testutils import needs_yaml
+
+
+@dataclass
+class Config(Serializable):
+    name: str = "bob"
+    lr: float = 0.1
+    layers: List[int] = field(default_factory=lambda: [32, 32])
+
+
+def _make_corpus(tmp_path: Path, n: int, suffix: str) -> Tuple[List[Path], List[Config]]:
+    configs = [Config(name=f"config_{i}", lr=i / n, layers=[i, i + 1]) for i in range(n)]
+    paths = [tmp_path / f"config_{i}{suffix}" for i in range(n)]
+    for config, path in zip(configs, paths):
+        config.save(path)
+    return paths, configs
+
+
+@pytest.mark.parametrize("backend", ["process", "thread"])
+@pytest.mark.parametrize("suffix", [".json", pytest.param(".yaml", marks=needs_yaml)])
+def test_load_all(tmp_path: Path, backend: str, suffix: str):
+    paths, configs = _make_corpus(tmp_path, 20, suffix)
+    assert load_all(Config, paths, workers=2, backend=backend, chunksize=3) == configs
+    assert Config.load_all(paths, workers=2, backend=backend) == configs
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_errors_dont_abort_the_batch(tmp_path: Path, workers: int):
+    paths, configs = _make_corpus(tmp_path, 6, ".json")
+    paths[2].write_text("{invalid json")
+    paths[4] = tmp_path / "missing.json"
+
+    results = load_all(Config, paths, workers=workers, chunksize=2)
+    assert len(results) == len(paths)
+    for i, result in enumerate(results):
+        if i in (2, 4):
+            assert isinstance(result, LoadError)
+            assert result.path == str(paths[i])
+        else:
+            assert result == configs[i]
+    assert "JSONDecodeError" in str(results[2])
+    assert "FileNotFoundError" in str(results[4])
+
+
+def test_invalid_backend(tmp_path: Path):
+    paths, _ = _make_corpus(tmp_path, 4, ".json")
+    with pytest.raises(ValueError, match="backend"):
+        load_all(Config, paths, workers=2, backend="gpu")  # type: ignore
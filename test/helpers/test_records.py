@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+
+from simple_parsing.helpers.serialization import (
+    RecordFile,
+    Serializable,
+    load_records,
+    save_records,
+)
+from simple_parsing.helpers.serialization.records import write_records
+
+
+@dataclass
+class Inner(Serializable):
+    a: int = 1
+    b: float = 0.5
+
+
+@dataclass
+class Config(Serializable):
+    name: str = "bob"
+    inner: Inner = field(default_factory=Inner)
+    tags: dict[str, int] = field(default_factory=dict)
+    sizes: list[int] = field(default_factory=list)
+    seed: int | None = None
+
+
+configs = [
+    Config(),
+    Config(name="alice", inner=Inner(a=-3, b=1e-9), tags={"x": 1}, sizes=[1, 200, 2**40]),
+    Config(name="ünïcode", seed=2**70, sizes=[-(2**63)]),
+]
+
+
+def test_save_and_load_records(tmp_path: Path):
+    path = tmp_path / "configs.records"
+    assert save_records(configs, path) == len(configs)
+    assert load_records(Config, path) == configs
+
+    with RecordFile(path, Config) as records:
+        assert len(records) == 3
+        assert records[2] == configs[2]
+        assert records[-1] == configs[-1]
+        assert records[1:] == configs[1:]
+        assert records.get_dict(1) == configs[1].to_dict()
+        with pytest.raises(IndexError):
+            records[3]
+
+
+def test_field_names_are_stored_once(tmp_path: Path):
+    path = tmp_path / "configs.records"
+    save_records(configs * 100, path)
+    assert path.read_bytes().count(b"inner") == 1
+    json_size = len(json.dumps([c.to_dict() for c in configs * 100]))
+    assert path.stat().st_size < json_size / 2
+
+
+def test_records_that_dont_match_the_schema(tmp_path: Path):
+    """Records with other fields than the first record are saved with their keys."""
+    path = tmp_path / "records.records"
+    records = [{"a": 1, "b": {"c": 2}}, {"a": 2, "b": {"d": 3}}, {"x": [None, True, b"\x00"]}]
+    with open(path, "wb") as f:
+        write_records(f, records)
+    with RecordFile(path) as record_file:
+        assert record_file[:] == records
+
+
+def test_single_config_with_extension(tmp_path: Path):
+    path = tmp_path / "config.records"
+    configs[1].save(path)
+    assert Config.load(path) == configs[1]
+
+
+def test_warns_when_dataclass_changed(tmp_path: Path):
+    path = tmp_path / "configs.records"
+    save_records(configs, path)
+
+    @dataclass
+    class Config(Serializable):  # type: ignore
+        name: str = "bob"
+        inner: Inner = field(default_factory=Inner)
+        tags: dict[str, int] = field(default_factory=dict)
+        sizes: list[int] = field(default_factory=list)
+        seed: int | None = None
+        new_field: int = 0
+
+    with pytest.warns(RuntimeWarning, match="different version"):
+        records = RecordFile(path, Config)
+    assert dataclasses.asdict(records[0]) == {**dataclasses.asdict(configs[0]), "new_field": 0}
+    records.close()
+
+
+def test_empty_file(tmp_path: Path):
+    path = tmp_path / "configs.records"
+    assert save_records([], path) == 0
+    assert load_records(Config, path) == []
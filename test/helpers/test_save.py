@@ -76,3 +76,116 @@ def test_save_toml(tmpdir: Path):
 
     _hparams = HyperParameters.load(tmp_path)
     assert hparams == _hparams
+
+
+@pytest.mark.parametrize("suffix", [".json", pytest.param(".yaml", marks=needs_yaml)])
+def test_save_numpy_arrays_in_sidecar_files(tmp_path: Path, suffix: str):
+    np = pytest.importorskip("numpy")
+    from dataclasses import dataclass, field
+
+    from simple_parsing.helpers.serialization import Serializable, save
+
+    @dataclass
+    class Stats(Serializable):
+        mean: np.ndarray = field(default_factory=lambda: np.zeros(3))
+
+    @dataclass
+    class Config(Serializable):
+        weights: np.ndarray = field(default_factory=lambda: np.arange(6).reshape(2, 3))
+        stats: Stats = field(default_factory=Stats)
+        name: str = "bob"
+
+    config = Config(stats=Stats(mean=np.array([0.5, 1.5, 2.5])))
+    path = tmp_path / f"config{suffix}"
+    config.save(path)
+    array_files = sorted(p.name for p in (tmp_path / f"config{suffix}.arrays").glob("*.npy"))
+    assert [name.split(".")[:-2] for name in array_files] == [["stats", "mean"], ["weights"]]
+
+    loaded = Config.load(path)
+    assert loaded.name == "bob"
+    # The arrays are memory-mapped, rather than read into memory.
+    assert isinstance(loaded.weights, np.memmap)
+    assert isinstance(loaded.stats.mean, np.memmap)
+    np.testing.assert_array_equal(loaded.weights, config.weights)
+    np.testing.assert_array_equal(loaded.stats.mean, config.stats.mean)
+
+    # Arrays that aren't used anymore are removed when saving again.
+    del loaded
+    save({"name": "bob"}, path)
+    assert not (tmp_path / f"config{suffix}.arrays").exists()
+
+
+def test_numpy_arrays_are_saved_without_copies(tmp_path: Path):
+    np = pytest.importorskip("numpy")
+    from dataclasses import dataclass, field
+
+    from simple_parsing.helpers.serialization import save, to_dict
+    from simple_parsing.helpers.serialization.serializable import read_file
+
+    @dataclass
+    class Config:
+        weights: np.ndarray = field(default_factory=lambda: np.arange(6))
+        extra: dict = field(default_factory=lambda: {"_array_": "weights.npy"})
+
+    config = Config()
+    assert to_dict(config)["weights"] is config.weights
+
+    path = tmp_path / "config.json"
+    save(config, path)
+    d = read_file(path)
+    np.testing.assert_array_equal(d["weights"], config.weights)
+    # Dicts that look like array references (of other formats) are left alone.
+    assert d["extra"] == {"_array_": "weights.npy"}
+
+
+def test_concurrent_saves_with_numpy_arrays(tmp_path: Path):
+    """Readers always see a file along with its own arrays, even when it is being replaced."""
+    np = pytest.importorskip("numpy")
+    import threading
+
+    from simple_parsing.helpers.serialization import save
+    from simple_parsing.helpers.serialization.serializable import read_file
+
+    path = tmp_path / "config.json"
+    save({"i": 0, "values": np.zeros(100)}, path)
+    stop = threading.Event()
+    errors: list = []
+
+    def read_continuously():
+        while not stop.is_set():
+            try:
+                d = read_file(path)
+                np.testing.assert_array_equal(d["values"], np.full(100, d["i"]))
+            except Exception as e:
+                errors.append(e)
+
+    def write(worker: int):
+        for i in range(worker, 200, 4):
+            save({"i": i, "values": np.full(100, i)}, path)
+
+    reader = threading.Thread(target=read_continuously)
+    reader.start()
+    writers = [threading.Thread(target=write, args=(worker,)) for worker in range(4)]
+    try:
+        for writer in writers:
+            writer.start()
+        for writer in writers:
+            writer.join()
+    finally:
+        stop.set()
+        reader.join()
+    assert not errors
+    # Only the arrays of the last version of the file are left.
+    assert len(list((tmp_path / "config.json.arrays").glob("*.npy"))) == 1
+
+
+def test_errors_while_saving_numpy_arrays_are_raised(tmp_path: Path, monkeypatch):
+    np = pytest.importorskip("numpy")
+    from simple_parsing.helpers.serialization import save
+
+    def _save(*args, **kwargs):
+        raise FileNotFoundError("bob")
+
+    monkeypatch.setattr(np, "save", _save)
+    with pytest.raises(FileNotFoundError, match="bob"):
+        save({"values": np.zeros(3)}, tmp_path / "config.json")
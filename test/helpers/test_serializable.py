@@ -45,7 +45,7 @@ def frozen(request, monkeypatch):
     # NOTE: Need to unregister all the subclasses of SerializableMixin and FrozenSerializable, so
     # the dataclasses from one test aren't used in another.
     subclasses_before = SerializableMixin.subclasses.copy()
-    from simple_parsing.helpers.serialization.decoding import _decoding_fns
+    from simple_parsing.helpers.serialization.decoding import _decoding_fns, _field_decoding_fns
 
     frozen = request.param
     decoding_fns_before = _decoding_fns.copy()
@@ -60,6 +60,7 @@ def frozen(request, monkeypatch):
     # Unregister the decoding functions.
     _decoding_fns.clear()
     _decoding_fns.update(decoding_fns_before)
+    _field_decoding_fns.clear()
 
     # Clear the LRU cache of `get_decoding_fn`.
     # get_decoding_fn.cache_clear()
@@ -243,6 +244,19 @@ def test_decode_right_subclass(silent, Container, Base, A, B):
     assert c == parsed_val
 
 
+def test_new_subclasses_are_used_when_decoding(silent, Container, Base, A):
+    """The subclasses of a class are cached, and are updated when a new subclass is created."""
+    assert Container.from_dict({"items": [{"name": "A", "age": 1}]}) == Container(items=[A(age=1)])
+
+    @dataclass(frozen=issubclass(Base, FrozenSerializable))
+    class C(Base):
+        name: str = "C"
+        favorite_food: str = "pizza"
+
+    c = Container(items=[A(), C(favorite_food="pasta")])
+    assert Container.loads(c.dumps()) == c
+
+
 def test_forward_ref_dict(silent, frozen: bool):
     @dataclass(frozen=frozen)
     class LossWithDict(FrozenSerializable if frozen else Serializable):
@@ -1,6 +1,7 @@
 import json
 import textwrap
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 from test.testutils import Generic, TypeVar
 from typing import Any, Dict, List, Optional, Tuple, Type, Union
@@ -322,3 +323,52 @@ def test_issue_227_unsafe_int_casting_on_load(
         obj = loads_json(class_to_use, json.dumps(serialized_dict))
         assert obj == expected_result
     assert len(record.list) == 1
+
+
+@dataclass
+class ClassWithNestedInts:
+    inner: ClassWithInt = field(default_factory=ClassWithInt)
+    values: List[int] = field(default_factory=list)
+
+
+def test_unsafe_casting_warnings_when_decoding_from_threads():
+    """Each unsafe cast gives exactly one warning, even when decoding from several threads."""
+    import warnings
+    from concurrent.futures import ThreadPoolExecutor
+
+    from simple_parsing.helpers.serialization import from_dict
+
+    safe = {"inner": {"a": 1}, "values": [1, 2, 3]}
+    unsafe = {"inner": {"a": 1.5}, "values": [1, 2, 3]}
+    dicts = [unsafe if i % 10 == 0 else safe for i in range(1000)]
+
+    with warnings.catch_warnings(record=True) as record:
+        warnings.simplefilter("always")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(partial(from_dict, ClassWithNestedInts), dicts))
+
+    assert results == [
+        ClassWithNestedInts(inner=ClassWithInt(a=int(d["inner"]["a"])), values=[1, 2, 3])
+        for d in dicts
+    ]
+    messages = [str(w.message) for w in record]
+    assert len(messages) == 100
+    assert all("field 'a' of type <class 'int'>: raw value: 1.5" in m for m in messages)
+
+
+def test_registering_decoding_fn_after_decoding():
+    """The decoding functions of the fields are cached, but registering a new one updates them."""
+    from simple_parsing.helpers.serialization import from_dict
+
+    class Celsius(float):
+        pass
+
+    @dataclass
+    class Weather:
+        temperature: Celsius = Celsius(20.0)
+
+    with pytest.warns(UserWarning, match="Unable to find a decoding function"):
+        assert type(from_dict(Weather, {"temperature": 21.5}).temperature) is Celsius
+
+    register_decoding_fn(Celsius, lambda v: Celsius(float(v.rstrip("C"))))
+    assert from_dict(Weather, {"temperature": "22.5C"}) == Weather(Celsius(22.5))
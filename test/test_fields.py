@@ -80,3 +80,52 @@ def test_generated_options_from_annotation(annotation: Type, expected_options: D
     # actual_options = get_argparse_options_for_annotation(annotation)
     # for option, expected_value in expected_options.items():
     #     assert actual_options[option] == expected_value
+
+
+def test_field_specs_are_shared_between_wrappers():
+    """The position-independent info about a field is computed once and shared."""
+    from simple_parsing.wrappers import DataclassWrapper
+
+    @dataclass
+    class A:
+        a: int = 1  # some help
+
+    first = DataclassWrapper(A, "first")
+    second = DataclassWrapper(A, "second", prefix="second.")
+    assert first.fields[0].spec is second.fields[0].spec
+    assert first.fields[0].help == "some help"
+    assert first.fields[0].dest == "first.a"
+    assert second.fields[0].dest == "second.a"
+    # The wrappers don't have a `__dict__`, to save memory.
+    assert not hasattr(first, "__dict__")
+    assert not hasattr(first.fields[0], "__dict__")
+
+
+def test_cached_dest_and_option_strings_are_invalidated():
+    from simple_parsing.wrappers import DataclassWrapper
+
+    @dataclass
+    class Inner:
+        some_value: int = 1
+
+    @dataclass
+    class Outer:
+        inner: Inner = field(default_factory=Inner)
+
+    wrapper = DataclassWrapper(Outer, "outer")
+    inner_wrapper = next(wrapper.descendants)
+    field_wrapper = inner_wrapper.fields[0]
+    assert field_wrapper.dest == "outer.inner.some_value"
+    assert field_wrapper.option_strings == ["--some_value"]
+
+    # Changing the prefix (e.g. during conflict resolution) changes the option strings.
+    field_wrapper.prefix = "inner."
+    assert field_wrapper.option_strings == ["--inner.some_value"]
+
+    # Renaming or moving a wrapper changes the dest of all the wrappers below it.
+    wrapper.name = "config"
+    assert inner_wrapper.dest == "config.inner"
+    assert field_wrapper.dest == "config.inner.some_value"
+    inner_wrapper.parent = None
+    assert field_wrapper.dest == "inner.some_value"
+    assert field_wrapper.nesting_level == 1
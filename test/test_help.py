@@ -0,0 +1,133 @@
+"""Tests for the help text caching and the filtered (`--help-search`) help."""
+from __future__ import annotations
+
+import contextlib
+import io
+from dataclasses import dataclass, field
+
+import pytest
+
+from simple_parsing import ArgumentParser, SimpleHelpFormatter
+
+
+@dataclass
+class Optimizer:
+    """Optimizer options."""
+
+    lr: float = 0.001
+    momentum: float = 0.9
+
+
+@dataclass
+class Encoder:
+    """Encoder options."""
+
+    num_layers: int = 4
+    hidden_size: int = 128
+
+
+@dataclass
+class Config:
+    encoder: Encoder = field(default_factory=Encoder)
+    optimizer: Optimizer = field(default_factory=Optimizer)
+    seed: int = 123
+
+
+def _parser(**kwargs) -> ArgumentParser:
+    parser = ArgumentParser(**kwargs)
+    parser.add_arguments(Config, dest="config")
+    return parser
+
+
+def test_help_is_memoized(monkeypatch: pytest.MonkeyPatch):
+    parser = _parser()
+    calls = 0
+    add_argument = SimpleHelpFormatter.add_argument
+
+    def _counting_add_argument(self, action):
+        nonlocal calls
+        calls += 1
+        return add_argument(self, action)
+
+    monkeypatch.setattr(SimpleHelpFormatter, "add_argument", _counting_add_argument)
+
+    f = io.StringIO()
+    parser.print_help(file=f)
+    first_help = f.getvalue()
+    n_calls = calls
+    assert n_calls > 0
+    assert "--lr float" in first_help
+
+    assert parser.format_help() == first_help
+    assert calls == n_calls
+
+
+def test_set_defaults_invalidates_help_cache():
+    parser = _parser()
+    parser.add_argument("--foo", type=int, default=1, help="foo")
+    parser.print_help(file=io.StringIO())
+    assert "foo (default: 1)" in parser.format_help()
+    parser.set_defaults(foo=2)
+    assert "foo (default: 2)" in parser.format_help()
+
+
+def test_changing_description_epilog_or_usage_invalidates_help_cache():
+    parser = _parser()
+    parser.print_help(file=io.StringIO())
+    parser.description = "Some description."
+    parser.epilog = "Some epilog."
+    assert "Some description." in parser.format_help()
+    assert "Some epilog." in parser.format_help()
+    parser.usage = "some usage"
+    assert parser.format_help().startswith("usage: some usage")
+
+
+def test_adding_arguments_invalidates_help_cache():
+    parser = _parser()
+    parser.print_help(file=io.StringIO())
+    assert "--bar" not in parser.format_help()
+    group = parser.add_argument_group("extra")
+    group.add_argument("--bar", type=int, default=1)
+    assert "--bar" in parser.format_help()
+
+
+@pytest.mark.parametrize(
+    "help_filter, expected, not_expected",
+    [
+        ("config.encoder", ["--num_layers"], ["--lr", "--seed"]),
+        ("encoder", ["--num_layers"], ["--lr", "--seed"]),
+        ("optimizer", ["--lr", "--momentum"], ["--num_layers", "--seed"]),
+        ("MOMENTUM", ["--lr", "--momentum"], ["--num_layers", "--seed"]),
+        ("config", ["--lr", "--num_layers", "--seed"], []),
+    ],
+)
+def test_filtered_help(help_filter: str, expected: list[str], not_expected: list[str]):
+    parser = _parser()
+    f = io.StringIO()
+    parser.print_help(file=f, help_filter=help_filter)
+    help_text = f.getvalue()
+    for option in expected:
+        assert option in help_text
+    for option in not_expected:
+        assert option not in help_text
+
+
+def test_filtered_help_no_match():
+    parser = _parser()
+    f = io.StringIO()
+    parser.print_help(file=f, help_filter="bob")
+    assert "No argument group matches 'bob'." in f.getvalue()
+
+
+def test_help_search_arg():
+    parser = _parser(add_help_search_arg=True)
+    f = io.StringIO()
+    with contextlib.suppress(SystemExit), contextlib.redirect_stdout(f):
+        parser.parse_args(["--help-search", "optimizer"])
+    help_text = f.getvalue()
+    assert "--momentum" in help_text
+    assert "--num_layers" not in help_text
+
+
+def test_no_help_search_arg_by_default():
+    assert "--help-search" not in _parser().format_help()
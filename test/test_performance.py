@@ -1,8 +1,25 @@
+"""Benchmarks of parsing, serialization, sampling and import time.
+
+Most benchmarks use configs generated with `make_config`, with a given `ConfigShape`: the number
+of fields, the depth of nesting, the number of subgroup choices at each level, and the fraction
+of fields with a Union type. The widths that are benchmarked can be set with the
+`SIMPLE_PARSING_BENCHMARK_WIDTHS` environment variable, e.g. `10,100,1000,5000`.
+
+The results are saved by pytest-benchmark (see `--benchmark-autosave` in pytest.ini), and can be
+written as json with `--benchmark-json=results.json`. The shape of the config of each benchmark is
+in its `extra_info`. To check for regressions against the last saved run:
+
+    pytest test/test_performance.py --benchmark-only --benchmark-compare \\
+        --benchmark-compare-fail=median:10%
+"""
+import dataclasses
 import functools
-import importlib
+import os
+import re
+import subprocess
 import sys
 from pathlib import Path
-from typing import Callable, TypeVar
+from typing import Callable, List, Optional, TypeVar, Union
 
 import pytest
 from pytest_benchmark.fixture import BenchmarkFixture
@@ -11,20 +28,9 @@ from .testutils import needs_yaml
 
 C = TypeVar("C", bound=Callable)
 
-
-def import_sp():
-    assert "simple_parsing" not in sys.modules
-    __import__("simple_parsing")
-
-
-def unimport_sp():
-    if "simple_parsing" in sys.modules:
-        import simple_parsing  # noqa
-
-        del simple_parsing
-        importlib.invalidate_caches()
-        sys.modules.pop("simple_parsing")
-    assert "simple_parsing" not in sys.modules
+BENCHMARK_WIDTHS = [
+    int(width) for width in os.environ.get("SIMPLE_PARSING_BENCHMARK_WIDTHS", "10,1000").split(",")
+]
 
 
 def clear_lru_caches():
@@ -44,12 +50,124 @@ def call_before(before: Callable[[], None], fn: C) -> C:
     return wrapped  # type: ignore
 
 
-@pytest.mark.benchmark(
-    group="import",
-)
-def test_import_performance(benchmark: BenchmarkFixture):
-    # NOTE: Issue is that the `conftest.py` actually already imports simple-parsing!
-    benchmark(call_before(unimport_sp, import_sp))
+@dataclasses.dataclass(frozen=True)
+class ConfigShape:
+    """The shape of a generated config (see `make_config`)."""
+
+    width: int = 10
+    """The total number of fields with a value (excluding those in subgroups)."""
+
+    depth: int = 0
+    """The number of levels of nested dataclasses below the root."""
+
+    fan_out: int = 0
+    """The number of choices of the subgroup at each level (no subgroups when 0)."""
+
+    union_density: float = 0.0
+    """The fraction of the fields that have a Union type."""
+
+    def __str__(self) -> str:
+        return f"w{self.width}-d{self.depth}-f{self.fan_out}-u{self.union_density}"
+
+
+_LEAF_TYPES = [
+    (int, 1),
+    (float, 0.5),
+    (str, "foo"),
+    (bool, False),
+    (List[int], (1, 2, 3)),
+]
+
+
+@functools.lru_cache(maxsize=None)
+def make_config(shape: ConfigShape) -> type:
+    """Generates a dataclass with the given shape.
+
+    The fields are spread evenly over the levels, and all have different names, so there are no
+    conflicts between them. The classes are added to this module, so they can be pickled.
+    """
+    from simple_parsing import field, subgroups
+
+    num_levels = shape.depth + 1
+    child: Optional[type] = None
+    for level in reversed(range(num_levels)):
+        width = shape.width // num_levels + (shape.width % num_levels if level == 0 else 0)
+        fields = []
+        for i in range(width):
+            field_type, default = _LEAF_TYPES[i % len(_LEAF_TYPES)]
+            if int((i + 1) * shape.union_density) > int(i * shape.union_density):
+                field_type, default = Union[int, str], 0
+            kwargs = {"help": f"Field {i} of level {level}."}
+            if isinstance(default, tuple):
+                kwargs["default_factory"] = functools.partial(list, default)
+            else:
+                kwargs["default"] = default
+            fields.append((f"f{level}_{i}", field_type, field(**kwargs)))
+        if shape.fan_out:
+            options = {
+                f"option_{i}": _make_class(
+                    f"Option_{level}_{i}", [(f"option_{level}_{i}", int, field(default=i))], shape
+                )
+                for i in range(shape.fan_out)
+            }
+            default = next(iter(options))
+            fields.append(
+                (
+                    f"choice_{level}",
+                    Union[tuple(options.values())],
+                    subgroups(options, default=default),
+                )
+            )
+        if child is not None:
+            fields.append((f"child_{level}", child, field(default_factory=child)))
+        child = _make_class(f"Level_{level}", fields, shape)
+    assert child is not None
+    return child
+
+
+def _make_class(name: str, fields: list, shape: ConfigShape) -> type:
+    name = re.sub(r"\W", "_", f"{name}_{shape}")
+    cls = dataclasses.make_dataclass(name, fields)
+    cls.__module__ = __name__
+    globals()[name] = cls
+    return cls
+
+
+def int_fields(cls: type, prefix: str = "") -> List[str]:
+    """Returns the (dotted) names of the int fields of a generated config, excluding subgroups."""
+    names = []
+    for f in dataclasses.fields(cls):
+        if f.type is int:
+            names.append(prefix + f.name)
+        elif dataclasses.is_dataclass(f.type):
+            names.extend(int_fields(f.type, prefix + f.name + "."))
+    return names
+
+
+def make_hparams(width: int) -> type:
+    """Generates a HyperParameters class with `width` fields, with different kinds of priors."""
+    from simple_parsing.helpers.hparams import HyperParameters, categorical, log_uniform, uniform
+
+    priors = [
+        (float, lambda: uniform(0.0, 1.0, default=0.5)),
+        (float, lambda: log_uniform(1e-4, 1.0, default=1e-3)),
+        (int, lambda: uniform(1, 10, discrete=True, default=5)),
+        (str, lambda: categorical("a", "b", "c", default="a")),
+    ]
+    fields = [
+        (f"h{i}", priors[i % len(priors)][0], priors[i % len(priors)][1]()) for i in range(width)
+    ]
+    return dataclasses.make_dataclass(f"HParams_{width}", fields, bases=(HyperParameters,))
+
+
+SHAPES = [
+    shape
+    for width in BENCHMARK_WIDTHS
+    for shape in [
+        ConfigShape(width),
+        ConfigShape(width, depth=3, fan_out=3, union_density=0.2),
+    ]
+]
 
 
 @pytest.mark.benchmark(
@@ -88,3 +206,278 @@ def test_serialization_performance(benchmark: BenchmarkFixture, tmp_path: Path,
         assert load(TrainingArguments, path) == args
 
     benchmark(save_and_load)
+
+
+@pytest.mark.benchmark(
+    group="wrappers",
+)
+def test_wrapper_memory(benchmark: BenchmarkFixture):
+    """Creates the wrappers for many fields, and reports the memory used by them."""
+    import dataclasses
+    import tracemalloc
+
+    from simple_parsing.wrappers import DataclassWrapper
+
+    Config = dataclasses.make_dataclass(
+        "Config", [(f"field_{i}", int, dataclasses.field(default=i)) for i in range(100)]
+    )
+
+    def create_wrappers():
+        return [DataclassWrapper(Config, f"config_{i}") for i in range(100)]
+
+    wrappers = benchmark(create_wrappers)
+    tracemalloc.start()
+    wrappers = create_wrappers()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    benchmark.extra_info["num_fields"] = sum(len(w.fields) for w in wrappers)
+    benchmark.extra_info["memory_bytes"] = memory
+
+
+@pytest.mark.benchmark(
+    group="load_all",
+)
+@pytest.mark.parametrize("backend, workers", [("sequential", 1), ("thread", 4), ("process", 4)])
+def test_load_all_performance(
+    benchmark: BenchmarkFixture, tmp_path: Path, backend: str, workers: int
+):
+    """Loads a generated corpus of yaml config files with `load_all`."""
+    pytest.importorskip("yaml")
+    from test.test_huggingface_compat import TrainingArguments
+
+    from simple_parsing.helpers.serialization import load_all, save
+
+    paths = [tmp_path / f"config_{i}.yaml" for i in range(100)]
+    for i, path in enumerate(paths):
+        save(TrainingArguments(output_dir=f"run_{i}", seed=i), path)
+
+    results = benchmark(
+        load_all,
+        TrainingArguments,
+        paths,
+        workers=workers,
+        backend="thread" if backend == "sequential" else backend,
+    )
+    assert [r.seed for r in results] == list(range(len(paths)))
+    benchmark.extra_info["num_files"] = len(paths)
+
+
+@pytest.mark.benchmark(
+    group="serialization",
+)
+def test_decode_into_subclasses_performance(benchmark: BenchmarkFixture):
+    """Decodes a list of instances of the deepest class in a deep hierarchy of subclasses."""
+    import dataclasses
+    from typing import List
+
+    from simple_parsing.helpers.serialization import Serializable, from_dict
+
+    @dataclasses.dataclass
+    class Base(Serializable, decode_into_subclasses=True):
+        f0: int = 0
+
+    deepest = Base
+    for depth in range(1, 30):
+        parent = deepest
+        for branch in range(3):
+            deepest = dataclasses.make_dataclass(
+                f"Child_{depth}_{branch}",
+                [(f"f{depth}_{branch}", int, dataclasses.field(default=depth))],
+                bases=(parent,),
+            )
+
+    @dataclasses.dataclass
+    class Holder(Serializable):
+        items: List[Base] = dataclasses.field(default_factory=list)
+
+    d = {"items": [deepest().to_dict()] * 100}
+    holder = benchmark(from_dict, Holder, d)
+    assert all(type(item) is deepest for item in holder.items)
+
+
+def _shape_info(benchmark: BenchmarkFixture, shape: ConfigShape) -> None:
+    benchmark.extra_info.update(dataclasses.asdict(shape))
+
+
+def _make_parser(shape: ConfigShape, **kwargs):
+    from simple_parsing import ArgumentParser
+
+    parser = ArgumentParser(**kwargs)
+    parser.add_arguments(make_config(shape), dest="config")
+    return parser
+
+
+def _parse_args(shape: ConfigShape) -> List[str]:
+    args = []
+    for name in int_fields(make_config(shape)):
+        args += [f"--{name.rpartition('.')[-1]}", "2"]
+    if shape.fan_out:
+        args += ["--choice_0", f"option_{shape.fan_out - 1}"]
+    return args
+
+
+@pytest.mark.benchmark(group="import")
+def test_import_performance(benchmark: BenchmarkFixture):
+    """Imports simple_parsing in a new interpreter (the tests have already imported it)."""
+
+    def import_sp() -> str:
+        return subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import simple_parsing"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stderr
+
+    output = benchmark.pedantic(import_sp, rounds=5, iterations=1)
+    # The last line of `-X importtime` is for the top-level package: "self | cumulative | name".
+    cumulative_us = int(output.strip().splitlines()[-1].split("|")[1])
+    benchmark.extra_info["import_time_us"] = cumulative_us
+
+
+@pytest.mark.benchmark(group="parser_construction")
+@pytest.mark.parametrize("shape", SHAPES, ids=str)
+def test_parser_construction_performance(benchmark: BenchmarkFixture, shape: ConfigShape):
+    """Creates a parser and adds all the arguments of the config (without parsing any)."""
+    _shape_info(benchmark, shape)
+
+    def construct():
+        clear_lru_caches()
+        parser = _make_parser(shape)
+        parser._preprocessing()
+        return parser
+
+    benchmark(construct)
+
+
+@pytest.mark.benchmark(group="parse_args")
+@pytest.mark.parametrize("shape", SHAPES, ids=str)
+def test_parse_args_performance(benchmark: BenchmarkFixture, shape: ConfigShape):
+    _shape_info(benchmark, shape)
+    args = _parse_args(shape)
+
+    def parse():
+        clear_lru_caches()
+        return _make_parser(shape).parse_args(args).config
+
+    config = benchmark(parse)
+    for name in int_fields(make_config(shape)):
+        value = config
+        for attribute in name.split("."):
+            value = getattr(value, attribute)
+        assert value == 2
+    if shape.fan_out:
+        assert type(config.choice_0).__name__.startswith(f"Option_0_{shape.fan_out - 1}_")
+
+
+@pytest.mark.benchmark(group="help")
+@pytest.mark.parametrize("shape", SHAPES, ids=str)
+def test_help_performance(benchmark: BenchmarkFixture, shape: ConfigShape):
+    """Formats the `--help` of a parser whose arguments were already added."""
+    _shape_info(benchmark, shape)
+
+    def setup():
+        parser = _make_parser(shape)
+        parser._preprocessing()
+        return (parser,), {}
+
+    help_text = benchmark.pedantic(
+        lambda parser: parser.format_help(), setup=setup, rounds=5, iterations=1
+    )
+    assert f"Field 0 of level {shape.depth}." in help_text
+
+
+_NUM_CONFLICTS = 40
+
+
+@pytest.mark.benchmark(group="conflicts")
+@pytest.mark.parametrize("conflict_resolution", ["AUTO", "EXPLICIT"])
+@pytest.mark.parametrize("shape", SHAPES, ids=str)
+def test_conflict_resolution_performance(
+    benchmark: BenchmarkFixture, shape: ConfigShape, conflict_resolution: str
+):
+    """Adds a config with some of the same fields as the generated config, and parses them."""
+    from simple_parsing import ConflictResolution
+
+    _shape_info(benchmark, shape)
+    # NOTE: The conflicts are resolved one field at a time, up to `ConflictResolver.max_attempts`.
+    conflicting_fields = [
+        (f.name, f.type, f) for f in dataclasses.fields(make_config(shape))[:_NUM_CONFLICTS]
+    ]
+    other_cls = dataclasses.make_dataclass("Other", conflicting_fields)
+    benchmark.extra_info["num_conflicts"] = len(conflicting_fields)
+
+    def resolve_conflicts():
+        clear_lru_caches()
+        parser = _make_parser(
+            shape, conflict_resolution=getattr(ConflictResolution, conflict_resolution)
+        )
+        parser.add_arguments(other_cls, dest="other")
+        return parser.parse_args([])
+
+    args = benchmark(resolve_conflicts)
+    assert args.config == make_config(shape)()
+    assert args.other == other_cls()
+
+
+@pytest.mark.benchmark(group="to_dict")
+@pytest.mark.parametrize("shape", SHAPES, ids=str)
+def test_to_dict_performance(benchmark: BenchmarkFixture, shape: ConfigShape):
+    from simple_parsing.helpers.serialization import to_dict
+
+    _shape_info(benchmark, shape)
+    benchmark(to_dict, make_config(shape)())
+
+
+@pytest.mark.benchmark(group="from_dict")
+@pytest.mark.parametrize("shape", SHAPES, ids=str)
+def test_from_dict_performance(benchmark: BenchmarkFixture, shape: ConfigShape):
+    from simple_parsing.helpers.serialization import from_dict, to_dict
+
+    _shape_info(benchmark, shape)
+    cls = make_config(shape)
+    config = benchmark(from_dict, cls, to_dict(cls()))
+    assert config == cls()
+
+
+@pytest.mark.benchmark(group="save_load")
+@pytest.mark.parametrize("filetype", [pytest.param(".yaml", marks=needs_yaml), ".json", ".pkl"])
+@pytest.mark.parametrize("shape", SHAPES, ids=str)
+def test_save_load_performance(
+    benchmark: BenchmarkFixture, tmp_path: Path, shape: ConfigShape, filetype: str
+):
+    from simple_parsing.helpers.serialization import load, save
+
+    _shape_info(benchmark, shape)
+    benchmark.extra_info["filetype"] = filetype
+    cls = make_config(shape)
+    config = cls()
+    path = (tmp_path / "config").with_suffix(filetype)
+
+    def save_and_load():
+        save(config, path)
+        return load(cls, path)
+
+    assert benchmark(save_and_load) == config
+
+
+@pytest.mark.benchmark(group="replace")
+@pytest.mark.parametrize("shape", SHAPES, ids=str)
+def test_replace_performance(benchmark: BenchmarkFixture, shape: ConfigShape):
+    """Replaces the values of all the int fields (at all levels) with flattened keys."""
+    import simple_parsing as sp
+
+    _shape_info(benchmark, shape)
+    config = make_config(shape)()
+    changes = {name: 2 for name in int_fields(type(config))}
+    new_config = benchmark(sp.replace, config, changes)
+    assert new_config != config
+
+
+@pytest.mark.benchmark(group="hparams_sample")
+@pytest.mark.parametrize("width", BENCHMARK_WIDTHS)
+def test_hparams_sample_performance(benchmark: BenchmarkFixture, width: int):
+    pytest.importorskip("numpy")
+    benchmark.extra_info["width"] = width
+    cls = make_hparams(width)
+    sample = benchmark(cls.sample)
+    assert isinstance(sample, cls)
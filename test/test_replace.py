@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 
 import pytest
 
-from simple_parsing import replace
+from simple_parsing import replace, replace_many
 from simple_parsing.utils import Dataclass, DataclassT
 
 logger = logging.getLogger(__name__)
@@ -234,3 +234,48 @@ def test_replace_invalid(
             replace(start, **changes)
         else:
             replace(start, changes)
+
+
+def test_replace_many():
+    start = Level3()
+    changes_list = [
+        {},
+        {"name": "level3_greatest"},
+        {"prev.name": "level2_greater", "prev.prev.name": "level1_great"},
+        {"prev.prev": {"name": "level1_great"}},
+        {"prev.prev.level": 123},
+    ]
+    variants = replace_many(start, changes_list)
+    assert variants == [replace(start, changes) for changes in changes_list]
+
+    # Untouched values are shared with the base object, but each variant is a new object.
+    assert variants[0] is not start
+    assert variants[0].prev is start.prev
+    assert variants[1].prev is start.prev
+    assert variants[4].prev is not start.prev
+    assert variants[4].prev.prev is not start.prev.prev
+    assert variants[4].prev.name is start.prev.name
+    assert start == Level3()
+
+
+def test_replace_many_reruns_post_init():
+    variants = replace_many(OuterPostInit(), [{"out_arg": 2}, {"inner.for_outer_post": "bar"}])
+    assert variants[0].out_arg_post == "2"
+    assert variants[1].arg_post_on_inner == "bar_outer"
+    assert variants[1].inner == InnerPostInit(for_outer_post="bar")
+
+
+@pytest.mark.parametrize(
+    ("start", "changes", "exception_type", "match"),
+    [
+        (A(a=123), {"not_a_field": 456}, TypeError, "unexpected keyword argument"),
+        (OuterPostInit(), {"out_arg_post": "bob"}, ValueError, "non-init field"),
+        (WithOptional(optional_a=None), {"optional_a.a": 123}, ValueError, "isn't a dataclass"),
+        (Level2(), {"prev": Level1(), "prev.name": "bob"}, ValueError, "Conflicting changes"),
+    ],
+)
+def test_replace_many_invalid(
+    start: Dataclass, changes: dict, exception_type: type[Exception], match: str
+):
+    with pytest.raises(exception_type, match=match):
+        replace_many(start, [changes])
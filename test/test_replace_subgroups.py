@@ -53,3 +53,10 @@ def test_replace_subgroups():
     assert replace_subgroups(c, {"nested_subgroup": {"a_or_b": "b"}}) == Config(
         nested_subgroup=AorB(a_or_b=B())
     )
+
+
+def test_replace_subgroups_shares_frozen_instances():
+    c = Config()
+    assert replace_subgroups(c, {"frozen_subgroup": even}).frozen_subgroup is even
+    a = A(a=1.0)
+    assert replace_subgroups(c, {"subgroup": a}).subgroup is not a
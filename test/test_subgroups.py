@@ -935,3 +935,54 @@ def test_ordering_of_args_doesnt_matter():
         model=ModelAConfig(lr=0.0003, optimizer="Adam", betas=(0.0, 1.0)),
         dataset=Dataset2Config(data_dir="data/bar", bar=1.2),
     )
+
+
+def test_subgroup_wrappers_are_reused(monkeypatch: pytest.MonkeyPatch):
+    """The wrappers for the chosen subgroups are created once, and copied in later parses."""
+    from simple_parsing.wrappers import DataclassWrapper
+
+    @dataclass
+    class Foo:
+        values: list[int] = field(default_factory=[1, 2].copy)
+
+    @dataclass
+    class Config:
+        first: Foo | B = subgroups({"foo": Foo, "b": B}, default="foo")
+        second: Foo | B = subgroups({"foo": Foo, "b": B}, default="b")
+
+    assert parse(Config, args="--first b --second foo --values 3") == Config(
+        first=B(), second=Foo(values=[3])
+    )
+
+    created: list[type] = []
+    init = DataclassWrapper.__init__
+
+    def _init(self, dataclass, *args, **kwargs):
+        created.append(dataclass)
+        init(self, dataclass, *args, **kwargs)
+
+    monkeypatch.setattr(DataclassWrapper, "__init__", _init)
+    assert parse(Config, args="--second foo --second.values 4 5") == Config(
+        first=Foo(), second=Foo(values=[4, 5])
+    )
+    assert parse(Config, args="--second b --b bob") == Config(first=Foo(), second=B(b="bob"))
+    assert created == [Config, Config]
+
+
+def test_subgroup_wrapper_templates_follow_changes_to_defaults():
+    """The cached wrappers are looked up by the value of the default, not by its id."""
+
+    @dataclass
+    class Foo:
+        x: int = 1
+
+    foo = Foo(x=1)
+
+    @dataclass
+    class Config:
+        choice: Foo = subgroups({"foo": foo}, default="foo")
+
+    assert parse(Config, args="") == Config(choice=Foo(x=1))
+    foo.x = 2
+    assert parse(Config, args="") == Config(choice=Foo(x=2))
+    assert parse(Config, args="--x 3") == Config(choice=Foo(x=3))
@@ -318,3 +318,25 @@ if __name__ == "__main__":
     print(prog)
     print(prog.execute())
     exit()
+
+
+def test_subparsers_are_created_lazily(monkeypatch: pytest.MonkeyPatch):
+    """Only the parser of the chosen subcommand is created."""
+    created: list = []
+    add_arguments = ArgumentParser.add_arguments
+
+    def _add_arguments(self, dataclass, dest, **kwargs):
+        created.append(dataclass)
+        return add_arguments(self, dataclass, dest, **kwargs)
+
+    monkeypatch.setattr(ArgumentParser, "add_arguments", _add_arguments)
+    parser = ArgumentParser()
+    parser.add_arguments(GlobalOptions, dest="options")
+    args = parser.parse_args("valid --metric bob".split())
+    assert args.options.mode == ValidOptions(metric="bob")
+    assert created == [GlobalOptions, ValidOptions]
+    assert "{train,valid}" in parser.format_help()
+    # The subparser is created with `add_parser`, like the others would be.
+    (subparsers,) = (a for a in parser._actions if isinstance(a, argparse._SubParsersAction))
+    assert subparsers.choices["valid"].prog.endswith(" valid")
+    assert created == [GlobalOptions, ValidOptions]
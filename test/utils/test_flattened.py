@@ -216,3 +216,83 @@ def test_setitem_ambiguous():
     c = Config()
     with raises(AttributeError, match="Ambiguous"):
         c["type"] = "value"
+
+
+def test_get_many_set_many():
+    c = Config()
+    c.set_many({"batch_size": 64, "summary.sample_grid": (3, 3), "model_name": "bob"})
+    assert c.get_many("batch_size", "sample_grid", "model.model_name") == (64, (3, 3), "bob")
+
+
+@dataclass
+class Bar:
+    x: int = 1
+
+
+@dataclass
+class OtherBar:
+    y: int = 2
+
+
+@dataclass
+class Foo(FlattenedAccess):
+    bar: Any = field(default_factory=Bar)
+
+
+def test_lookup_with_different_nested_types():
+    """The index is built once per class, but must still work when nested values differ."""
+    assert Foo().x == 1
+    foo = Foo(bar=OtherBar())
+    assert foo.y == 2
+    with raises(AttributeError):
+        _ = foo.x
+    foo.y = 3
+    assert foo.bar.y == 3
+    assert Foo().x == 1
+
+
+@dataclass
+class FooWithTwoFields(FlattenedAccess):
+    bar: Any = field(default_factory=lambda: Bar(x=1))
+    baz: Any = field(default_factory=OtherBar)
+
+
+def test_lookup_detects_ambiguity_in_other_instances():
+    """An attribute that is unique in one instance can be ambiguous in another of the same class."""
+    assert FooWithTwoFields().x == 1
+    foo = FooWithTwoFields(baz=Bar(x=5))
+    with raises(AttributeError, match="Ambiguous"):
+        _ = foo.x
+    with raises(AttributeError, match="Ambiguous"):
+        foo.x = 3
+    assert foo.bar.x == 1 and foo.baz.x == 5
+    assert foo.get_many("bar.x", "baz.x") == (1, 5)
+
+
+def test_cached_index_follows_changes_to_nested_dataclasses(monkeypatch: pytest.MonkeyPatch):
+    """The index is cached on each instance, and invalidated when a nested dataclass is replaced."""
+    from simple_parsing.helpers import flatten
+
+    foo = FooWithTwoFields()
+    assert foo.x == 1
+
+    structure_calls = []
+    _structure = flatten._structure
+    monkeypatch.setattr(
+        flatten, "_structure", lambda obj: structure_calls.append(obj) or _structure(obj)
+    )
+    assert foo.x == 1
+    foo.x = 2
+    assert foo.get_many("x", "y") == (2, 2)
+    assert structure_calls == []
+
+    foo.baz = Bar(x=5)
+    with raises(AttributeError, match="Ambiguous"):
+        _ = foo.x
+    foo.bar = OtherBar(y=3)
+    assert foo.get_many("x", "y") == (5, 3)
+    c = Config()
+    c.dataset = Bar(x=4)
+    assert c.x == 4
+    with raises(AttributeError):
+        _ = c.batch_size